@@ -0,0 +1,50 @@
+"""Add partial unique index on active report locks
+
+Revision ID: b3f1c7d2e9a4
+Revises: a8a47ea9362b
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3f1c7d2e9a4"
+down_revision: Union[str, None] = "a8a47ea9362b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recent active lock per report before adding the index
+    op.execute(
+        """
+        UPDATE report_locks SET is_active = false
+        WHERE is_active AND id NOT IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY report_id ORDER BY locked_at DESC, id DESC
+                ) AS rn
+                FROM report_locks
+                WHERE is_active
+            ) ranked
+            WHERE rn = 1
+        )
+        """
+    )
+    op.create_index(
+        "uq_report_locks_active_report",
+        "report_locks",
+        ["report_id"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+        sqlite_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_report_locks_active_report", table_name="report_locks")
@@ -227,7 +227,9 @@ async def calculate_scope1_emissions(
     - SEC compliance features
     """
     calculator = Scope1EmissionsCalculator(db)
-    return await calculator.calculate_scope1_emissions(request, str(current_user.id))
+    return await calculator.calculate_scope1_emissions(
+        request, str(current_user.id), user=current_user
+    )
 
 
 @router.post("/calculate/scope2", response_model=EmissionsCalculationResponse)
@@ -248,7 +250,9 @@ async def calculate_scope2_emissions(
     - Detailed calculation insights
     """
     calculator = Scope2EmissionsCalculator(db)
-    return await calculator.calculate_scope2_emissions(request, str(current_user.id))
+    return await calculator.calculate_scope2_emissions(
+        request, str(current_user.id), user=current_user
+    )
 
 
 @router.get("/calculations", response_model=List[CalculationSummary])
@@ -4,9 +4,11 @@ Handles report locking, comments, and revision tracking for audit and collaborat
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_user
@@ -30,7 +32,7 @@ from app.schemas.report import (
     UnlockReportRequest,
     UpdateReportRequest,
 )
-from app.services.report_lock_service import ReportLockService
+from app.services.report_lock_service import HISTORY_BATCH_SIZE, ReportLockService
 from app.services.report_service import ReportService
 
 router = APIRouter()
@@ -39,6 +41,41 @@ report_lock_service = ReportLockService
 report_service = ReportService
 
 
+def _lock_response(lock: ReportLock) -> LockReportResponse:
+    """Convert a lock row into its API representation"""
+    return LockReportResponse(
+        id=lock.id,
+        report_id=lock.report_id,
+        locked_by=lock.locked_by,
+        locked_by_name=lock.locked_by_user.full_name if lock.locked_by_user else None,
+        lock_reason=lock.lock_reason,
+        locked_at=lock.locked_at.isoformat() if lock.locked_at else None,
+        expires_at=lock.expires_at.isoformat() if lock.expires_at else None,
+        is_active=lock.is_active,
+    )
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Encode a response model in pydantic-core, skipping FastAPI's re-validation"""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _stream_json_array(
+    items: Iterable[BaseModel], prefix: str = "", suffix: str = ""
+) -> Iterator[str]:
+    """Encode models into a JSON array chunk by chunk as rows arrive"""
+    yield prefix + "["
+    separator = ""
+    buffer = []
+    for item in items:
+        buffer.append(separator + item.model_dump_json())
+        separator = ","
+        if len(buffer) >= HISTORY_BATCH_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+    yield "".join(buffer) + "]" + suffix
+
+
 @router.get("/test")
 async def test_endpoint():
     """Test endpoint to verify router is working"""
@@ -82,7 +119,7 @@ async def get_reports(
 
         service = ReportService(db)
         result = service.get_reports(filters, page, page_size, current_user)
-        return result
+        return _json_response(result)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -101,23 +138,7 @@ async def create_report(
         service = ReportService(db)
         report = service.create_report(report_data, current_user)
 
-        return ReportResponse(
-            id=str(report.id),
-            title=report.title,
-            report_type=report.report_type,
-            status=report.status,
-            version=report.version,
-            created_at=report.created_at,
-            updated_at=report.updated_at,
-            completed_at=report.completed_at,
-            workflow_id=str(report.workflow_id) if report.workflow_id else None,
-            created_by=str(report.created_by),
-            updated_by=str(report.updated_by) if report.updated_by else None,
-            content=report.content,
-            report_metadata=report.report_metadata,
-            pdf_path=report.pdf_path,
-            excel_path=report.excel_path,
-        )
+        return ReportResponse.model_validate(report)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -141,23 +162,7 @@ async def get_report(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
             )
 
-        return ReportResponse(
-            id=str(report.id),
-            title=report.title,
-            report_type=report.report_type,
-            status=report.status,
-            version=report.version,
-            created_at=report.created_at,
-            updated_at=report.updated_at,
-            completed_at=report.completed_at,
-            workflow_id=str(report.workflow_id) if report.workflow_id else None,
-            created_by=str(report.created_by),
-            updated_by=str(report.updated_by) if report.updated_by else None,
-            content=report.content,
-            report_metadata=report.report_metadata,
-            pdf_path=report.pdf_path,
-            excel_path=report.excel_path,
-        )
+        return ReportResponse.model_validate(report)
     except HTTPException:
         raise
     except Exception as e:
@@ -184,23 +189,7 @@ async def update_report(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Report not found"
             )
 
-        return ReportResponse(
-            id=str(report.id),
-            title=report.title,
-            report_type=report.report_type,
-            status=report.status,
-            version=report.version,
-            created_at=report.created_at,
-            updated_at=report.updated_at,
-            completed_at=report.completed_at,
-            workflow_id=str(report.workflow_id) if report.workflow_id else None,
-            created_by=str(report.created_by),
-            updated_by=str(report.updated_by) if report.updated_by else None,
-            content=report.content,
-            report_metadata=report.report_metadata,
-            pdf_path=report.pdf_path,
-            excel_path=report.excel_path,
-        )
+        return ReportResponse.model_validate(report)
     except HTTPException:
         raise
     except Exception as e:
@@ -252,15 +241,7 @@ async def lock_report(
             lock_reason=lock_data.lock_reason,
             expires_in_hours=lock_data.expires_in_hours or 24,
         )
-        return LockReportResponse(
-            id=str(lock.id),
-            report_id=str(lock.report_id),
-            locked_by=str(lock.locked_by),
-            lock_reason=lock.lock_reason,
-            locked_at=lock.locked_at.isoformat() if lock.locked_at else None,
-            expires_at=lock.expires_at.isoformat() if lock.expires_at else None,
-            is_active=lock.is_active,
-        )
+        return _lock_response(lock)
     except HTTPException:
         # Re-raise HTTPException as-is to preserve status code
         raise
@@ -320,10 +301,11 @@ async def get_report_lock_status(
         if lock:
             return ReportLockStatus(
                 is_locked=True,
-                locked_by=str(lock.locked_by),
+                locked_by=lock.locked_by,
+                locked_by_name=lock.locked_by_name,
                 lock_reason=lock.lock_reason,
-                locked_at=str(lock.locked_at),
-                expires_at=str(lock.expires_at) if lock.expires_at else None,
+                locked_at=lock.locked_at,
+                expires_at=lock.expires_at,
             )
         else:
             return ReportLockStatus(is_locked=False)
@@ -352,8 +334,11 @@ async def get_report_locks(
             )
 
         service = ReportLockService(db)
-        locks = service.get_report_locks(report_id)
-        return locks
+        locks = service.iter_report_locks(report_id)
+        return StreamingResponse(
+            _stream_json_array(_lock_response(lock) for lock in locks),
+            media_type="application/json",
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -409,7 +394,7 @@ async def get_report_comments(
 
         service = ReportLockService(db)
         comments = service.get_comments(report_id, parent_id)
-        return ReportCommentList(comments=comments)
+        return _json_response(ReportCommentList(comments=comments))
     except HTTPException:
         raise
     except Exception as e:
@@ -483,10 +468,18 @@ async def create_report_revision(
 @router.get("/{report_id}/revisions", response_model=ReportRevisionList)
 async def get_report_revisions(
     report_id: str,
+    before_revision: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=HISTORY_BATCH_SIZE),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
-    """Get revision history for a report"""
+    """
+    Get revision history for a report
+
+    With ``limit`` the history is paginated by keyset: pass the lowest
+    revision_number received as ``before_revision`` to get the next page.
+    Without it the full history is streamed.
+    """
     try:
         # Check if report exists
         report = db.query(Report).filter(Report.id == report_id).first()
@@ -496,8 +489,20 @@ async def get_report_revisions(
             )
 
         service = ReportLockService(db)
-        revisions = service.get_revisions(report_id)
-        return ReportRevisionList(revisions=revisions)
+
+        if limit is not None:
+            revisions = service.get_revisions(report_id, before_revision, limit)
+            return _json_response(ReportRevisionList(revisions=revisions))
+
+        revisions = service.iter_revisions(report_id)
+        return StreamingResponse(
+            _stream_json_array(
+                (RevisionResponse.model_validate(rev) for rev in revisions),
+                prefix='{"revisions":',
+                suffix="}",
+            ),
+            media_type="application/json",
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -210,8 +210,13 @@ class AuditLogger:
         emission_factors_used: Dict[str, Any],
         request_id: str = None,
         processing_time_ms: int = None,
+        commit: bool = True,
     ):
-        """Log emissions calculation events for audit trail"""
+        """Log emissions calculation events for audit trail
+
+        With commit=False the entry is only added to the session, so it is
+        written in the caller's transaction when the caller commits.
+        """
         try:
             audit_entry = AuditLog(
                 event_type="CALCULATION",
@@ -235,12 +240,15 @@ class AuditLogger:
             )
 
             self.db.add(audit_entry)
-            self.db.commit()
+            if commit:
+                self.db.commit()
 
             logger.info(f"Calculation audit logged: {calculation_type} by {user.email}")
 
         except Exception as e:
             logger.error(f"Failed to log calculation audit: {str(e)}")
+            if not commit:
+                return  # Leave the caller's transaction alone
             try:
                 self.db.rollback()
             except Exception:
@@ -3,6 +3,7 @@ Database configuration and connection management
 PostgreSQL with TimescaleDB extension for time-series data
 """
 
+from pydantic_core import to_json
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -10,6 +11,16 @@ from sqlalchemy.pool import QueuePool, StaticPool
 
 from app.core.config import settings
 
+
+def json_serializer(value) -> str:
+    """Encode JSON column values with pydantic-core's native serializer
+
+    Handles datetimes, UUIDs and decimals from model_dump() output directly,
+    and runs in Rust rather than through json.dumps.
+    """
+    return to_json(value).decode()
+
+
 # Determine pool class based on database URL
 pool_class = StaticPool if "sqlite" in settings.DATABASE_URL else QueuePool
 
@@ -51,6 +62,9 @@ else:
         pool_pre_ping=True,
         echo=settings.DEBUG,
         connect_args=connect_args,
+        # Batch executemany() INSERT/UPDATE statements into multi-row round-trips
+        executemany_mode="values_plus_batch",
+        json_serializer=json_serializer,
     )
 
 # Create session factory
@@ -4,6 +4,7 @@ Climate Disclosure Rule Compliance Platform for US Public Companies
 """
 
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 import uvicorn
@@ -29,11 +30,20 @@ from app.core.rate_limiting import (
 )
 from app.core.security_headers import SecurityHeadersMiddleware
 from app.db.database import get_db
+from app.services.epa_service import close_http_client
 
 if SLOWAPI_AVAILABLE:
     from slowapi.errors import RateLimitExceeded
     from slowapi.middleware import SlowAPIMiddleware
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release process-wide resources on shutdown"""
+    yield
+    await close_http_client()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="ENVOYOU SEC API",
@@ -42,6 +52,7 @@ app = FastAPI(
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
     debug=settings.DEBUG,  # Enable debug mode for detailed error logging
+    lifespan=lifespan,
 )
 
 # Logger for staging auth middleware
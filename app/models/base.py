@@ -10,16 +10,7 @@ from sqlalchemy import CHAR, Boolean, Column, DateTime, String, Text, TypeDecora
 from sqlalchemy.dialects.postgresql import JSONB as PostgresJSONB, UUID as PostgresUUID
 from sqlalchemy.sql import func
 
-from app.db.database import Base
-
-
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects"""
-
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+from app.db.database import Base, json_serializer
 
 
 class GUID(TypeDecorator):
@@ -128,7 +119,7 @@ class JSON(TypeDecorator):
             return value  # PostgreSQL handles JSON natively
         else:
             # For SQLite and other databases, serialize to JSON string
-            return json.dumps(value, cls=DateTimeEncoder)
+            return json_serializer(value)
 
     def process_result_value(self, value, dialect):
         if value is None:
@@ -290,6 +290,10 @@ class EmissionsCalculation(BaseModel, AuditMixin):
         Index("idx_emissions_calc_approved", "approved_by", "status"),
     )
 
+    # Fetch server-generated timestamps via RETURNING at flush time instead
+    # of a follow-up SELECT when they are first read
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<EmissionsCalculation(code='{self.calculation_code}', scope='{self.scope}')>"
 
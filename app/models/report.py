@@ -3,6 +3,7 @@ Report Models for Audit Lock and Collaboration
 Models for report locking, comments, and revision tracking
 """
 
+from datetime import datetime
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -10,11 +11,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     event,
-    func,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -43,8 +45,8 @@ class Report(Base):
         String(50), nullable=False, default="draft"
     )  # "draft", "pending_approval", "approved", "locked"
     version = Column(String(20), nullable=False, default="1.0")
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime)
     workflow_id = Column(String(36), ForeignKey("workflows.id"), nullable=True)
     created_by = Column(String(36), ForeignKey("users.id"), nullable=False)
@@ -74,14 +76,14 @@ class Report(Base):
 
     @property
     def is_locked(self):
-        """Checks if there is an active lock on the report."""
-        return any(lock.is_active for lock in self.locks)
+        """Checks if there is an active, unexpired lock on the report."""
+        return self.active_lock is not None
 
     @property
     def active_lock(self):
-        """Returns the active lock object, if any."""
+        """Returns the active, unexpired lock object, if any."""
         for lock in self.locks:
-            if lock.is_active:
+            if lock.is_active and not lock.is_expired:
                 return lock
         return None
 
@@ -96,6 +98,16 @@ class ReportLock(Base):
     """Report locking mechanism for audit periods"""
 
     __tablename__ = "report_locks"
+    __table_args__ = (
+        # At most one active lock per report, enforced by the database
+        Index(
+            "uq_report_locks_active_report",
+            "report_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id = Column(String(36), primary_key=True)
 
@@ -106,7 +118,7 @@ class ReportLock(Base):
 
     report_id = Column(String(36), ForeignKey("reports.id"), nullable=False, index=True)
     locked_by = Column(String(36), ForeignKey("users.id"), nullable=False)
-    locked_at = Column(DateTime)
+    locked_at = Column(DateTime, default=datetime.utcnow)
     lock_reason = Column(
         String(255), nullable=False
     )  # "audit", "review", "compliance_check"
@@ -120,6 +132,11 @@ class ReportLock(Base):
     locked_by_user = relationship("User", foreign_keys=[locked_by])
     unlocked_by_user = relationship("User", foreign_keys=[unlocked_by])
 
+    @property
+    def is_expired(self):
+        """Checks if the lock has passed its expiration time."""
+        return self.expires_at is not None and self.expires_at <= datetime.utcnow()
+
 
 class Comment(Base):
     """Collaboration comments on reports"""
@@ -145,8 +162,8 @@ class Comment(Base):
     is_resolved = Column(Boolean, default=False)
     resolved_by = Column(String(36), ForeignKey("users.id"))
     resolved_at = Column(DateTime)
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     report = relationship("Report", back_populates="comments")
@@ -176,7 +193,7 @@ class Revision(Base):
     )  # "create", "update", "approve", "reject"
     changes_summary = Column(Text)  # JSON summary of changes
     previous_version = Column(String(20))
-    created_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     report = relationship("Report", back_populates="revisions")
@@ -218,8 +235,6 @@ def receive_before_update(mapper, connection, target):
 @event.listens_for(Report, "after_insert")
 def receive_after_insert(mapper, connection, target):
     """Create initial revision after report creation"""
-    from datetime import datetime
-
     from sqlalchemy.orm import sessionmaker
 
     Session = sessionmaker(bind=connection)
@@ -233,7 +248,6 @@ def receive_after_insert(mapper, connection, target):
             changed_by=target.created_by,
             change_type="create",
             changes_summary="Initial report creation",
-            created_at=datetime.utcnow(),
         )
         session.add(revision)
         session.commit()
@@ -2,6 +2,7 @@
 Emissions calculation schemas for request/response validation
 """
 
+import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -55,6 +56,13 @@ class ActivityDataInput(BaseModel):
             raise ValueError(f"Data quality must be one of: {valid_qualities}")
         return v
 
+    @field_validator("fuel_type", "unit", "data_quality")
+    @classmethod
+    def intern_category(cls, v):
+        # Few distinct values repeated across many activities; interning
+        # lets dict and set lookups during aggregation match by identity
+        return sys.intern(v) if v else v
+
 
 class Scope1CalculationRequest(BaseModel):
     """Schema for Scope 1 emissions calculation request"""
@@ -186,6 +194,12 @@ class ActivityDataResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def stringify_id(cls, v):
+        # ActivityData ids are UUIDs
+        return str(v) if v is not None else v
+
 
 class EmissionsCalculationResponse(BaseModel):
     """Schema for emissions calculation response"""
@@ -112,6 +112,7 @@ class LockReportResponse(BaseModel):
     id: str
     report_id: str
     locked_by: str
+    locked_by_name: Optional[str] = None
     lock_reason: str
     locked_at: str
     expires_at: Optional[str] = None
@@ -129,6 +130,7 @@ class ReportLockStatus(BaseModel):
 
     is_locked: bool
     locked_by: Optional[str] = None
+    locked_by_name: Optional[str] = None
     lock_reason: Optional[str] = None
     locked_at: Optional[str] = None
     expires_at: Optional[str] = None
@@ -156,6 +158,7 @@ class CommentResponse(BaseModel):
     is_resolved: bool
     created_at: datetime
     updated_at: datetime
+    replies: List["CommentResponse"] = []
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -193,6 +196,7 @@ class ReportLockInfo(BaseModel):
 
     is_locked: bool
     locked_by: Optional[str] = None
+    locked_by_name: Optional[str] = None
     locked_at: Optional[str] = None
     lock_reason: Optional[str] = None
     expires_at: Optional[str] = None
@@ -321,6 +321,72 @@ class CacheService:
             logger.error(f"Error retrieving cached calculation: {str(e)}")
             return None
 
+    def set_report_lock(
+        self,
+        report_id: str,
+        lock_info: Dict[str, Any],
+        ttl_seconds: int,
+        only_if_absent: bool = False,
+    ) -> bool:
+        """Cache the current lock status of a report
+
+        With only_if_absent the entry is written with SET NX, so it never
+        replaces a status cached in the meantime.
+        """
+        if not self.redis_client or ttl_seconds <= 0:
+            return False
+
+        try:
+            key = self._get_key("report_lock", report_id)
+            result = bool(
+                self.redis_client.set(
+                    key,
+                    self._serialize_data(lock_info),
+                    ex=ttl_seconds,
+                    nx=only_if_absent,
+                )
+            )
+
+            if result:
+                logger.debug(f"Cached lock status for report '{report_id}'")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error caching report lock status: {str(e)}")
+            return False
+
+    def get_report_lock(self, report_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve cached lock status of a report"""
+        if not self.redis_client:
+            return None
+
+        try:
+            key = self._get_key("report_lock", report_id)
+            cached_data = self.redis_client.get(key)
+
+            if cached_data:
+                return self._deserialize_data(cached_data)
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Error retrieving cached report lock status: {str(e)}")
+            return None
+
+    def invalidate_report_lock(self, report_id: str) -> bool:
+        """Drop cached lock status of a report"""
+        if not self.redis_client:
+            return False
+
+        try:
+            key = self._get_key("report_lock", report_id)
+            return bool(self.redis_client.delete(key))
+
+        except Exception as e:
+            logger.error(f"Error invalidating report lock status: {str(e)}")
+            return False
+
     def invalidate_epa_cache(self, pattern: str = "epa_*") -> int:
         """Invalidate EPA cache entries matching pattern"""
         if not self.redis_client:
@@ -465,3 +531,6 @@ else:
     cache_service.get_epa_factors.return_value = None
     cache_service.get_factor_by_code.return_value = None
     cache_service.invalidate_epa_cache.return_value = 0
+    cache_service.set_report_lock.return_value = True
+    cache_service.get_report_lock.return_value = None
+    cache_service.invalidate_report_lock.return_value = True
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.schemas.epa_data import EmissionFactorResponse, EPAFactorSummary
 from app.services.epa_service import EPADataIngestionService
-from app.services.redis_cache import EPACacheService
+from app.services.redis_cache import epa_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,7 @@ class EPACachedService:
     def __init__(self, db: Session):
         self.db = db
         self.epa_service = EPADataIngestionService(db)
-        self.cache_service = EPACacheService()
+        self.cache_service = epa_cache
         self.refresh_interval_hours = settings.EPA_DATA_CACHE_HOURS
         self._refresh_task = None
 
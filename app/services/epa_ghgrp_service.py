@@ -19,7 +19,7 @@ from app.core.audit_logger import AuditLogger
 from app.core.config import settings
 from app.models.emissions import Company, EmissionsCalculation
 from app.models.epa_data import EmissionFactor
-from app.services.redis_cache import EPACacheService
+from app.services.redis_cache import epa_cache
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class EPAGHGRPService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.cache_service = EPACacheService()
+        self.cache_service = epa_cache
         self.audit_logger = AuditLogger(db)
 
         # EPA GHGRP API configuration
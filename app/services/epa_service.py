@@ -9,8 +9,9 @@ import hashlib
 import io
 import json
 import logging
+import weakref
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple
 
 import httpx
 from fastapi import HTTPException, status
@@ -39,6 +40,35 @@ from app.schemas.epa_data import (
 
 logger = logging.getLogger(__name__)
 
+# One pooled client per event loop, so EPA API connections and TLS sessions
+# are reused across service instances instead of opened for every request. An
+# AsyncClient is bound to the loop it first runs on, so each loop (e.g. one
+# started by asyncio.run) gets its own, dropped when the loop is collected.
+_http_clients: MutableMapping[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client of the running event loop for EPA API calls"""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=settings.EPA_REQUEST_TIMEOUT,
+            headers={"User-Agent": "ENVOYOU-SEC-API/1.0"},
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any"""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 class EPADataIngestionService:
     """Service for ingesting and managing EPA emission factors"""
@@ -46,10 +76,11 @@ class EPADataIngestionService:
     def __init__(self, db: Session):
         self.db = db
         self.audit_logger = AuditLogger(db)
-        self.http_client = httpx.AsyncClient(
-            timeout=settings.EPA_REQUEST_TIMEOUT,
-            headers={"User-Agent": "ENVOYOU-SEC-API/1.0"},
-        )
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client of the running event loop"""
+        return get_http_client()
 
     async def fetch_latest_factors(self, source: str = "EPA_GHGRP") -> Dict[str, Any]:
         """Fetch latest EPA emission factors from external API"""
@@ -473,4 +504,6 @@ class EPADataIngestionService:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.http_client.aclose()
+        # The HTTP client is shared by every instance and closed on app
+        # shutdown (see close_http_client)
+        pass
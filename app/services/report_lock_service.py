@@ -3,12 +3,16 @@ Report Locking Service
 Handles report locking, unlocking, and collaboration features
 """
 
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional
-from uuid import UUID
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, exists, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.report import Comment, Report, ReportLock, Revision
 from app.models.user import User
@@ -19,6 +23,32 @@ from app.schemas.report import (
     ReportLockInfo,
     RevisionCreate,
 )
+from app.services.cache_service import cache_service
+
+# How long a "not locked" answer may be served from cache. lock_report and
+# unlock_report overwrite the cached status, while readers only add an entry
+# when none exists, so a stale read never hides a newer lock or unlock; the
+# TTL bounds staleness for locks written outside the service.
+UNLOCKED_STATUS_CACHE_TTL_SECONDS = 60
+
+# Rows fetched per round-trip when streaming revision and lock history
+HISTORY_BATCH_SIZE = 500
+
+
+def active_lock_clause():
+    """SQL criterion for a lock that is active and not yet expired
+
+    expires_at holds naive UTC from datetime.utcnow(), so it is compared with
+    a bound UTC value rather than the database clock, whose naive reading
+    depends on the session time zone.
+    """
+    return and_(
+        ReportLock.is_active == True,
+        or_(
+            ReportLock.expires_at.is_(None),
+            ReportLock.expires_at > datetime.utcnow(),
+        ),
+    )
 
 
 class ReportLockService:
@@ -49,43 +79,79 @@ class ReportLockService:
         Raises:
             HTTPException: If report not found or already locked
         """
-        # Check if report exists
-        report = self.db.query(Report).filter(Report.id == report_id).first()
-        if not report:
+        # Check user permissions; the role is already loaded with the user
+        if user.role.value not in ["auditor", "admin", "cfo"]:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Report {report_id} not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only auditors, admins, or CFOs can lock reports",
             )
 
-        # Check if report is already locked
-        if report.is_locked:
+        # Retire any lapsed lock in the same transaction as the new one
+        self._deactivate_expired_locks(ReportLock.report_id == report_id)
+
+        # Insert the lock only if the report exists and has no active lock.
+        # Concurrent requests can both pass the NOT EXISTS check under READ
+        # COMMITTED; the partial unique index on active locks rejects the
+        # loser. locked_at and expires_at share one naive UTC clock reading.
+        locked_at = datetime.utcnow()
+        expires_at = locked_at + timedelta(hours=expires_in_hours)
+        candidate = select(
+            literal(str(uuid4()), ReportLock.id.type),
+            literal(str(report_id), ReportLock.report_id.type),
+            literal(str(user.id), ReportLock.locked_by.type),
+            literal(lock_reason, ReportLock.lock_reason.type),
+            literal(locked_at, ReportLock.locked_at.type),
+            literal(expires_at, ReportLock.expires_at.type),
+            literal(True, ReportLock.is_active.type),
+        ).where(
+            exists().where(Report.id == report_id),
+            ~exists().where(ReportLock.report_id == report_id, active_lock_clause()),
+        )
+        try:
+            lock = self.db.scalars(
+                insert(ReportLock)
+                .from_select(
+                    [
+                        ReportLock.id,
+                        ReportLock.report_id,
+                        ReportLock.locked_by,
+                        ReportLock.lock_reason,
+                        ReportLock.locked_at,
+                        ReportLock.expires_at,
+                        ReportLock.is_active,
+                    ],
+                    candidate,
+                )
+                .returning(ReportLock)
+            ).first()
+        except IntegrityError:
+            self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Report is already locked",
             )
 
-        # Check user permissions
-        if user.role.value not in ["auditor", "admin", "cfo"]:
+        if lock is None:
+            self.db.rollback()
+            # Nothing inserted: a second read tells a missing report from a
+            # locked one, and is only paid on the failure path
+            if not self.db.scalar(select(exists().where(Report.id == report_id))):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Report {report_id} not found",
+                )
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only auditors, admins, or CFOs can lock reports",
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Report is already locked",
             )
 
-        # Create lock
-        locked_at = datetime.utcnow()
-        expires_at = locked_at + timedelta(hours=expires_in_hours)
-        lock = ReportLock(
-            report_id=report_id,
-            locked_by=user.id,
-            locked_at=locked_at,
-            lock_reason=lock_reason,
-            expires_at=expires_at,
-            is_active=True,
-        )
-
-        self.db.add(lock)
+        # The locker is already in memory; attach it instead of lazy loading,
+        # and detach the row so the commit does not expire what RETURNING read
+        set_committed_value(lock, "locked_by_user", user)
+        self.db.expunge(lock)
         self.db.commit()
-        self.db.refresh(lock)
+
+        self._cache_lock_info(report_id, lock)
 
         # Note: report.is_locked is a computed property, no need to set it
         # The property will automatically return True when there are active locks
@@ -106,50 +172,95 @@ class ReportLockService:
         Raises:
             HTTPException: If report not found or not locked by user
         """
-        # Check if report exists
-        report = self.db.query(Report).filter(Report.id == report_id).first()
-        if not report:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Report {report_id} not found",
+        # Release the lock only if the user is its locker or an admin. Report
+        # tables store user IDs as strings, so bind the ID in that form.
+        user_id = str(user.id)
+        unlocked_ids = (
+            self.db.execute(
+                update(ReportLock)
+                .where(
+                    ReportLock.report_id == report_id,
+                    active_lock_clause(),
+                    or_(ReportLock.locked_by == user_id, literal(user.is_admin)),
+                )
+                .values(
+                    is_active=False,
+                    unlocked_at=datetime.utcnow(),
+                    unlocked_by=user_id,
+                )
+                .returning(ReportLock.id)
+                .execution_options(synchronize_session=False)
             )
+            .scalars()
+            .all()
+        )
 
-        # Check if report is locked
-        if not report.is_locked:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Report is not locked",
-            )
+        if not unlocked_ids:
+            # Nothing was updated; work out why for the error response
+            self.db.rollback()
+
+            report_exists = self.db.query(
+                exists().where(Report.id == report_id)
+            ).scalar()
+            if not report_exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Report {report_id} not found",
+                )
+
+            if not self._get_active_lock(report_id):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Report is not locked",
+                )
 
-        # Check if user can unlock (locker or admin)
-        if report.locked_by != user.id and not user.is_admin:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only the locking user or admin can unlock reports",
             )
 
-        # Find active lock
-        lock = (
-            self.db.query(ReportLock)
-            .filter(
-                ReportLock.report_id == report_id,
-                ReportLock.is_active == True,
-            )
-            .first()
-        )
+        self.db.commit()
 
-        if lock:
-            # Update lock
-            lock.is_active = False
-            lock.unlocked_at = datetime.utcnow()
-            lock.unlocked_by = user.id
-            self.db.commit()
+        # Overwrite rather than delete, so a reader that loaded the lock before
+        # this commit cannot cache it again afterwards
+        cache_service.set_report_lock(
+            str(report_id), {"is_locked": False}, UNLOCKED_STATUS_CACHE_TTL_SECONDS
+        )
 
         # Note: report.is_locked is a computed property, no need to set it
         # The property will automatically return False when there are no active locks
 
         return True
 
+    def get_lock_status(self, report_id: UUID) -> Optional[ReportLockInfo]:
+        """
+        Get the active lock of a report, served from cache when possible
+
+        Args:
+            report_id: Report UUID
+
+        Returns:
+            Lock information or None if not locked
+        """
+        cached = cache_service.get_report_lock(str(report_id))
+        if cached is not None:
+            return ReportLockInfo(**cached) if cached.get("is_locked") else None
+
+        lock = self._get_active_lock(report_id)
+
+        if not lock:
+            # Set-if-absent: a lock committed and cached since this read must
+            # not be replaced by the stale "not locked" answer
+            cache_service.set_report_lock(
+                str(report_id),
+                {"is_locked": False},
+                UNLOCKED_STATUS_CACHE_TTL_SECONDS,
+                only_if_absent=True,
+            )
+            return None
+
+        return self._cache_lock_info(report_id, lock, only_if_absent=True)
+
     def get_report_lock_info(self, report_id: UUID) -> Optional[ReportLockInfo]:
         """
         Get lock information for a report
@@ -160,26 +271,65 @@ class ReportLockService:
         Returns:
             Lock information or None if not locked
         """
-        lock = (
+        return self.get_lock_status(report_id)
+
+    def _get_active_lock(self, report_id: UUID) -> Optional[ReportLock]:
+        """Get the unexpired active lock of a report, if any"""
+        return (
             self.db.query(ReportLock)
-            .filter(
-                ReportLock.report_id == report_id,
-                ReportLock.is_active == True,
-            )
+            .options(joinedload(ReportLock.locked_by_user))
+            .filter(ReportLock.report_id == report_id, active_lock_clause())
             .first()
         )
 
-        if not lock:
-            return None
+    def _deactivate_expired_locks(self, *criteria) -> List[str]:
+        """Flag lapsed locks inactive, returning the affected report IDs"""
+        return (
+            self.db.execute(
+                update(ReportLock)
+                .where(
+                    ReportLock.is_active == True,
+                    ReportLock.expires_at <= datetime.utcnow(),
+                    *criteria,
+                )
+                .values(is_active=False)
+                .returning(ReportLock.report_id)
+                .execution_options(synchronize_session=False)
+            )
+            .scalars()
+            .all()
+        )
+
+    def _cache_lock_info(
+        self, report_id: UUID, lock: ReportLock, only_if_absent: bool = False
+    ) -> ReportLockInfo:
+        """Build lock info and cache it until the lock expires
 
-        return ReportLockInfo(
+        Readers pass only_if_absent so a status cached by a later lock or
+        unlock is never replaced.
+        """
+        lock_info = ReportLockInfo(
             is_locked=True,
-            locked_by=str(lock.locked_by),
-            locked_at=lock.locked_at,
+            locked_by=lock.locked_by,
+            locked_by_name=(
+                lock.locked_by_user.full_name if lock.locked_by_user else None
+            ),
+            locked_at=lock.locked_at.isoformat() if lock.locked_at else None,
             lock_reason=lock.lock_reason,
-            expires_at=lock.expires_at,
+            expires_at=lock.expires_at.isoformat() if lock.expires_at else None,
         )
 
+        if lock.expires_at:
+            ttl_seconds = int((lock.expires_at - datetime.utcnow()).total_seconds())
+            cache_service.set_report_lock(
+                str(report_id),
+                lock_info.model_dump(),
+                ttl_seconds,
+                only_if_absent=only_if_absent,
+            )
+
+        return lock_info
+
     def add_comment(
         self, report_id: UUID, user: User, comment_data: CommentCreate
     ) -> Comment:
@@ -206,15 +356,12 @@ class ReportLockService:
             )
 
         # Create comment
-        now = datetime.utcnow()
         comment = Comment(
             report_id=report_id,
             user_id=user.id,
             content=comment_data.content,
             comment_type=comment_data.comment_type,
             parent_id=comment_data.parent_id,
-            created_at=now,
-            updated_at=now,
         )
 
         self.db.add(comment)
@@ -223,12 +370,31 @@ class ReportLockService:
 
         return comment
 
+    def bulk_add_comments(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many comments in one batched statement
+
+        Intended for history replays and backfills, where per-comment
+        add/commit/refresh round-trips dominate.
+
+        Args:
+            rows: Comment column mappings (report_id, user_id, content, ...)
+
+        Returns:
+            Number of comments inserted
+        """
+        return self._bulk_insert(Comment, rows)
+
     def get_comments(
         self, report_id: UUID, parent_id: Optional[str] = None
     ) -> List[Comment]:
         """
         Get all comments for a report
 
+        The whole thread below the requested level is fetched with a single
+        recursive query and assembled in memory; each returned comment carries
+        its nested replies in ``replies``.
+
         Args:
             report_id: Report UUID
             parent_id: Optional parent comment ID for threaded comments
@@ -236,15 +402,36 @@ class ReportLockService:
         Returns:
             List of comments
         """
-        query = self.db.query(Comment).filter(Comment.report_id == report_id)
-
         if parent_id:
-            query = query.filter(Comment.parent_id == parent_id)
+            anchor = Comment.parent_id == parent_id
         else:
             # Get only top-level comments if no parent_id specified
-            query = query.filter(Comment.parent_id.is_(None))
+            anchor = Comment.parent_id.is_(None)
 
-        return query.order_by(Comment.created_at.desc()).all()
+        thread = (
+            select(Comment.id)
+            .where(Comment.report_id == report_id, anchor)
+            .cte("comment_thread", recursive=True)
+        )
+        thread = thread.union_all(
+            select(Comment.id).join(thread, Comment.parent_id == thread.c.id)
+        )
+
+        comments = (
+            self.db.query(Comment)
+            .join(thread, Comment.id == thread.c.id)
+            .order_by(Comment.created_at.desc())
+            .all()
+        )
+
+        replies_by_parent = defaultdict(list)
+        for comment in comments:
+            replies_by_parent[comment.parent_id].append(comment)
+
+        for comment in comments:
+            comment.replies = replies_by_parent.get(comment.id, [])
+
+        return replies_by_parent.get(parent_id or None, [])
 
     def resolve_comment(self, comment_id: UUID, user: User) -> Comment:
         """
@@ -258,21 +445,46 @@ class ReportLockService:
             Updated comment
 
         Raises:
-            HTTPException: If comment not found
+            HTTPException: If comment not found or user may not resolve it
         """
-        comment = self.db.query(Comment).filter(Comment.id == comment_id).first()
+        # Resolve only if the user wrote the comment or is an admin
+        user_id = str(user.id)
+        comment = self.db.scalars(
+            update(Comment)
+            .where(
+                Comment.id == comment_id,
+                or_(Comment.user_id == user_id, literal(user.is_admin)),
+            )
+            .values(
+                is_resolved=True,
+                resolved_by=user_id,
+                resolved_at=datetime.utcnow(),
+            )
+            .returning(Comment),
+            execution_options={"populate_existing": True},
+        ).first()
+
         if not comment:
+            self.db.rollback()
+
+            comment_exists = self.db.query(
+                exists().where(Comment.id == comment_id)
+            ).scalar()
+            if not comment_exists:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Comment {comment_id} not found",
+                )
+
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Comment {comment_id} not found",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the comment author or admin can resolve comments",
             )
 
-        comment.is_resolved = True
-        comment.resolved_by = user.id
-        comment.resolved_at = datetime.utcnow()
-
+        # Detach so the commit keeps the RETURNING values instead of expiring
+        # them and forcing a reload
+        self.db.expunge(comment)
         self.db.commit()
-        self.db.refresh(comment)
 
         return comment
 
@@ -322,7 +534,6 @@ class ReportLockService:
             change_type=change_type,
             changes_summary=changes_summary,
             previous_version=None,
-            created_at=datetime.utcnow(),
         )
 
         self.db.add(revision)
@@ -331,19 +542,114 @@ class ReportLockService:
 
         return revision
 
-    def get_revisions(self, report_id: UUID) -> List[Revision]:
+    def get_revisions(
+        self,
+        report_id: UUID,
+        before_revision: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Revision]:
         """
-        Get all revisions for a report
+        Get revisions for a report, newest first
 
         Args:
             report_id: Report UUID
+            before_revision: Keyset cursor; only revisions numbered below it
+            limit: Maximum number of revisions to return
 
         Returns:
             List of revisions
         """
-        return (
-            self.db.query(Revision)
-            .filter(Revision.report_id == report_id)
+        query = self.db.query(Revision).filter(Revision.report_id == report_id)
+
+        if before_revision is not None:
+            query = query.filter(Revision.revision_number < before_revision)
+
+        query = query.order_by(Revision.revision_number.desc())
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def iter_revisions(
+        self, report_id: UUID, batch_size: int = HISTORY_BATCH_SIZE
+    ) -> Iterator[Revision]:
+        """
+        Stream all revisions for a report, newest first
+
+        Rows are fetched from the cursor in batches rather than loaded at once.
+
+        Args:
+            report_id: Report UUID
+            batch_size: Rows buffered per fetch
+
+        Returns:
+            Iterator of revisions
+        """
+        stmt = (
+            select(Revision)
+            .where(Revision.report_id == report_id)
             .order_by(Revision.revision_number.desc())
-            .all()
         )
+        yield from self.db.scalars(stmt, execution_options={"yield_per": batch_size})
+
+    def iter_report_locks(
+        self, report_id: UUID, batch_size: int = HISTORY_BATCH_SIZE
+    ) -> Iterator[ReportLock]:
+        """
+        Stream the lock history of a report, newest first
+
+        Args:
+            report_id: Report UUID
+            batch_size: Rows buffered per fetch
+
+        Returns:
+            Iterator of locks
+        """
+        stmt = (
+            select(ReportLock)
+            .options(selectinload(ReportLock.locked_by_user), raiseload("*"))
+            .where(ReportLock.report_id == report_id)
+            .order_by(ReportLock.locked_at.desc())
+        )
+        yield from self.db.scalars(stmt, execution_options={"yield_per": batch_size})
+
+    def get_report_locks(self, report_id: UUID) -> List[ReportLock]:
+        """
+        Get the lock history of a report, newest first
+
+        Args:
+            report_id: Report UUID
+
+        Returns:
+            List of locks
+        """
+        return list(self.iter_report_locks(report_id))
+
+    def bulk_create_revisions(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many revisions in one batched statement
+
+        Unlike create_revision, rows must carry their own revision_number,
+        since replayed history already knows its ordering.
+
+        Args:
+            rows: Revision column mappings (report_id, version, revision_number, ...)
+
+        Returns:
+            Number of revisions inserted
+        """
+        return self._bulk_insert(Revision, rows)
+
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows with a single executemany and commit once"""
+        if not rows:
+            return 0
+
+        self.db.execute(
+            insert(model),
+            [{"id": str(uuid4()), **row} for row in rows],
+        )
+        self.db.commit()
+
+        return len(rows)
@@ -3,12 +3,12 @@ Report CRUD Service
 Service layer for basic report operations (Create, Read, Update, Delete)
 """
 
-from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, desc, func, lambda_stmt, or_, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from app.models.report import Report
 from app.models.user import User
@@ -36,76 +36,39 @@ class ReportService:
     ) -> ReportsListResponse:
         """Get paginated list of reports with optional filtering"""
 
-        # Start with base query
-        query = self.db.query(Report)
+        # Cached lambda statements: the compiled SQL is reused for every
+        # request with the same combination of filters
+        query = lambda_stmt(lambda: select(Report))
+        count_query = lambda_stmt(lambda: select(func.count(Report.id)))
 
         # Apply filters
         if filters:
-            if filters.status:
-                query = query.filter(Report.status.in_(filters.status))
-            if filters.report_type:
-                query = query.filter(Report.report_type.in_(filters.report_type))
-            if filters.company_id:
-                query = query.filter(Report.company_id == filters.company_id)
-            if filters.reporting_year:
-                query = query.filter(Report.reporting_year == filters.reporting_year)
-            if filters.created_by:
-                query = query.filter(Report.created_by == filters.created_by)
-            if filters.priority:
-                query = query.filter(Report.priority.in_(filters.priority))
-            if filters.date_from:
-                query = query.filter(Report.created_at >= filters.date_from)
-            if filters.date_to:
-                query = query.filter(Report.created_at <= filters.date_to)
-            if filters.search:
-                search_term = f"%{filters.search}%"
-                query = query.filter(
-                    or_(
-                        Report.title.ilike(search_term),
-                        Report.description.ilike(search_term),
-                    )
-                )
+            query = self._apply_filters(query, filters)
+            count_query = self._apply_filters(count_query, filters)
 
         # Apply sorting
         sort_by = filters.sort_by if filters else "created_at"
         sort_order = filters.sort_order if filters else "desc"
+        sort_column = getattr(Report, sort_by)
 
         if sort_order == "desc":
-            query = query.order_by(desc(getattr(Report, sort_by)))
+            query += lambda s: s.order_by(desc(sort_column))
         else:
-            query = query.order_by(getattr(Report, sort_by))
+            query += lambda s: s.order_by(sort_column)
 
         # Get total count
-        total_count = query.count()
+        total_count = self.db.execute(count_query).scalar()
 
         # Apply pagination
         offset = (page - 1) * page_size
-        reports = query.offset(offset).limit(page_size).all()
+        query += lambda s: s.offset(offset).limit(page_size)
+        reports = self.db.execute(query).scalars().all()
 
         # Calculate total pages
         total_pages = (total_count + page_size - 1) // page_size
 
         # Convert to response objects
-        report_responses = [
-            ReportResponse(
-                id=str(report.id),
-                title=report.title,
-                report_type=report.report_type,
-                status=report.status,
-                version=report.version,
-                created_at=report.created_at,
-                updated_at=report.updated_at,
-                completed_at=report.completed_at,
-                workflow_id=str(report.workflow_id) if report.workflow_id else None,
-                created_by=str(report.created_by),
-                updated_by=str(report.updated_by) if report.updated_by else None,
-                content=report.content,
-                report_metadata=report.report_metadata,
-                pdf_path=report.pdf_path,
-                excel_path=report.excel_path,
-            )
-            for report in reports
-        ]
+        report_responses = [ReportResponse.model_validate(report) for report in reports]
 
         return ReportsListResponse(
             reports=report_responses,
@@ -115,6 +78,43 @@ class ReportService:
             total_pages=total_pages,
         )
 
+    @staticmethod
+    def _apply_filters(stmt: StatementLambdaElement, filters: ReportsFilters):
+        """Extend a lambda statement with WHERE criteria for the given filters"""
+        if filters.status:
+            statuses = filters.status
+            stmt += lambda s: s.where(Report.status.in_(statuses))
+        if filters.report_type:
+            report_types = filters.report_type
+            stmt += lambda s: s.where(Report.report_type.in_(report_types))
+        if filters.company_id:
+            company_id = filters.company_id
+            stmt += lambda s: s.where(Report.company_id == company_id)
+        if filters.reporting_year:
+            reporting_year = filters.reporting_year
+            stmt += lambda s: s.where(Report.reporting_year == reporting_year)
+        if filters.created_by:
+            created_by = filters.created_by
+            stmt += lambda s: s.where(Report.created_by == created_by)
+        if filters.priority:
+            priorities = filters.priority
+            stmt += lambda s: s.where(Report.priority.in_(priorities))
+        if filters.date_from:
+            date_from = filters.date_from
+            stmt += lambda s: s.where(Report.created_at >= date_from)
+        if filters.date_to:
+            date_to = filters.date_to
+            stmt += lambda s: s.where(Report.created_at <= date_to)
+        if filters.search:
+            search_term = f"%{filters.search}%"
+            stmt += lambda s: s.where(
+                or_(
+                    Report.title.ilike(search_term),
+                    Report.description.ilike(search_term),
+                )
+            )
+        return stmt
+
     def get_report(self, report_id: str) -> Optional[Report]:
         """Get a single report by ID"""
         return self.db.query(Report).filter(Report.id == report_id).first()
@@ -134,8 +134,6 @@ class ReportService:
             priority=report_data.priority or "medium",
             due_date=report_data.due_date,
             created_by=str(current_user.id),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
         )
 
         self.db.add(report)
@@ -159,9 +157,8 @@ class ReportService:
             if hasattr(report, field):
                 setattr(report, field, value)
 
-        # Update metadata
+        # Update metadata; updated_at is stamped on update
         report.updated_by = str(current_user.id)
-        report.updated_at = datetime.utcnow()
 
         self.db.commit()
         self.db.refresh(report)
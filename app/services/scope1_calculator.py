@@ -3,14 +3,22 @@ Scope 1 Emissions Calculator Service
 Direct GHG emissions from sources owned or controlled by the company
 """
 
+import asyncio
 import json
 import logging
+import time
 import uuid
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, bindparam, func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.core.audit_logger import AuditLogger
 from app.core.config import settings
@@ -22,8 +30,10 @@ from app.models.emissions import (
     EmissionsCalculation,
 )
 from app.models.epa_data import EmissionFactor
+from app.models.user import User
 from app.schemas.emissions import (
     ActivityDataInput,
+    ActivityDataResponse,
     CalculationValidationResult,
     EmissionsCalculationResponse,
     Scope1CalculationRequest,
@@ -33,45 +43,409 @@ from app.services.epa_cache_service import EPACachedService
 
 logger = logging.getLogger(__name__)
 
+# Maximum emission factor lookups in flight at once during prefetch
+FACTOR_LOOKUP_CONCURRENCY = 8
+
+# Statements built once and reused, so each execution hits SQLAlchemy's
+# compiled statement cache without reconstructing the construct
+ACTIVITY_DATA_INSERT = ActivityData.__table__.insert()
+FACTOR_BY_CODE_QUERY = select(EmissionFactor).where(
+    EmissionFactor.factor_code == bindparam("factor_code")
+)
+
+# Fallback factors in preference order: EPA_GHGRP first (it sorts last
+# alphabetically), then the newest publication year
+FALLBACK_FACTOR_CRITERIA = (
+    EmissionFactor.is_current == True,
+    EmissionFactor.category.in_(["fuel_combustion", "fuel", "combustion"]),
+)
+FALLBACK_FACTORS_QUERY = (
+    select(EmissionFactor)
+    .where(*FALLBACK_FACTOR_CRITERIA)
+    .order_by(EmissionFactor.source.desc(), EmissionFactor.publication_year.desc())
+)
+FALLBACK_FACTOR_QUERY = FALLBACK_FACTORS_QUERY.limit(1)
+FALLBACK_FACTOR_BY_FUEL_QUERY = FALLBACK_FACTORS_QUERY.where(
+    EmissionFactor.fuel_type == bindparam("fuel_type")
+).limit(1)
+
+
+def _best_fallback_factors_query(*criteria) -> Select:
+    """Preferred fallback factor of each fuel type, best fuel type first
+
+    Ranks candidates per fuel type in SQL (portable row_number() rather than
+    PostgreSQL's DISTINCT ON) so only one row per fuel type is returned.
+    """
+    preference = (
+        EmissionFactor.source.desc(),
+        EmissionFactor.publication_year.desc(),
+    )
+    ranked = (
+        select(
+            EmissionFactor,
+            func.row_number()
+            .over(partition_by=EmissionFactor.fuel_type, order_by=preference)
+            .label("fallback_rank"),
+        )
+        .where(*FALLBACK_FACTOR_CRITERIA, *criteria)
+        .subquery()
+    )
+    ranked_factor = aliased(EmissionFactor, ranked)
+    return (
+        select(ranked_factor)
+        .where(ranked.c.fallback_rank == 1)
+        .order_by(ranked_factor.source.desc(), ranked_factor.publication_year.desc())
+    )
+
+
+BEST_FALLBACK_FACTORS_QUERY = _best_fallback_factors_query()
+BEST_FALLBACK_FACTORS_BY_FUELS_QUERY = _best_fallback_factors_query(
+    EmissionFactor.fuel_type.in_(bindparam("fuel_types", expanding=True))
+)
+LAST_RESORT_FACTOR_QUERY = (
+    select(EmissionFactor)
+    .where(EmissionFactor.is_current == True)
+    .order_by(EmissionFactor.publication_year.desc())
+    .limit(1)
+)
+
+# Process-wide fallback factor ids keyed by (activity_type, fuel_type). Ids
+# are cached rather than rows so each session loads its own instance.
+FALLBACK_FACTOR_CACHE_TTL_SECONDS = 300
+FALLBACK_FACTOR_CACHE_MAX_SIZE = 256
+_fallback_factor_ids: Dict[Tuple[str, Optional[str]], Tuple[float, Any]] = {}
+
+# Unit conversion factors keyed by (from_unit, to_unit) in normalized units
+CONVERSION_FACTORS: Dict[Tuple[str, str], float] = {
+    # Volume conversions
+    ("gallons", "liters"): 3.78541,
+    ("liters", "gallons"): 0.264172,
+    ("gallons", "m3"): 0.00378541,
+    ("m3", "gallons"): 264.172,
+    ("liters", "m3"): 0.001,
+    ("m3", "liters"): 1000.0,
+    # Energy conversions
+    ("mmbtu", "gj"): 1.05506,
+    ("gj", "mmbtu"): 0.947817,
+    ("mmbtu", "mj"): 1055.06,
+    ("mj", "mmbtu"): 0.000947817,
+    ("kwh", "mj"): 3.6,
+    ("mj", "kwh"): 0.277778,
+    ("kwh", "mmbtu"): 0.00341214,
+    ("mmbtu", "kwh"): 293.071,
+    ("therm", "mmbtu"): 0.1,
+    ("mmbtu", "therm"): 10.0,
+    # Mass conversions
+    ("tons", "kg"): 1000.0,
+    ("kg", "tons"): 0.001,
+    ("tons", "lbs"): 2204.62,
+    ("lbs", "tons"): 0.000453592,
+    ("kg", "lbs"): 2.20462,
+    ("lbs", "kg"): 0.453592,
+    ("tonnes", "kg"): 1000.0,
+    ("kg", "tonnes"): 0.001,
+    ("tonnes", "tons"): 1.10231,  # Metric to US tons
+    ("tons", "tonnes"): 0.907185,  # US to metric tons
+    # Distance conversions
+    ("miles", "km"): 1.60934,
+    ("km", "miles"): 0.621371,
+    ("feet", "meters"): 0.3048,
+    ("meters", "feet"): 3.28084,
+    # Area conversions
+    ("acres", "hectares"): 0.404686,
+    ("hectares", "acres"): 2.47105,
+    ("sq_ft", "sq_m"): 0.092903,
+    ("sq_m", "sq_ft"): 10.7639,
+}
+
+# Common spellings of units mapped to their normalized form
+UNIT_MAPPINGS: Dict[str, str] = {
+    "gallon": "gallons",
+    "gal": "gallons",
+    "liter": "liters",
+    "l": "liters",
+    "kilogram": "kg",
+    "kilogramme": "kg",
+    "pound": "lbs",
+    "lb": "lbs",
+    "tonne": "tonnes",
+    "metric_ton": "tonnes",
+    "short_ton": "tons",
+    "ton": "tons",
+    "cubic_meter": "m3",
+    "cubic_metre": "m3",
+    "m^3": "m3",
+    "megajoule": "mj",
+    "gigajoule": "gj",
+    "kilowatt_hour": "kwh",
+    "kw_h": "kwh",
+    "kwhr": "kwh",
+    "million_btu": "mmbtu",
+    "mmbtu/hr": "mmbtu",
+    "kilometer": "km",
+    "kilometre": "km",
+    "mile": "miles",
+    "foot": "feet",
+    "ft": "feet",
+    "meter": "meters",
+    "metre": "meters",
+    "m": "meters",
+    "hectare": "hectares",
+    "ha": "hectares",
+    "acre": "acres",
+    "square_foot": "sq_ft",
+    "sq_foot": "sq_ft",
+    "ft2": "sq_ft",
+    "square_meter": "sq_m",
+    "square_metre": "sq_m",
+    "m2": "sq_m",
+}
+
+
+def _build_conversion_closure(
+    factors: Dict[Tuple[str, str], float],
+) -> Dict[Tuple[str, str], float]:
+    """Extend direct conversion factors to every reachable pair of units"""
+    conversions = dict(factors)
+    steps = {key: 1 for key in factors}
+
+    # Add the reciprocal of any conversion only listed in one direction
+    for (from_unit, to_unit), factor in factors.items():
+        if (to_unit, from_unit) not in conversions:
+            conversions[(to_unit, from_unit)] = 1.0 / factor
+            steps[(to_unit, from_unit)] = 1
+
+    # Floyd-Warshall over the unit graph, preferring the fewest conversion
+    # steps; units are sorted so ties resolve the same way on every run
+    units = sorted({unit for pair in conversions for unit in pair})
+    for via in units:
+        for source in units:
+            if (source, via) not in conversions:
+                continue
+            for target in units:
+                if target == source or (via, target) not in conversions:
+                    continue
+                path_steps = steps[(source, via)] + steps[(via, target)]
+                if path_steps < steps.get((source, target), path_steps + 1):
+                    conversions[(source, target)] = (
+                        conversions[(source, via)] * conversions[(via, target)]
+                    )
+                    steps[(source, target)] = path_steps
+
+    return conversions
+
+
+# Conversion factor for every unit pair reachable through CONVERSION_FACTORS
+FULL_CONVERSIONS = _build_conversion_closure(CONVERSION_FACTORS)
+
+# Base data quality score by declared data quality
+DATA_QUALITY_SCORES = {
+    "measured": 100,
+    "calculated": 80,
+    "estimated": 60,
+    "default": 40,
+}
+
+# Data source keywords that raise or lower an activity's quality score
+HIGH_QUALITY_SOURCE_TOKENS = ("meter", "invoice")
+LOW_QUALITY_SOURCE_TOKENS = ("estimate",)
+
+# Quality bonus by measurement method keyword; the first match applies
+MEASUREMENT_TOKENS = {"continuous": 15, "periodic": 10, "annual": 5}
+
+# Uncertainty percentage by data quality level; unknown levels use 35.0
+UNCERTAINTY_BY_QUALITY = {"measured": 5.0, "calculated": 15.0, "estimated": 30.0}
+
+
+# Benchmark labels by tCO2e per activity; each threshold starts the next label
+INTENSITY_THRESHOLDS = (1.0, 10.0, 50.0)
+INTENSITY_LABELS = ("low", "moderate", "high", "very_high")
+
+# Rating labels by score; each threshold is the minimum for the next label
+QUALITY_RATING_THRESHOLDS = (60, 70, 80, 90)
+QUALITY_RATING_LABELS = ("very_poor", "poor", "fair", "good", "excellent")
+COMPLETENESS_RATING_THRESHOLDS = (70, 85, 95)
+COMPLETENESS_RATING_LABELS = (
+    "incomplete",
+    "partially_complete",
+    "mostly_complete",
+    "complete",
+)
+
+# ActivityData columns returned with a calculation, in response order
+ACTIVITY_DATA_RESPONSE_FIELDS = tuple(ActivityDataResponse.model_fields)
+
+# Recommendations made for every calculation
+STATIC_RECOMMENDATIONS = (
+    # EPA factor availability
+    "✅ Verify EPA emission factors are current - system will automatically use latest available factors",
+    # SEC compliance
+    "🏛️ Ensure all data sources are auditable and documentation is SEC-compliant for climate disclosure requirements",
+)
+
+
+@lru_cache(maxsize=256)
+def _count_recommendations(
+    estimated_count: int,
+    missing_sources: int,
+    missing_locations: int,
+    missing_methods: int,
+    annual_periods: int,
+) -> Tuple[str, ...]:
+    """Recommendations driven by activity counts, memoized by those counts"""
+    recommendations = []
+
+    # Data quality recommendations
+    if estimated_count > 0:
+        recommendations.append(
+            f"🎯 Improve {estimated_count} estimated data points with measured values to increase accuracy by up to 40%"
+        )
+
+    # Data source recommendations
+    if missing_sources > 0:
+        recommendations.append(
+            f"📋 Add data sources for {missing_sources} activity items for better audit trail"
+        )
+
+    # Location specificity
+    if missing_locations > 0:
+        recommendations.append(
+            f"📍 Specify locations for {missing_locations} activities for regional emission factor accuracy"
+        )
+
+    # Measurement method improvements
+    if missing_methods > 0:
+        recommendations.append(
+            f"🔬 Define measurement methods for {missing_methods} activities to improve data quality score"
+        )
+
+    # Time period granularity
+    if annual_periods > 0:
+        recommendations.append(
+            f"📅 Consider breaking down {annual_periods} annual periods into monthly/quarterly data for better accuracy"
+        )
+
+    return tuple(recommendations)
+
+
+@lru_cache(maxsize=256)
+def _closing_recommendations(
+    many_fuel_types: bool, missing_docs: int
+) -> Tuple[str, ...]:
+    """Recommendations that follow the high-impact activities, memoized"""
+    recommendations = []
+
+    # Fuel type diversity
+    if many_fuel_types:
+        recommendations.append(
+            "🔄 Consider consolidating similar fuel types or implementing fuel-specific tracking systems"
+        )
+
+    # Missing documentation
+    if missing_docs > 0:
+        recommendations.append(
+            f"📝 Add documentation/notes for {missing_docs} activities to support audit requirements"
+        )
+
+    return (*recommendations, *STATIC_RECOMMENDATIONS)
+
+
+@dataclass
+class ActivityDataSummary:
+    """Aggregates of a calculation's activity data, gathered in one pass"""
+
+    activity_count: int = 0
+    completed_fields: int = 0
+    weighted_quality_score: float = 0.0
+    quality_weight: float = 0.0
+    estimated_count: int = 0
+    missing_sources: int = 0
+    missing_locations: int = 0
+    missing_methods: int = 0
+    annual_periods: int = 0
+    missing_docs: int = 0
+    fuel_types: Set[str] = field(default_factory=set)
+    locations: Set[str] = field(default_factory=set)
+    data_sources: Set[str] = field(default_factory=set)
+    quality_distribution: Dict[str, int] = field(default_factory=dict)
+    fuel_breakdown: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    top_activities: List[ActivityDataInput] = field(default_factory=list)
+
 
 class Scope1EmissionsCalculator:
     """Service for calculating Scope 1 (direct) GHG emissions"""
 
+    # GWP values for CO2, CH4 and N2O (AR5, 100-year) divided by 1000, so kg
+    # of each gas convert straight to metric tons CO2e
+    _GWP_PER_KG_TO_T = (0.001, 0.028, 0.265)
+
     def __init__(self, db: Session):
         self.db = db
         self.audit_logger = AuditLogger(db)
         self.epa_service = EPACachedService(db)
 
-        # GWP values for GHG gases (AR5, 100-year)
-        self.gwp_values = {
-            "co2": 1.0,
-            "ch4": 28.0,  # Methane
-            "n2o": 265.0,  # Nitrous oxide
-        }
+        # Selected factors by (activity_type, fuel_type), including misses.
+        # Scoped to the calculator, and so to its session, so ORM rows are
+        # never shared across sessions and EPA refreshes apply to new requests.
+        self._factor_cache: Dict[
+            Tuple[str, Optional[str]], Optional[EmissionFactor]
+        ] = {}
+
+        # Database rows of ranked EPA factors by factor code, including misses.
+        # Pairs sharing a fuel type rank the same factor, so load it once.
+        self._factor_rows_by_code: Dict[str, Optional[EmissionFactor]] = {}
+
+        # EPA cache lookups by (source, fuel_type). Tasks rather than results
+        # are kept so concurrent prefetch lookups share one in-flight call.
+        self._epa_factor_lookups: Dict[
+            Tuple[str, Optional[str]], "asyncio.Task[List]"
+        ] = {}
 
     async def calculate_scope1_emissions(
-        self, request: Scope1CalculationRequest, user_id: str
+        self,
+        request: Scope1CalculationRequest,
+        user_id: str,
+        user: Optional[User] = None,
     ) -> EmissionsCalculationResponse:
-        """Calculate Scope 1 emissions from activity data"""
+        """Calculate Scope 1 emissions from activity data
+
+        The already loaded user may be passed to spare the audit log a lookup.
+        """
         try:
             logger.info(f"Starting Scope 1 calculation: {request.calculation_name}")
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
+
+            # Verify company and entity exist before any factor lookups
+            company, entity = self._resolve_company_and_entity(
+                request.company_id, request.entity_id
+            )
+
+            # Resolve every emission factor once for validation and calculation
+            emission_factors = await self._prefetch_emission_factors(
+                request.activity_data
+            )
+
+            # Summarize the activity data once for validation, results and insights
+            activity_summary = self._scan_activities(request.activity_data)
+            data_completeness, data_quality = self._calculate_scores(activity_summary)
 
             # Validate request
-            validation_result = await self._validate_calculation_request(request)
+            validation_result = self._validate_calculation_request(
+                request,
+                emission_factors,
+                activity_summary,
+                data_completeness,
+                data_quality,
+            )
             if not validation_result.is_valid:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Validation failed: {validation_result.errors}",
                 )
 
-            # Verify company and entity exist
-            company = self._verify_company_exists(request.company_id)
-            entity = None
-            if request.entity_id:
-                entity = self._verify_entity_exists(
-                    request.entity_id, request.company_id
-                )
+            # Serialize the request once for storage, encryption and auditing;
+            # JSON mode yields plain strings/numbers every sink can encode as-is
+            request_data = request.model_dump(mode="json")
 
             # Generate unique calculation code
             calculation_code = self._generate_calculation_code(
@@ -87,12 +461,12 @@ class Scope1EmissionsCalculator:
                 try:
                     # Encrypt input data
                     encrypted_input_data = encryption_service.encrypt_data(
-                        request.model_dump(), key_id="calculation_input"
+                        request_data, key_id="calculation_input"
                     )
 
                     # Create data integrity hash
                     data_integrity_hash = encryption_service.hash_sensitive_data(
-                        json.dumps(request.model_dump(), sort_keys=True, default=str)
+                        json.dumps(request_data, sort_keys=True, default=str)
                     )
 
                 except Exception as e:
@@ -103,19 +477,24 @@ class Scope1EmissionsCalculator:
                     if settings.ENVIRONMENT != "development":
                         raise
 
+            # Parse the ids once for the calculation and audit records
+            company_uuid = uuid.UUID(request.company_id)
+            entity_uuid = uuid.UUID(request.entity_id) if request.entity_id else None
+            user_uuid = uuid.UUID(user_id)
+
             # Create calculation record
             calculation = EmissionsCalculation(
                 calculation_name=request.calculation_name,
                 calculation_code=calculation_code,
-                company_id=uuid.UUID(request.company_id),
-                entity_id=uuid.UUID(request.entity_id) if request.entity_id else None,
+                company_id=company_uuid,
+                entity_id=entity_uuid,
                 scope="scope_1",
                 method="fuel_combustion",
                 reporting_period_start=request.reporting_period_start,
                 reporting_period_end=request.reporting_period_end,
                 status="in_progress",
-                calculated_by=uuid.UUID(user_id),
-                input_data=request.model_dump(),  # Keep original for now, will be replaced with encrypted
+                calculated_by=user_uuid,
+                input_data=request_data,  # Keep original for now, will be replaced with encrypted
                 calculation_parameters=request.calculation_parameters or {},
                 emission_factors_used={},  # Initialize as empty dict
                 source_documents=request.source_documents or [],
@@ -127,35 +506,46 @@ class Scope1EmissionsCalculator:
             self.db.flush()  # Get the ID
 
             # Process each activity data item
-            total_co2 = 0.0
-            total_ch4 = 0.0
-            total_n2o = 0.0
-            total_co2e = 0.0
-
+            activity_rows: List[Dict[str, Any]] = []
+            total_co2 = total_ch4 = total_n2o = 0.0
             emission_factors_used = {}
             validation_errors = []
             validation_warnings = []
 
             for activity_input in request.activity_data:
+                emission_factor = emission_factors.get(
+                    (activity_input.activity_type, activity_input.fuel_type)
+                )
+                if emission_factor is None:
+                    error_msg = (
+                        f"Error calculating {activity_input.activity_type}: "
+                        f"No emission factor found for {activity_input.activity_type}"
+                        f" - {activity_input.fuel_type}"
+                    )
+                    validation_errors.append(error_msg)
+                    logger.error(error_msg)
+                    continue
+
                 try:
                     # Calculate emissions for this activity
-                    activity_result = await self._calculate_activity_emissions(
-                        activity_input, calculation.id
+                    activity_row = self._calculate_activity_emissions(
+                        activity_input, calculation.id, emission_factor
                     )
-
-                    # Add to totals
-                    total_co2 += activity_result["co2_emissions"] or 0.0
-                    total_ch4 += activity_result["ch4_emissions"] or 0.0
-                    total_n2o += activity_result["n2o_emissions"] or 0.0
-                    total_co2e += activity_result["co2e_emissions"]
-
-                    # Track emission factors used
-                    emission_factors_used[activity_result["activity_type"]] = {
-                        "factor_id": activity_result["emission_factor_id"],
-                        "factor_value": activity_result["emission_factor_value"],
-                        "factor_source": activity_result["emission_factor_source"],
-                        "factor_unit": activity_result["emission_factor_unit"],
-                    }
+                    activity_rows.append(activity_row)
+                    total_co2 += activity_row["co2_emissions"] or 0.0
+                    total_ch4 += activity_row["ch4_emissions"] or 0.0
+                    total_n2o += activity_row["n2o_emissions"] or 0.0
+
+                    # Track emission factors used, one entry per activity type;
+                    # repeats of a type keep the first factor recorded
+                    if activity_input.activity_type not in emission_factors_used:
+                        emission_factors_used[activity_input.activity_type] = {
+                            "factor_id": str(activity_row["emission_factor_id"]),
+                            "factor_value": activity_row["emission_factor_value"],
+                            "factor_source": activity_row["emission_factor_source"],
+                            "factor_unit": activity_row["emission_factor_unit"],
+                            "factor_year": emission_factor.publication_year,
+                        }
 
                 except Exception as e:
                     error_msg = (
@@ -164,15 +554,17 @@ class Scope1EmissionsCalculator:
                     validation_errors.append(error_msg)
                     logger.error(error_msg)
 
-            # Calculate total CO2e using GWP values
-            calculated_co2e = (
-                total_co2 * self.gwp_values["co2"]
-                + total_ch4 * self.gwp_values["ch4"]
-                + total_n2o * self.gwp_values["n2o"]
-            )
+            # Insert all activity rows in one Core executemany, bypassing the
+            # ORM unit of work; calculation_id is already set from the flush
+            # above and column defaults (id, timestamps) are applied by Core
+            if activity_rows:
+                self.db.execute(ACTIVITY_DATA_INSERT, activity_rows)
 
-            # Convert from kg to metric tons CO2e
-            calculated_co2e_mt = calculated_co2e / 1000.0
+            # Calculate total CO2e in metric tons using GWP values
+            co2_gwp, ch4_gwp, n2o_gwp = self._GWP_PER_KG_TO_T
+            calculated_co2e_mt = (
+                total_co2 * co2_gwp + total_ch4 * ch4_gwp + total_n2o * n2o_gwp
+            )
 
             # Encrypt emission factors used if encryption is enabled
             if settings.ENCRYPT_SENSITIVE_DATA:
@@ -185,7 +577,7 @@ class Scope1EmissionsCalculator:
                     logger.warning(f"Failed to encrypt emission factors: {str(e)}")
 
             # Update calculation with results
-            calculation_duration = (datetime.utcnow() - start_time).total_seconds()
+            calculation_duration = time.perf_counter() - start_time
 
             calculation.total_co2 = total_co2 / 1000.0  # Convert kg to metric tons
             calculation.total_ch4 = total_ch4 / 1000.0  # Convert kg to metric tons
@@ -201,29 +593,33 @@ class Scope1EmissionsCalculator:
                 calculation.status = "failed"
             else:
                 calculation.status = "completed"
-                calculation.data_quality_score = self._calculate_data_quality_score(
-                    request.activity_data
-                )
+                calculation.data_quality_score = data_quality
                 calculation.uncertainty_percentage = self._estimate_uncertainty(
-                    request.activity_data
+                    activity_summary
                 )
 
-            self.db.commit()
-            self.db.refresh(calculation)
+            # Generate calculation insights and store them with the results
+            calculation.calculation_insights = self._generate_calculation_insights(
+                activity_summary,
+                calculated_co2e_mt,
+                emission_factors_used,
+                data_completeness,
+                data_quality,
+            )
 
-            # Create audit trail entry
+            # Create audit trail entry, committed together with the results
             self._create_audit_trail_entry(
                 calculation.id,
                 "calculation_completed",
                 f"Scope 1 calculation completed: {calculated_co2e_mt:.2f} tCO2e",
-                user_id,
+                user_uuid,
             )
 
-            # Log calculation for audit
+            # Log calculation for audit in the same transaction
             self.audit_logger.log_calculation_event(
-                user=self._get_user_by_id(user_id),
+                user=user if user is not None else self._get_user_by_id(user_id),
                 calculation_type="scope_1",
-                input_data=request.dict(),
+                input_data=request_data,
                 output_data={
                     "total_co2e": calculated_co2e_mt,
                     "total_co2": total_co2,
@@ -232,23 +628,21 @@ class Scope1EmissionsCalculator:
                 },
                 emission_factors_used=emission_factors_used,
                 processing_time_ms=int(calculation_duration * 1000),
+                commit=False,
             )
 
+            # Flush the results first; server-side timestamps come back with
+            # the write (eager_defaults), so the response is built from memory
+            # and nothing needs reloading after the commit expires the row
+            self.db.flush()
+            response = self._build_calculation_response(calculation, activity_rows)
+            self.db.commit()
+
             logger.info(
                 f"Scope 1 calculation completed: {calculation_code}, {calculated_co2e_mt:.2f} tCO2e"
             )
 
-            # Return response
-            # Generate calculation insights
-            calculation_insights = self._generate_calculation_insights(
-                request.activity_data, calculated_co2e_mt, emission_factors_used
-            )
-
-            # Store insights in calculation
-            calculation.calculation_insights = calculation_insights
-            self.db.commit()
-
-            return self._build_calculation_response(calculation)
+            return response
 
         except HTTPException:
             raise
@@ -260,46 +654,32 @@ class Scope1EmissionsCalculator:
                 detail=f"Calculation failed: {str(e)}",
             )
 
-    async def _calculate_activity_emissions(
-        self, activity_input: ActivityDataInput, calculation_id: uuid.UUID
+    def _calculate_activity_emissions(
+        self,
+        activity_input: ActivityDataInput,
+        calculation_id: uuid.UUID,
+        emission_factor: EmissionFactor,
     ) -> Dict[str, Any]:
         """Calculate emissions for a single activity"""
 
-        # Get appropriate emission factor
-        emission_factor = await self._get_emission_factor(
-            activity_input.activity_type, activity_input.fuel_type
-        )
-
-        if not emission_factor:
-            raise ValueError(
-                f"No emission factor found for {activity_input.activity_type} - {activity_input.fuel_type}"
-            )
-
         # Convert units if necessary
         converted_quantity = self._convert_units(
             activity_input.quantity, activity_input.unit, emission_factor.unit
         )
 
-        # Calculate emissions
-        co2_emissions = (
-            converted_quantity * emission_factor.co2_factor
-            if emission_factor.co2_factor
-            else None
-        )
-        ch4_emissions = (
-            converted_quantity * emission_factor.ch4_factor
-            if emission_factor.ch4_factor
-            else None
-        )
-        n2o_emissions = (
-            converted_quantity * emission_factor.n2o_factor
-            if emission_factor.n2o_factor
-            else None
-        )
+        # Calculate emissions, reading each factor column once
+        co2_factor = emission_factor.co2_factor
+        ch4_factor = emission_factor.ch4_factor
+        n2o_factor = emission_factor.n2o_factor
+        co2_emissions = converted_quantity * co2_factor if co2_factor else None
+        ch4_emissions = converted_quantity * ch4_factor if ch4_factor else None
+        n2o_emissions = converted_quantity * n2o_factor if n2o_factor else None
         co2e_emissions = converted_quantity * emission_factor.co2e_factor
 
-        # Create activity data record
-        activity_data = ActivityData(
+        # Build the activity data row; the caller inserts rows in bulk. The id
+        # is assigned here so the row can also back the response directly
+        return dict(
+            id=str(uuid.uuid4()),
             calculation_id=calculation_id,
             activity_type=activity_input.activity_type,
             fuel_type=activity_input.fuel_type,
@@ -324,27 +704,107 @@ class Scope1EmissionsCalculator:
             additional_data=activity_input.additional_data,
         )
 
-        self.db.add(activity_data)
-
-        return {
-            "activity_type": activity_input.activity_type,
-            "co2_emissions": co2_emissions,
-            "ch4_emissions": ch4_emissions,
-            "n2o_emissions": n2o_emissions,
-            "co2e_emissions": co2e_emissions,
-            "emission_factor_id": str(emission_factor.id),
-            "emission_factor_value": emission_factor.co2e_factor,
-            "emission_factor_source": emission_factor.source,
-            "emission_factor_unit": emission_factor.unit,
+    async def _prefetch_emission_factors(
+        self, activity_data: List[ActivityDataInput]
+    ) -> Dict[Tuple[str, Optional[str]], Optional[EmissionFactor]]:
+        """Resolve the emission factor of each distinct activity/fuel pair once"""
+        pairs = {
+            (activity.activity_type, activity.fuel_type) for activity in activity_data
         }
+        if not pairs:
+            return {}
+
+        # Overlap the EPA cache lookups of different pairs, bounded so a large
+        # request cannot flood the cache service
+        semaphore = asyncio.Semaphore(FACTOR_LOOKUP_CONCURRENCY)
+
+        async def lookup(pair: Tuple[str, Optional[str]]):
+            async with semaphore:
+                return await self._get_emission_factor(*pair, use_fallback=False)
+
+        pairs = list(pairs)
+        factors = dict(zip(pairs, await asyncio.gather(*map(lookup, pairs))))
+
+        # Only pairs the EPA sources could not resolve fall back to the
+        # database: recently selected fallbacks by id, the rest with the
+        # fallback factors of their fuel types loaded in one query
+        unresolved = []
+        for pair in (pair for pair, factor in factors.items() if factor is None):
+            factor = self._get_cached_fallback_factor(pair)
+            if factor is None:
+                unresolved.append(pair)
+            else:
+                self._factor_cache[pair] = factor
+                factors[pair] = factor
+
+        if unresolved:
+            fallback_factors = self._query_fallback_factors(
+                {fuel_type for _, fuel_type in unresolved}
+            )
+            for pair in unresolved:
+                factor = await self._fallback_factor_selection(*pair, fallback_factors)
+                self._factor_cache[pair] = factor
+                factors[pair] = factor
+
+        return factors
+
+    def _query_fallback_factors(
+        self, fuel_types: Set[Optional[str]]
+    ) -> Dict[Optional[str], EmissionFactor]:
+        """Load the preferred fallback factor of several fuel types in one query"""
+        try:
+            # A missing fuel type matches any factor, so only narrow the query
+            # when every activity names its fuel
+            if None in fuel_types:
+                factors = self.db.scalars(BEST_FALLBACK_FACTORS_QUERY)
+            else:
+                factors = self.db.scalars(
+                    BEST_FALLBACK_FACTORS_BY_FUELS_QUERY,
+                    {"fuel_types": list(fuel_types)},
+                )
+
+            # Same preference as _fallback_factor_selection; rows arrive one
+            # per fuel type, best first, so the first row also serves None
+            best_factors = {}
+            for factor in factors:
+                if None in fuel_types:
+                    best_factors.setdefault(None, factor)
+                if factor.fuel_type in fuel_types:
+                    best_factors.setdefault(factor.fuel_type, factor)
+
+            return best_factors
+
+        except Exception as e:
+            logger.error(f"Error loading fallback factors: {str(e)}")
+            return {}
 
     async def _get_emission_factor(
-        self, activity_type: str, fuel_type: Optional[str]
+        self,
+        activity_type: str,
+        fuel_type: Optional[str],
+        fallback_factors: Optional[Dict[Optional[str], EmissionFactor]] = None,
+        use_fallback: bool = True,
     ) -> Optional[EmissionFactor]:
-        """Get appropriate EPA emission factor for activity using intelligent selection"""
+        """Get appropriate EPA emission factor for activity using intelligent selection
+
+        With ``use_fallback=False`` only the EPA sources are consulted, and a
+        miss is not remembered so the database fallback can still resolve it.
+        """
+        cache_key = (activity_type, fuel_type)
+        if cache_key in self._factor_cache:
+            return self._factor_cache[cache_key]
+
         try:
             # Use the enhanced factor selection method
-            return await self._select_best_emission_factor(activity_type, fuel_type)
+            factor = await self._select_best_emission_factor(
+                activity_type,
+                fuel_type,
+                fallback_factors=fallback_factors,
+                use_fallback=use_fallback,
+            )
+            if factor is not None or use_fallback:
+                self._factor_cache[cache_key] = factor
+            return factor
 
         except Exception as e:
             logger.error(f"Error getting emission factor: {str(e)}")
@@ -355,6 +815,8 @@ class Scope1EmissionsCalculator:
         activity_type: str,
         fuel_type: Optional[str],
         location: Optional[str] = None,
+        fallback_factors: Optional[Dict[Optional[str], EmissionFactor]] = None,
+        use_fallback: bool = True,
     ) -> Optional[EmissionFactor]:
         """Intelligently select the best EPA emission factor for the activity"""
 
@@ -378,9 +840,7 @@ class Scope1EmissionsCalculator:
         for source in sources_to_try:
             try:
                 # Get factors from cached service
-                factors = await self.epa_service.get_emission_factors(
-                    source=source, category="fuel_combustion", fuel_type=fuel_type
-                )
+                factors = await self._get_epa_factors(source, fuel_type)
 
                 if factors:
                     # Find the best matching factor
@@ -389,13 +849,7 @@ class Scope1EmissionsCalculator:
                     )
                     if best_factor:
                         # Convert to database model
-                        db_factor = (
-                            self.db.query(EmissionFactor)
-                            .filter(
-                                EmissionFactor.factor_code == best_factor.factor_code
-                            )
-                            .first()
-                        )
+                        db_factor = self._get_factor_row(best_factor.factor_code)
 
                         if db_factor:
                             logger.info(
@@ -407,8 +861,34 @@ class Scope1EmissionsCalculator:
                 logger.warning(f"Error getting factors from {source}: {str(e)}")
                 continue
 
+        if not use_fallback:
+            return None
+
         # Fallback to direct database query with intelligent selection
-        return await self._fallback_factor_selection(activity_type, fuel_type)
+        return await self._fallback_factor_selection(
+            activity_type, fuel_type, fallback_factors
+        )
+
+    async def _get_epa_factors(self, source: str, fuel_type: Optional[str]) -> List:
+        """Get a source's fuel combustion factors, at most once per calculator"""
+        lookup_key = (source, fuel_type)
+        lookup = self._epa_factor_lookups.get(lookup_key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(
+                self.epa_service.get_emission_factors(
+                    source=source, category="fuel_combustion", fuel_type=fuel_type
+                )
+            )
+            self._epa_factor_lookups[lookup_key] = lookup
+        return await lookup
+
+    def _get_factor_row(self, factor_code: str) -> Optional[EmissionFactor]:
+        """Load an emission factor row by code, at most once per calculator"""
+        if factor_code not in self._factor_rows_by_code:
+            self._factor_rows_by_code[factor_code] = self.db.scalars(
+                FACTOR_BY_CODE_QUERY, {"factor_code": factor_code}
+            ).first()
+        return self._factor_rows_by_code[factor_code]
 
     def _rank_emission_factors(
         self, factors: List, activity_type: str, fuel_type: Optional[str]
@@ -417,76 +897,77 @@ class Scope1EmissionsCalculator:
         if not factors:
             return None
 
-        # Score factors based on multiple criteria
-        scored_factors = []
+        # Score factors based on multiple criteria, keeping the first factor
+        # with the highest score
+        best_factor = None
+        best_score = None
+        current_year = datetime.now().year
 
         for factor in factors:
             score = 0
 
             # Exact fuel type match gets highest score
-            if (
-                fuel_type
-                and hasattr(factor, "fuel_type")
-                and factor.fuel_type == fuel_type
-            ):
+            if fuel_type and getattr(factor, "fuel_type", None) == fuel_type:
                 score += 100
 
             # Recent publication year gets higher score
-            if hasattr(factor, "publication_year") and factor.publication_year:
-                current_year = datetime.now().year
-                year_diff = current_year - factor.publication_year
+            publication_year = getattr(factor, "publication_year", None)
+            if publication_year:
+                year_diff = current_year - publication_year
                 score += max(0, 50 - year_diff)  # Newer factors get higher scores
 
             # EPA GHGRP source gets preference
-            if hasattr(factor, "source") and factor.source == "EPA_GHGRP":
+            if getattr(factor, "source", None) == "EPA_GHGRP":
                 score += 25
 
             # Higher CO2e factor values might indicate more comprehensive data
-            if hasattr(factor, "co2e_factor") and factor.co2e_factor:
-                if factor.co2e_factor > 0:
-                    score += 10
+            co2e_factor = getattr(factor, "co2e_factor", None)
+            if co2e_factor and co2e_factor > 0:
+                score += 10
 
-            scored_factors.append((factor, score))
+            if best_score is None or score > best_score:
+                best_factor, best_score = factor, score
 
-        # Sort by score (highest first) and return the best factor
-        scored_factors.sort(key=lambda x: x[1], reverse=True)
-        return scored_factors[0][0] if scored_factors else None
+        return best_factor
 
     async def _fallback_factor_selection(
-        self, activity_type: str, fuel_type: Optional[str]
+        self,
+        activity_type: str,
+        fuel_type: Optional[str],
+        fallback_factors: Optional[Dict[Optional[str], EmissionFactor]] = None,
     ) -> Optional[EmissionFactor]:
         """Fallback method for factor selection using database query"""
+        cache_key = (activity_type, fuel_type)
         try:
-            query = self.db.query(EmissionFactor).filter(
-                EmissionFactor.is_current == True,
-                EmissionFactor.category.in_(["fuel_combustion", "fuel", "combustion"]),
-            )
-
-            if fuel_type:
-                query = query.filter(EmissionFactor.fuel_type == fuel_type)
-
-            # Order by preference: EPA_GHGRP first, then by publication year
-            factors = query.order_by(
-                EmissionFactor.source.desc(),  # EPA_GHGRP comes first alphabetically
-                EmissionFactor.publication_year.desc(),
-            ).all()
+            if fallback_factors is not None:
+                # Already loaded in bulk by _query_fallback_factors, for pairs
+                # the process-wide cache did not hold
+                factor = fallback_factors.get(fuel_type)
+            else:
+                factor = self._get_cached_fallback_factor(cache_key)
+                if factor is not None:
+                    return factor
+
+                if fuel_type:
+                    factor = self.db.scalars(
+                        FALLBACK_FACTOR_BY_FUEL_QUERY, {"fuel_type": fuel_type}
+                    ).first()
+                else:
+                    factor = self.db.scalars(FALLBACK_FACTOR_QUERY).first()
 
-            if factors:
-                logger.info(f"Using fallback factor: {factors[0].factor_code}")
-                return factors[0]
+            if factor:
+                logger.info(f"Using fallback factor: {factor.factor_code}")
+                self._remember_fallback_factor(cache_key, factor)
+                return factor
 
             # Last resort: any current factor
-            fallback_factor = (
-                self.db.query(EmissionFactor)
-                .filter(EmissionFactor.is_current == True)
-                .order_by(EmissionFactor.publication_year.desc())
-                .first()
-            )
+            fallback_factor = self.db.scalars(LAST_RESORT_FACTOR_QUERY).first()
 
             if fallback_factor:
                 logger.warning(
                     f"Using last resort factor: {fallback_factor.factor_code}"
                 )
+                self._remember_fallback_factor(cache_key, fallback_factor)
 
             return fallback_factor
 
@@ -494,92 +975,76 @@ class Scope1EmissionsCalculator:
             logger.error(f"Error in fallback factor selection: {str(e)}")
             return None
 
+    def _get_cached_fallback_factor(
+        self, cache_key: Tuple[str, Optional[str]]
+    ) -> Optional[EmissionFactor]:
+        """Load a recently selected fallback factor by id, if still current"""
+        entry = _fallback_factor_ids.get(cache_key)
+        if entry is None:
+            return None
+
+        expires_at, factor_id = entry
+        if expires_at <= time.monotonic():
+            _fallback_factor_ids.pop(cache_key, None)
+            return None
+
+        factor = self.db.get(EmissionFactor, factor_id)
+        if factor is None or not factor.is_current:
+            # Superseded by an EPA refresh since it was cached
+            _fallback_factor_ids.pop(cache_key, None)
+            return None
+        return factor
+
+    @staticmethod
+    def _remember_fallback_factor(
+        cache_key: Tuple[str, Optional[str]], factor: EmissionFactor
+    ) -> None:
+        """Cache the id of a selected fallback factor for later requests"""
+        if (
+            cache_key not in _fallback_factor_ids
+            and len(_fallback_factor_ids) >= FALLBACK_FACTOR_CACHE_MAX_SIZE
+        ):
+            # Evict the oldest entry (dicts keep insertion order)
+            _fallback_factor_ids.pop(next(iter(_fallback_factor_ids)))
+        _fallback_factor_ids[cache_key] = (
+            time.monotonic() + FALLBACK_FACTOR_CACHE_TTL_SECONDS,
+            factor.id,
+        )
+
     def _convert_units(self, quantity: float, from_unit: str, to_unit: str) -> float:
         """Enhanced unit conversion for emission factor calculations"""
+        conversion_factor = self._conversion_factor(from_unit, to_unit)
+        if conversion_factor is None:
+            # If no conversion found, log warning and return original
+            logger.warning(
+                f"No unit conversion found for {from_unit} to {to_unit}, using original quantity"
+            )
+            return quantity
 
+        converted_value = quantity * conversion_factor
+        logger.debug(
+            "Converted %s %s to %s %s", quantity, from_unit, converted_value, to_unit
+        )
+        return converted_value
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _conversion_factor(cls, from_unit: str, to_unit: str) -> Optional[float]:
+        """Multiplier from one unit to another as given, or None if unknown"""
         # Normalize unit strings
-        from_unit_norm = self._normalize_unit(from_unit)
-        to_unit_norm = self._normalize_unit(to_unit)
+        from_unit_norm = cls._normalize_unit(from_unit)
+        to_unit_norm = cls._normalize_unit(to_unit)
 
         # If units are the same, no conversion needed
         if from_unit_norm == to_unit_norm:
-            return quantity
-
-        # Comprehensive conversion factors
-        conversion_factors = {
-            # Volume conversions
-            ("gallons", "liters"): 3.78541,
-            ("liters", "gallons"): 0.264172,
-            ("gallons", "m3"): 0.00378541,
-            ("m3", "gallons"): 264.172,
-            ("liters", "m3"): 0.001,
-            ("m3", "liters"): 1000.0,
-            # Energy conversions
-            ("mmbtu", "gj"): 1.05506,
-            ("gj", "mmbtu"): 0.947817,
-            ("mmbtu", "mj"): 1055.06,
-            ("mj", "mmbtu"): 0.000947817,
-            ("kwh", "mj"): 3.6,
-            ("mj", "kwh"): 0.277778,
-            ("kwh", "mmbtu"): 0.00341214,
-            ("mmbtu", "kwh"): 293.071,
-            ("therm", "mmbtu"): 0.1,
-            ("mmbtu", "therm"): 10.0,
-            # Mass conversions
-            ("tons", "kg"): 1000.0,
-            ("kg", "tons"): 0.001,
-            ("tons", "lbs"): 2204.62,
-            ("lbs", "tons"): 0.000453592,
-            ("kg", "lbs"): 2.20462,
-            ("lbs", "kg"): 0.453592,
-            ("tonnes", "kg"): 1000.0,
-            ("kg", "tonnes"): 0.001,
-            ("tonnes", "tons"): 1.10231,  # Metric to US tons
-            ("tons", "tonnes"): 0.907185,  # US to metric tons
-            # Distance conversions
-            ("miles", "km"): 1.60934,
-            ("km", "miles"): 0.621371,
-            ("feet", "meters"): 0.3048,
-            ("meters", "feet"): 3.28084,
-            # Area conversions
-            ("acres", "hectares"): 0.404686,
-            ("hectares", "acres"): 2.47105,
-            ("sq_ft", "sq_m"): 0.092903,
-            ("sq_m", "sq_ft"): 10.7639,
-        }
+            return 1.0
 
-        # Look for direct conversion
-        conversion_key = (from_unit_norm, to_unit_norm)
-        if conversion_key in conversion_factors:
-            converted_value = quantity * conversion_factors[conversion_key]
-            logger.debug(
-                f"Converted {quantity} {from_unit} to {converted_value} {to_unit}"
-            )
-            return converted_value
-
-        # Try reverse conversion
-        reverse_key = (to_unit_norm, from_unit_norm)
-        if reverse_key in conversion_factors:
-            converted_value = quantity / conversion_factors[reverse_key]
-            logger.debug(
-                f"Converted {quantity} {from_unit} to {converted_value} {to_unit} (reverse)"
-            )
-            return converted_value
+        # Direct and multi-step conversions are all precomputed
+        return FULL_CONVERSIONS.get((from_unit_norm, to_unit_norm))
 
-        # Check for multi-step conversions (e.g., gallons -> liters -> m3)
-        converted_value = self._try_multi_step_conversion(
-            quantity, from_unit_norm, to_unit_norm, conversion_factors
-        )
-        if converted_value is not None:
-            return converted_value
-
-        # If no conversion found, log warning and return original
-        logger.warning(
-            f"No unit conversion found for {from_unit} to {to_unit}, using original quantity"
-        )
-        return quantity
-
-    def _normalize_unit(self, unit: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_unit(unit: str) -> str:
         """Normalize unit strings for consistent matching"""
         if not unit:
             return ""
@@ -588,113 +1053,22 @@ class Scope1EmissionsCalculator:
         normalized = unit.lower().strip()
 
         # Handle common unit variations
-        unit_mappings = {
-            "gallon": "gallons",
-            "gal": "gallons",
-            "liter": "liters",
-            "l": "liters",
-            "kilogram": "kg",
-            "kilogramme": "kg",
-            "pound": "lbs",
-            "lb": "lbs",
-            "tonne": "tonnes",
-            "metric_ton": "tonnes",
-            "short_ton": "tons",
-            "ton": "tons",
-            "cubic_meter": "m3",
-            "cubic_metre": "m3",
-            "m^3": "m3",
-            "megajoule": "mj",
-            "gigajoule": "gj",
-            "kilowatt_hour": "kwh",
-            "kw_h": "kwh",
-            "kwhr": "kwh",
-            "million_btu": "mmbtu",
-            "mmbtu/hr": "mmbtu",
-            "kilometer": "km",
-            "kilometre": "km",
-            "mile": "miles",
-            "foot": "feet",
-            "ft": "feet",
-            "meter": "meters",
-            "metre": "meters",
-            "m": "meters",
-            "hectare": "hectares",
-            "ha": "hectares",
-            "acre": "acres",
-            "square_foot": "sq_ft",
-            "sq_foot": "sq_ft",
-            "ft2": "sq_ft",
-            "square_meter": "sq_m",
-            "square_metre": "sq_m",
-            "m2": "sq_m",
-        }
-
-        return unit_mappings.get(normalized, normalized)
+        return UNIT_MAPPINGS.get(normalized, normalized)
 
-    def _try_multi_step_conversion(
+    def _validate_calculation_request(
         self,
-        quantity: float,
-        from_unit: str,
-        to_unit: str,
-        conversion_factors: Dict[Tuple[str, str], float],
-    ) -> Optional[float]:
-        """Try to find a multi-step conversion path"""
-
-        # Define common intermediate units for different categories
-        intermediate_units = {
-            "volume": ["liters", "m3"],
-            "energy": ["mj", "gj"],
-            "mass": ["kg"],
-            "distance": ["meters"],
-            "area": ["sq_m"],
-        }
-
-        # Try each category of intermediate units
-        for category, intermediates in intermediate_units.items():
-            for intermediate in intermediates:
-                # Try: from_unit -> intermediate -> to_unit
-                step1_key = (from_unit, intermediate)
-                step2_key = (intermediate, to_unit)
-
-                if step1_key in conversion_factors and step2_key in conversion_factors:
-                    intermediate_value = quantity * conversion_factors[step1_key]
-                    final_value = intermediate_value * conversion_factors[step2_key]
-                    logger.debug(
-                        f"Multi-step conversion: {quantity} {from_unit} -> {intermediate_value} {intermediate} -> {final_value} {to_unit}"
-                    )
-                    return final_value
-
-        return None
-
-    async def _validate_calculation_request(
-        self, request: Scope1CalculationRequest
+        request: Scope1CalculationRequest,
+        emission_factors: Dict[Tuple[str, Optional[str]], Optional[EmissionFactor]],
+        activity_summary: ActivityDataSummary,
+        data_completeness: float,
+        data_quality: float,
     ) -> CalculationValidationResult:
         """Validate calculation request"""
         errors = []
         warnings = []
 
-        # Check if company exists
-        company = (
-            self.db.query(Company).filter(Company.id == request.company_id).first()
-        )
-        if not company:
-            errors.append(f"Company {request.company_id} not found")
-
-        # Check entity if provided
-        if request.entity_id:
-            entity = (
-                self.db.query(CompanyEntity)
-                .filter(
-                    CompanyEntity.id == request.entity_id,
-                    CompanyEntity.company_id == request.company_id,
-                )
-                .first()
-            )
-            if not entity:
-                errors.append(
-                    f"Entity {request.entity_id} not found for company {request.company_id}"
-                )
+        # Only in-memory checks: company and entity existence is verified once
+        # by the calculation, and factor lookups were already prefetched
 
         # Validate activity data
         if not request.activity_data:
@@ -708,18 +1082,12 @@ class Scope1EmissionsCalculator:
                 errors.append(f"Activity {i+1}: Unit is required")
 
             # Check if emission factor exists for this activity
-            factor = await self._get_emission_factor(
-                activity.activity_type, activity.fuel_type
-            )
+            factor = emission_factors.get((activity.activity_type, activity.fuel_type))
             if not factor:
                 warnings.append(
                     f"Activity {i+1}: No emission factor found for {activity.activity_type} - {activity.fuel_type}"
                 )
 
-        # Calculate scores
-        data_completeness = self._calculate_data_completeness(request.activity_data)
-        data_quality = self._calculate_data_quality_score(request.activity_data)
-
         return CalculationValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
@@ -727,233 +1095,245 @@ class Scope1EmissionsCalculator:
             data_completeness_score=data_completeness,
             data_quality_score=data_quality,
             calculation_accuracy_score=85.0,  # Base score, would be calculated based on factors
-            recommendations=self._generate_recommendations(request.activity_data),
+            recommendations=self._generate_recommendations(activity_summary),
         )
 
-    def _calculate_data_completeness(
+    def _scan_activities(
         self, activity_data: List[ActivityDataInput]
-    ) -> float:
-        """Calculate data completeness score"""
-        total_fields = 0
+    ) -> ActivityDataSummary:
+        """Gather every aggregate the scoring and insight helpers need in one pass"""
+        # Accumulate into locals and build the summary once at the end
         completed_fields = 0
+        weighted_quality_score = 0.0
+        quality_weight = 0.0
+        estimated_count = 0
+        missing_sources = 0
+        missing_locations = 0
+        missing_methods = 0
+        annual_periods = 0
+        missing_docs = 0
+        fuel_types: Set[str] = set()
+        locations: Set[str] = set()
+        data_sources: Set[str] = set()
+        quality_distribution: Dict[str, int] = {}
+        fuel_breakdown: Dict[str, Dict[str, float]] = {}
+        score_activity_quality = self._score_activity_quality
 
         for activity in activity_data:
-            total_fields += 8  # Number of key fields
-
-            if activity.quantity:
-                completed_fields += 1
-            if activity.unit:
-                completed_fields += 1
-            if activity.activity_type:
-                completed_fields += 1
-            if activity.fuel_type:
-                completed_fields += 1
-            if activity.location:
-                completed_fields += 1
-            if activity.data_source:
-                completed_fields += 1
-            if activity.data_quality:
-                completed_fields += 1
-            if activity.measurement_method:
-                completed_fields += 1
-
-        return (completed_fields / total_fields) * 100 if total_fields > 0 else 0
-
-    def _calculate_data_quality_score(
-        self, activity_data: List[ActivityDataInput]
-    ) -> float:
-        """Enhanced data quality score calculation"""
-        if not activity_data:
-            return 0.0
-
-        total_weighted_score = 0.0
-        total_weight = 0.0
-
-        for activity in activity_data:
-            # Base quality score
-            quality_scores = {
-                "measured": 100,
-                "calculated": 80,
-                "estimated": 60,
-                "default": 40,
-            }
-
-            base_score = quality_scores.get(activity.data_quality or "estimated", 40)
-
-            # Apply modifiers based on data completeness
-            modifiers = 0
-
-            # Data source modifier
-            if activity.data_source:
-                if (
-                    "meter" in activity.data_source.lower()
-                    or "invoice" in activity.data_source.lower()
-                ):
-                    modifiers += 10  # High-quality sources
-                elif "estimate" in activity.data_source.lower():
-                    modifiers -= 10  # Lower quality
-
-            # Location specificity modifier
-            if activity.location:
-                if len(activity.location) > 10:  # Detailed location
-                    modifiers += 5
-                else:
-                    modifiers += 2  # Basic location
-
-            # Measurement method modifier
-            if activity.measurement_method:
-                if "continuous" in activity.measurement_method.lower():
-                    modifiers += 15
-                elif "periodic" in activity.measurement_method.lower():
-                    modifiers += 10
-                elif "annual" in activity.measurement_method.lower():
-                    modifiers += 5
-
-            # Time period specificity
-            if activity.activity_period_start and activity.activity_period_end:
-                period_days = (
-                    activity.activity_period_end - activity.activity_period_start
-                ).days
-                if period_days <= 31:  # Monthly or better
-                    modifiers += 10
-                elif period_days <= 92:  # Quarterly
-                    modifiers += 5
-
-            # Calculate final score for this activity
-            final_score = min(100, max(0, base_score + modifiers))
-
-            # Weight by quantity (larger activities have more impact on overall score)
-            weight = activity.quantity if activity.quantity > 0 else 1.0
-            total_weighted_score += final_score * weight
-            total_weight += weight
-
-        return total_weighted_score / total_weight if total_weight > 0 else 50.0
-
-    def _estimate_uncertainty(self, activity_data: List[ActivityDataInput]) -> float:
-        """Estimate uncertainty percentage for the calculation"""
-        # Simplified uncertainty estimation
-        uncertainty_by_quality = {
-            "measured": 5.0,
-            "calculated": 15.0,
-            "estimated": 30.0,
-        }
+            quantity = activity.quantity
+            fuel_type = activity.fuel_type
+            location = activity.location
+            data_source = activity.data_source
+            data_quality = activity.data_quality
+            measurement_method = activity.measurement_method
+            period_start = activity.activity_period_start
+            period_end = activity.activity_period_end
+            period_days = (
+                (period_end - period_start).days
+                if period_start and period_end
+                else None
+            )
 
-        total_uncertainty = 0
-        count = 0
+            # Data completeness: number of key fields provided (8 per activity)
+            completed_fields += (
+                bool(quantity)
+                + bool(activity.unit)
+                + bool(activity.activity_type)
+                + bool(fuel_type)
+                + bool(location)
+                + bool(data_source)
+                + bool(data_quality)
+                + bool(measurement_method)
+            )
 
-        for activity in activity_data:
-            quality = activity.data_quality or "estimated"
-            total_uncertainty += uncertainty_by_quality.get(quality, 35.0)
-            count += 1
+            # Data quality, weighted by quantity (larger activities have more
+            # impact on the overall score)
+            weight = quantity if quantity > 0 else 1.0
+            weighted_quality_score += (
+                score_activity_quality(activity, period_days) * weight
+            )
+            quality_weight += weight
 
-        return total_uncertainty / count if count > 0 else 25.0
+            quality = data_quality or "estimated"
+            quality_distribution[quality] = quality_distribution.get(quality, 0) + 1
 
-    def _generate_recommendations(
-        self, activity_data: List[ActivityDataInput]
-    ) -> List[str]:
-        """Generate comprehensive recommendations for improving data quality and accuracy"""
-        recommendations = []
+            # Recommendation counters
+            if data_quality == "estimated":
+                estimated_count += 1
+            if not data_source:
+                missing_sources += 1
+            else:
+                data_sources.add(data_source)
+            if not location:
+                missing_locations += 1
+            else:
+                locations.add(location)
+            if not measurement_method:
+                missing_methods += 1
+            if period_days is not None and period_days > 365:
+                annual_periods += 1
+            if not activity.notes and not activity.additional_data:
+                missing_docs += 1
+            if fuel_type:
+                fuel_types.add(fuel_type)
 
-        # Data quality recommendations
-        estimated_count = sum(
-            1 for activity in activity_data if activity.data_quality == "estimated"
+            # Emissions breakdown by fuel type
+            fuel_key = fuel_type or "unknown"
+            breakdown = fuel_breakdown.get(fuel_key)
+            if breakdown is None:
+                breakdown = fuel_breakdown[fuel_key] = {
+                    "activity_count": 0,
+                    "total_quantity": 0,
+                    "estimated_co2e": 0,
+                }
+            breakdown["activity_count"] += 1
+            breakdown["total_quantity"] += quantity
+            # Rough estimate - would be more accurate with actual calculation results
+            breakdown["estimated_co2e"] += quantity * 0.05  # Placeholder
+
+        return ActivityDataSummary(
+            activity_count=len(activity_data),
+            completed_fields=completed_fields,
+            weighted_quality_score=weighted_quality_score,
+            quality_weight=quality_weight,
+            estimated_count=estimated_count,
+            missing_sources=missing_sources,
+            missing_locations=missing_locations,
+            missing_methods=missing_methods,
+            annual_periods=annual_periods,
+            missing_docs=missing_docs,
+            fuel_types=fuel_types,
+            locations=locations,
+            data_sources=data_sources,
+            quality_distribution=quality_distribution,
+            fuel_breakdown=fuel_breakdown,
+            # Top 3 largest activities, without a full sort
+            top_activities=nlargest(3, activity_data, key=attrgetter("quantity")),
         )
-        if estimated_count > 0:
-            recommendations.append(
-                f"🎯 Improve {estimated_count} estimated data points with measured values to increase accuracy by up to 40%"
-            )
 
-        # Data source recommendations
-        missing_sources = sum(
-            1 for activity in activity_data if not activity.data_source
+    def _calculate_scores(
+        self, activity_summary: ActivityDataSummary
+    ) -> Tuple[float, float]:
+        """Calculate data completeness and data quality scores"""
+        return (
+            self._calculate_data_completeness(activity_summary),
+            self._calculate_data_quality_score(activity_summary),
         )
-        if missing_sources > 0:
-            recommendations.append(
-                f"📋 Add data sources for {missing_sources} activity items for better audit trail"
-            )
 
-        # Location specificity
-        missing_locations = sum(
-            1 for activity in activity_data if not activity.location
+    def _calculate_data_completeness(
+        self, activity_summary: ActivityDataSummary
+    ) -> float:
+        """Calculate data completeness score"""
+        total_fields = activity_summary.activity_count * 8  # Number of key fields
+        return (
+            (activity_summary.completed_fields / total_fields) * 100
+            if total_fields > 0
+            else 0
         )
-        if missing_locations > 0:
-            recommendations.append(
-                f"📍 Specify locations for {missing_locations} activities for regional emission factor accuracy"
-            )
 
-        # Measurement method improvements
-        missing_methods = sum(
-            1 for activity in activity_data if not activity.measurement_method
-        )
-        if missing_methods > 0:
-            recommendations.append(
-                f"🔬 Define measurement methods for {missing_methods} activities to improve data quality score"
-            )
+    def _calculate_data_quality_score(
+        self, activity_summary: ActivityDataSummary
+    ) -> float:
+        """Enhanced data quality score calculation"""
+        if not activity_summary.activity_count:
+            return 0.0
 
-        # Time period granularity
-        annual_periods = sum(
-            1
-            for activity in activity_data
-            if activity.activity_period_start
-            and activity.activity_period_end
-            and (activity.activity_period_end - activity.activity_period_start).days
-            > 365
+        total_weight = activity_summary.quality_weight
+        return (
+            activity_summary.weighted_quality_score / total_weight
+            if total_weight > 0
+            else 50.0
         )
-        if annual_periods > 0:
-            recommendations.append(
-                f"📅 Consider breaking down {annual_periods} annual periods into monthly/quarterly data for better accuracy"
-            )
 
-        # Large emission sources
-        if activity_data:
-            sorted_activities = sorted(
-                activity_data, key=lambda x: x.quantity, reverse=True
-            )
-            top_activities = sorted_activities[:3]  # Top 3 largest activities
-
-            for i, activity in enumerate(top_activities):
-                if activity.data_quality == "estimated":
-                    recommendations.append(
-                        f"⚡ High-impact activity #{i+1} ({activity.activity_type}) uses estimated data - prioritize measurement for maximum accuracy improvement"
-                    )
-
-        # Fuel type diversity
-        fuel_types = set(
-            activity.fuel_type for activity in activity_data if activity.fuel_type
+    def _score_activity_quality(
+        self, activity: ActivityDataInput, period_days: Optional[int]
+    ) -> float:
+        """Quality score of a single activity, from its quality and modifiers"""
+        # Base quality score
+        base_score = DATA_QUALITY_SCORES.get(activity.data_quality or "estimated", 40)
+
+        # Apply modifiers based on data completeness
+        modifiers = 0
+
+        # Data source modifier
+        data_source = (activity.data_source or "").lower()
+        if any(token in data_source for token in HIGH_QUALITY_SOURCE_TOKENS):
+            modifiers += 10  # High-quality sources
+        elif any(token in data_source for token in LOW_QUALITY_SOURCE_TOKENS):
+            modifiers -= 10  # Lower quality
+
+        # Location specificity modifier
+        if activity.location:
+            if len(activity.location) > 10:  # Detailed location
+                modifiers += 5
+            else:
+                modifiers += 2  # Basic location
+
+        # Measurement method modifier
+        measurement_method = (activity.measurement_method or "").lower()
+        for token, bonus in MEASUREMENT_TOKENS.items():
+            if token in measurement_method:
+                modifiers += bonus
+                break
+
+        # Time period specificity
+        if period_days is not None:
+            if period_days <= 31:  # Monthly or better
+                modifiers += 10
+            elif period_days <= 92:  # Quarterly
+                modifiers += 5
+
+        # Calculate final score for this activity
+        return min(100, max(0, base_score + modifiers))
+
+    def _estimate_uncertainty(self, activity_summary: ActivityDataSummary) -> float:
+        """Estimate uncertainty percentage for the calculation"""
+        # Simplified uncertainty estimation, one lookup per quality level
+        count = activity_summary.activity_count
+        if count == 0:
+            return 25.0
+
+        total_uncertainty = sum(
+            UNCERTAINTY_BY_QUALITY.get(quality, 35.0) * quality_count
+            for quality, quality_count in activity_summary.quality_distribution.items()
         )
-        if len(fuel_types) > 5:
-            recommendations.append(
-                "🔄 Consider consolidating similar fuel types or implementing fuel-specific tracking systems"
-            )
+        return total_uncertainty / count
 
-        # Missing documentation
-        missing_docs = sum(
-            1
-            for activity in activity_data
-            if not activity.notes and not activity.additional_data
-        )
-        if missing_docs > 0:
-            recommendations.append(
-                f"📝 Add documentation/notes for {missing_docs} activities to support audit requirements"
+    def _generate_recommendations(
+        self, activity_summary: ActivityDataSummary
+    ) -> List[str]:
+        """Generate comprehensive recommendations for improving data quality and accuracy"""
+        recommendations = list(
+            _count_recommendations(
+                activity_summary.estimated_count,
+                activity_summary.missing_sources,
+                activity_summary.missing_locations,
+                activity_summary.missing_methods,
+                activity_summary.annual_periods,
             )
-
-        # EPA factor availability
-        recommendations.append(
-            "✅ Verify EPA emission factors are current - system will automatically use latest available factors"
         )
 
-        # SEC compliance
-        recommendations.append(
-            "🏛️ Ensure all data sources are auditable and documentation is SEC-compliant for climate disclosure requirements"
-        )
+        # Large emission sources
+        for i, activity in enumerate(activity_summary.top_activities):
+            if activity.data_quality == "estimated":
+                recommendations.append(
+                    f"⚡ High-impact activity #{i+1} ({activity.activity_type}) uses estimated data - prioritize measurement for maximum accuracy improvement"
+                )
 
+        recommendations.extend(
+            _closing_recommendations(
+                len(activity_summary.fuel_types) > 5, activity_summary.missing_docs
+            )
+        )
         return recommendations
 
     def _generate_calculation_insights(
         self,
-        activity_data: List[ActivityDataInput],
+        activity_summary: ActivityDataSummary,
         total_co2e: float,
         emission_factors_used: Dict[str, Any],
+        data_completeness: float,
+        data_quality: float,
     ) -> Dict[str, Any]:
         """Generate detailed insights about the calculation"""
 
@@ -962,107 +1342,74 @@ class Scope1EmissionsCalculator:
             "breakdown": {},
             "quality_analysis": {},
             "benchmarks": {},
-            "recommendations": self._generate_recommendations(activity_data),
+            "recommendations": self._generate_recommendations(activity_summary),
         }
 
+        activity_count = activity_summary.activity_count
+        quality_distribution = activity_summary.quality_distribution
+
+        # Per-activity ratios, all zero when there is no activity data
+        co2e_per_activity = measured_percentage = estimated_percentage = 0
+        if activity_count:
+            co2e_per_activity = round(total_co2e / activity_count, 2)
+            measured_percentage = round(
+                (quality_distribution.get("measured", 0) / activity_count) * 100, 1
+            )
+            estimated_percentage = round(
+                (quality_distribution.get("estimated", 0) / activity_count) * 100, 1
+            )
+
         # Summary statistics
         insights["summary"] = {
-            "total_activities": len(activity_data),
+            "total_activities": activity_count,
             "total_co2e_tonnes": round(total_co2e, 2),
-            "average_co2e_per_activity": (
-                round(total_co2e / len(activity_data), 2) if activity_data else 0
-            ),
-            "fuel_types_count": len(
-                set(a.fuel_type for a in activity_data if a.fuel_type)
-            ),
-            "locations_count": len(
-                set(a.location for a in activity_data if a.location)
-            ),
-            "data_sources_count": len(
-                set(a.data_source for a in activity_data if a.data_source)
-            ),
+            "average_co2e_per_activity": co2e_per_activity,
+            "fuel_types_count": len(activity_summary.fuel_types),
+            "locations_count": len(activity_summary.locations),
+            "data_sources_count": len(activity_summary.data_sources),
         }
 
         # Emissions breakdown by fuel type
-        fuel_breakdown = {}
-        for activity in activity_data:
-            fuel_type = activity.fuel_type or "unknown"
-            if fuel_type not in fuel_breakdown:
-                fuel_breakdown[fuel_type] = {
-                    "activity_count": 0,
-                    "total_quantity": 0,
-                    "estimated_co2e": 0,
-                }
-
-            fuel_breakdown[fuel_type]["activity_count"] += 1
-            fuel_breakdown[fuel_type]["total_quantity"] += activity.quantity
-            # Rough estimate - would be more accurate with actual calculation results
-            fuel_breakdown[fuel_type]["estimated_co2e"] += (
-                activity.quantity * 0.05
-            )  # Placeholder
-
-        insights["breakdown"]["by_fuel_type"] = fuel_breakdown
+        insights["breakdown"]["by_fuel_type"] = activity_summary.fuel_breakdown
 
         # Data quality analysis
-        quality_distribution = {}
-        for activity in activity_data:
-            quality = activity.data_quality or "estimated"
-            quality_distribution[quality] = quality_distribution.get(quality, 0) + 1
-
         insights["quality_analysis"] = {
             "quality_distribution": quality_distribution,
-            "measured_percentage": (
-                round(
-                    (quality_distribution.get("measured", 0) / len(activity_data))
-                    * 100,
-                    1,
-                )
-                if activity_data
-                else 0
-            ),
-            "estimated_percentage": (
-                round(
-                    (quality_distribution.get("estimated", 0) / len(activity_data))
-                    * 100,
-                    1,
-                )
-                if activity_data
-                else 0
-            ),
-            "data_completeness_score": self._calculate_data_completeness(activity_data),
-            "overall_quality_score": self._calculate_data_quality_score(activity_data),
+            "measured_percentage": measured_percentage,
+            "estimated_percentage": estimated_percentage,
+            "data_completeness_score": data_completeness,
+            "overall_quality_score": data_quality,
         }
 
         # Simple benchmarks (would be enhanced with industry data)
         insights["benchmarks"] = {
             "emissions_intensity": {
-                "co2e_per_activity": (
-                    round(total_co2e / len(activity_data), 2) if activity_data else 0
-                ),
+                "co2e_per_activity": co2e_per_activity,
                 "benchmark_category": self._categorize_emissions_intensity(
-                    total_co2e, len(activity_data)
+                    total_co2e, activity_count
                 ),
             },
-            "data_quality_rating": self._rate_data_quality(
-                insights["quality_analysis"]["overall_quality_score"]
-            ),
-            "completeness_rating": self._rate_completeness(
-                insights["quality_analysis"]["data_completeness_score"]
-            ),
+            "data_quality_rating": self._rate_data_quality(data_quality),
+            "completeness_rating": self._rate_completeness(data_completeness),
         }
 
         # EPA factors used summary
         insights["epa_factors"] = {
             "factors_used_count": len(emission_factors_used),
             "sources": list(
-                set(
+                {
                     factor.get("factor_source", "unknown")
                     for factor in emission_factors_used.values()
-                )
+                }
             ),
             "latest_factor_year": max(
-                [2024] + [2020]
-            ),  # Placeholder - would extract from actual factors
+                (
+                    factor["factor_year"]
+                    for factor in emission_factors_used.values()
+                    if factor.get("factor_year")
+                ),
+                default=2024,
+            ),
         }
 
         return insights
@@ -1075,86 +1422,84 @@ class Scope1EmissionsCalculator:
             return "no_data"
 
         intensity = total_co2e / activity_count
-
-        if intensity < 1.0:
-            return "low"
-        elif intensity < 10.0:
-            return "moderate"
-        elif intensity < 50.0:
-            return "high"
-        else:
-            return "very_high"
+        return INTENSITY_LABELS[bisect_right(INTENSITY_THRESHOLDS, intensity)]
 
     def _rate_data_quality(self, quality_score: float) -> str:
         """Rate overall data quality"""
-        if quality_score >= 90:
-            return "excellent"
-        elif quality_score >= 80:
-            return "good"
-        elif quality_score >= 70:
-            return "fair"
-        elif quality_score >= 60:
-            return "poor"
-        else:
-            return "very_poor"
+        return QUALITY_RATING_LABELS[
+            bisect_right(QUALITY_RATING_THRESHOLDS, quality_score)
+        ]
 
     def _rate_completeness(self, completeness_score: float) -> str:
         """Rate data completeness"""
-        if completeness_score >= 95:
-            return "complete"
-        elif completeness_score >= 85:
-            return "mostly_complete"
-        elif completeness_score >= 70:
-            return "partially_complete"
+        return COMPLETENESS_RATING_LABELS[
+            bisect_right(COMPLETENESS_RATING_THRESHOLDS, completeness_score)
+        ]
+
+    def _resolve_company_and_entity(
+        self, company_id: str, entity_id: Optional[str]
+    ) -> Tuple[Company, Optional[CompanyEntity]]:
+        """Verify the company, and the entity if given, exist in one query
+
+        A missing company or entity is a validation failure (400), as in the
+        Scope 2 calculator.
+        """
+        if entity_id:
+            # Outer join so a missing entity still returns the company row
+            row = (
+                self.db.query(Company, CompanyEntity)
+                .outerjoin(
+                    CompanyEntity,
+                    and_(
+                        CompanyEntity.company_id == Company.id,
+                        CompanyEntity.id == entity_id,
+                    ),
+                )
+                .filter(Company.id == company_id)
+                .first()
+            )
+            company, entity = row if row else (None, None)
         else:
-            return "incomplete"
+            company = self.db.query(Company).filter(Company.id == company_id).first()
+            entity = None
 
-    def _verify_company_exists(self, company_id: str) -> Company:
-        """Verify company exists"""
-        company = self.db.query(Company).filter(Company.id == company_id).first()
+        errors = []
         if not company:
+            errors.append(f"Company {company_id} not found")
+        elif entity_id and not entity:
+            errors.append(f"Entity {entity_id} not found for company {company_id}")
+        if errors:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Company {company_id} not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Validation failed: {errors}",
             )
-        return company
-
-    def _verify_entity_exists(self, entity_id: str, company_id: str) -> CompanyEntity:
-        """Verify entity exists and belongs to company"""
-        entity = (
-            self.db.query(CompanyEntity)
-            .filter(
-                CompanyEntity.id == entity_id, CompanyEntity.company_id == company_id
-            )
-            .first()
-        )
-        if not entity:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Entity {entity_id} not found for company {company_id}",
-            )
-        return entity
+        return company, entity
 
     def _generate_calculation_code(self, prefix: str, company_identifier: str) -> str:
-        """Generate unique calculation code with microseconds and UUID for CI/CD safety"""
-        import uuid as uuid_lib
-
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")  # Include microseconds
-        company_code = company_identifier[:3].upper() if company_identifier else "UNK"
-        unique_suffix = str(uuid_lib.uuid4())[
-            :8
-        ]  # Add 8-char UUID for extra uniqueness
-        return f"{prefix}-{company_code}-{timestamp}-{unique_suffix}"
+        """Generate unique calculation code with microseconds and UUID for CI/CD safety
+
+        Uniqueness comes from the timestamp and random suffix, so no lookup
+        against existing codes is needed before insert.
+        """
+        # Timestamp includes microseconds; 8-char UUID suffix for extra uniqueness
+        return (
+            f"{prefix}-{(company_identifier or 'UNK')[:3].upper()}"
+            f"-{datetime.utcnow():%Y%m%d%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+        )
 
     def _create_audit_trail_entry(
-        self, calculation_id: uuid.UUID, event_type: str, description: str, user_id: str
+        self,
+        calculation_id: uuid.UUID,
+        event_type: str,
+        description: str,
+        user_id: uuid.UUID,
     ):
         """Create audit trail entry"""
         audit_entry = CalculationAuditTrail(
             calculation_id=calculation_id,
             event_type=event_type,
             event_description=description,
-            user_id=uuid.UUID(user_id),
+            user_id=user_id,
             user_role="system",  # Would get from user context
             reason="Automated calculation process",
         )
@@ -1163,20 +1508,34 @@ class Scope1EmissionsCalculator:
     def _get_user_by_id(self, user_id: str):
         """Get user by ID - placeholder for actual user service"""
         # This would integrate with the actual user service
-        from app.models.user import User
-
         return self.db.query(User).filter(User.id == user_id).first()
 
     def _build_calculation_response(
-        self, calculation: EmissionsCalculation
+        self,
+        calculation: EmissionsCalculation,
+        activity_rows: Optional[List[Dict[str, Any]]] = None,
     ) -> EmissionsCalculationResponse:
-        """Build calculation response with activity data"""
-        # Get activity data
-        activity_data = (
-            self.db.query(ActivityData)
-            .filter(ActivityData.calculation_id == calculation.id)
-            .all()
-        )
+        """Build calculation response with activity data
+
+        Rows already held in memory (e.g. just inserted by the calculation)
+        are used as-is; otherwise the activity data is loaded from the database.
+        """
+        if activity_rows is None:
+            # Get activity data as plain column tuples, skipping ORM instances
+            activity_rows = (
+                self.db.query(
+                    *(
+                        getattr(ActivityData, name)
+                        for name in ACTIVITY_DATA_RESPONSE_FIELDS
+                    )
+                )
+                .filter(ActivityData.calculation_id == calculation.id)
+                .all()
+            )
+        # Validate each row straight into the response model
+        activity_data = [
+            ActivityDataResponse.model_validate(row) for row in activity_rows
+        ]
 
         return EmissionsCalculationResponse(
             id=str(calculation.id),
@@ -1204,27 +1563,7 @@ class Scope1EmissionsCalculator:
             ),
             calculation_timestamp=calculation.calculation_timestamp,
             calculation_duration_seconds=calculation.calculation_duration_seconds,
-            activity_data=[
-                {
-                    "id": str(ad.id),
-                    "activity_type": ad.activity_type,
-                    "fuel_type": ad.fuel_type,
-                    "activity_description": ad.activity_description,
-                    "quantity": ad.quantity,
-                    "unit": ad.unit,
-                    "location": ad.location,
-                    "emission_factor_value": ad.emission_factor_value,
-                    "emission_factor_unit": ad.emission_factor_unit,
-                    "emission_factor_source": ad.emission_factor_source,
-                    "co2_emissions": ad.co2_emissions,
-                    "ch4_emissions": ad.ch4_emissions,
-                    "n2o_emissions": ad.n2o_emissions,
-                    "co2e_emissions": ad.co2e_emissions,
-                    "data_quality": ad.data_quality,
-                    "notes": ad.notes,
-                }
-                for ad in activity_data
-            ],
+            activity_data=activity_data,
             validation_errors=calculation.validation_errors,
             validation_warnings=calculation.validation_warnings,
             created_at=calculation.created_at,
@@ -4,11 +4,18 @@ Indirect GHG emissions from purchased electricity, steam, heating, and cooling
 """
 
 import logging
+import re
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.orm import Session
 
 from app.core.audit_logger import AuditLogger
@@ -23,6 +30,7 @@ from app.models.epa_data import ElectricityRegion, EmissionFactor
 from app.models.user import User
 from app.schemas.emissions import (
     ActivityDataInput,
+    ActivityDataResponse,
     CalculationValidationResult,
     EmissionsCalculationResponse,
     Scope2CalculationRequest,
@@ -31,6 +39,289 @@ from app.services.epa_cache_service import EPACachedService
 
 logger = logging.getLogger(__name__)
 
+# Activity data insert built once and reused for every calculation
+ACTIVITY_DATA_INSERT = ActivityData.__table__.insert()
+
+# Current eGRID factors of several regions, in the EPA service's order
+ELECTRICITY_FACTORS_BY_REGIONS_QUERY = (
+    select(EmissionFactor)
+    .where(
+        EmissionFactor.is_current == True,
+        EmissionFactor.category == "electricity",
+        EmissionFactor.source == "EPA_EGRID",
+        EmissionFactor.electricity_region.in_(bindparam("regions", expanding=True)),
+    )
+    .order_by(EmissionFactor.factor_name)
+)
+
+# Activity data columns included in calculation responses
+ACTIVITY_DATA_RESPONSE_FIELDS = tuple(ActivityDataResponse.model_fields)
+
+# Base data quality score by declared data quality (electricity typically has
+# higher base scores)
+DATA_QUALITY_SCORES = {
+    "measured": 95,  # Smart meters, utility bills
+    "calculated": 85,  # Calculated from sub-meters
+    "estimated": 70,  # Engineering estimates
+    "default": 60,
+}
+
+# Base uncertainty percentage by calculation method; unknown methods use 12.0
+UNCERTAINTY_BY_METHOD = {
+    "location_based": 10.0,  # Location-based typically more uncertain
+    "market_based": 15.0,  # Market-based can be more uncertain due to renewable claims
+}
+
+# Uncertainty adjustment by data quality level; unknown levels use 5.0
+UNCERTAINTY_ADJUSTMENT_BY_QUALITY = {
+    "measured": 0.0,
+    "calculated": 3.0,
+    "estimated": 8.0,
+}
+
+# Quality modifier by data source keyword; the first listed match applies
+SOURCE_QUALITY_TOKENS = {
+    "smart meter": 15,  # High-quality electricity sources
+    "utility bill": 15,
+    "sub-meter": 10,
+    "building meter": 10,
+    "estimate": -10,
+}
+
+# Quality modifier by measurement method keyword; the first listed match applies
+MEASUREMENT_QUALITY_TOKENS = {
+    "continuous": 15,
+    "smart meter": 15,
+    "monthly": 10,
+    "periodic": 10,
+    "annual": 5,
+}
+
+
+# Electricity unit conversion factors keyed by (from_unit, to_unit) in
+# normalized units; the reverse direction is derived when only one is listed
+ELECTRICITY_CONVERSION_FACTORS = {
+    # Energy conversions (electricity)
+    ("kwh", "mwh"): 0.001,
+    ("mwh", "kwh"): 1000.0,
+    ("kwh", "gwh"): 0.000001,
+    ("gwh", "kwh"): 1000000.0,
+    ("mwh", "gwh"): 0.001,
+    ("gwh", "mwh"): 1000.0,
+    ("twh", "gwh"): 1000.0,
+    ("gwh", "twh"): 0.001,
+    ("twh", "mwh"): 1000000.0,
+    ("mwh", "twh"): 0.000001,
+    # Power to energy conversions (assuming 1 hour)
+    ("kw", "kwh"): 1.0,  # Assuming 1 hour operation
+    ("mw", "mwh"): 1.0,
+    ("gw", "gwh"): 1.0,
+    # Energy to other energy units
+    ("kwh", "mj"): 3.6,
+    ("mj", "kwh"): 0.277778,
+    ("kwh", "btu"): 3412.14,
+    ("btu", "kwh"): 0.000293071,
+    ("mwh", "mmbtu"): 3.41214,
+    ("mmbtu", "mwh"): 0.293071,
+    # Thermal energy conversions
+    ("therms", "kwh"): 29.3001,
+    ("kwh", "therms"): 0.0341296,
+    ("mcf", "kwh"): 293.001,  # Thousand cubic feet of natural gas
+    ("kwh", "mcf"): 0.00341296,
+}
+
+# Common electricity unit spellings mapped to their normalized form
+ELECTRICITY_UNIT_MAPPINGS = {
+    "kilowatt_hour": "kwh",
+    "kilowatt-hour": "kwh",
+    "kw_h": "kwh",
+    "kwhr": "kwh",
+    "kilowatthour": "kwh",
+    "megawatt_hour": "mwh",
+    "megawatt-hour": "mwh",
+    "mw_h": "mwh",
+    "mwhr": "mwh",
+    "megawatthour": "mwh",
+    "gigawatt_hour": "gwh",
+    "gigawatt-hour": "gwh",
+    "gw_h": "gwh",
+    "gwhr": "gwh",
+    "gigawatthour": "gwh",
+    "terawatt_hour": "twh",
+    "terawatt-hour": "twh",
+    "tw_h": "twh",
+    "twhr": "twh",
+    "terawatthour": "twh",
+    "kilowatt": "kw",
+    "megawatt": "mw",
+    "gigawatt": "gw",
+    "megajoule": "mj",
+    "british_thermal_unit": "btu",
+    "million_btu": "mmbtu",
+    "therm": "therms",
+    "thousand_cubic_feet": "mcf",
+    "mcf_gas": "mcf",
+}
+
+
+# Comprehensive EPA eGRID regions mapping
+STATE_TO_REGION = {
+    # CAMX - California
+    "CA": "camx",
+    # NWPP - Northwest Power Pool
+    "WA": "nwpp",
+    "OR": "nwpp",
+    "ID": "nwpp",
+    "MT": "nwpp",
+    "WY": "nwpp",
+    "UT": "nwpp",
+    "NV": "nwpp",
+    # AZNM - Arizona-New Mexico
+    "AZ": "aznm",
+    "NM": "aznm",
+    # ERCT - Electric Reliability Council of Texas
+    "TX": "erct",
+    # FRCC - Florida Reliability Coordinating Council
+    "FL": "frcc",
+    # HIOA - Hawaii and Other Islands
+    "HI": "hioa",
+    # AKGD - Alaska Grid
+    "AK": "akgd",
+    # NEWE - New England
+    "CT": "newe",
+    "MA": "newe",
+    "ME": "newe",
+    "NH": "newe",
+    "RI": "newe",
+    "VT": "newe",
+    # NYUP - New York Upstate
+    "NY": "nyup",
+    # NYLI - New York Long Island
+    # Note: Long Island would need more specific location parsing
+    # NYIS - New York City/Westchester
+    # Note: NYC would need more specific location parsing
+    # PRMS - Puerto Rico and US Virgin Islands
+    "PR": "prms",
+    "VI": "prms",
+    # RFCE - RFC East
+    "NJ": "rfce",
+    "PA": "rfce",
+    "DE": "rfce",
+    "MD": "rfce",
+    "DC": "rfce",
+    # RFCM - RFC Michigan
+    "MI": "rfcm",
+    # RFCW - RFC West
+    "OH": "rfcw",
+    "WV": "rfcw",
+    # SRMV - SERC Mississippi Valley
+    "AR": "srmv",
+    "LA": "srmv",
+    "MS": "srmv",
+    # SRMW - SERC Midwest
+    "IL": "srmw",
+    "IN": "srmw",
+    "MO": "srmw",
+    # SRSO - SERC South
+    "AL": "srso",
+    "GA": "srso",
+    # SRTV - SERC Tennessee Valley
+    "TN": "srtv",
+    "KY": "srtv",
+    "NC": "srtv",
+    "VA": "srtv",
+    "SC": "srtv",
+    # SPNO - SPP North
+    "NE": "spno",
+    "KS": "spno",
+    "OK": "spno",
+    # SPSO - SPP South
+    # Note: Some overlap with other regions, would need more specific mapping
+    # MROW - MRO West
+    "ND": "mrow",
+    "SD": "mrow",
+    "MN": "mrow",
+    "IA": "mrow",
+    "WI": "mrow",
+}
+
+# Major city to region mapping for more precise location detection
+CITY_TO_REGION = {
+    "NEW YORK CITY": "nyis",
+    "NYC": "nyis",
+    "MANHATTAN": "nyis",
+    "BROOKLYN": "nyis",
+    "QUEENS": "nyis",
+    "BRONX": "nyis",
+    "WESTCHESTER": "nyis",
+    "LONG ISLAND": "nyli",
+    "NASSAU": "nyli",
+    "SUFFOLK": "nyli",
+    "LOS ANGELES": "camx",
+    "SAN FRANCISCO": "camx",
+    "CHICAGO": "srmw",
+    "HOUSTON": "erct",
+    "DALLAS": "erct",
+}
+
+
+def _alternation(keys) -> str:
+    """Regex alternation of literal keys, longest first so it wins at a position"""
+    return "|".join(map(re.escape, sorted(keys, key=len, reverse=True)))
+
+
+def _first_match(pattern: re.Pattern, text: str, mapping: Dict[str, Any]):
+    """Key of mapping found in text by pattern, first in mapping order"""
+    found = {match.group(match.lastindex) for match in pattern.finditer(text)}
+    if found:
+        return next(key for key in mapping if key in found)
+    return None
+
+
+# Precompiled location matchers, one per lookup tier. Each finds every key in
+# a single scan (zero-width lookahead, so overlapping keys are seen too).
+# Cities match anywhere; state codes as a separate word or right after "," or
+# "-".
+CITY_PATTERN = re.compile(f"(?=({_alternation(CITY_TO_REGION)}))")
+STATE_CODE_PATTERN = re.compile(
+    r"(?=(?<![^ ])({codes})(?![^ ])|(?<=[,-])({codes}))".format(
+        codes=_alternation(STATE_TO_REGION)
+    )
+)
+
+# Quality keyword matchers, finding every token of a table in one scan
+SOURCE_QUALITY_PATTERN = re.compile(f"(?=({_alternation(SOURCE_QUALITY_TOKENS)}))")
+MEASUREMENT_QUALITY_PATTERN = re.compile(
+    f"(?=({_alternation(MEASUREMENT_QUALITY_TOKENS)}))"
+)
+
+
+def _token_modifier(text: str, pattern: re.Pattern, tokens: Dict[str, int]) -> int:
+    """Modifier of the first listed token found in text, or 0"""
+    token = _first_match(pattern, text, tokens)
+    return tokens[token] if token is not None else 0
+
+
+@dataclass(frozen=True)
+class ElectricityFactor:
+    """Plain copy of the EmissionFactor fields read per electricity row"""
+
+    id: Any
+    co2_factor: Optional[float]
+    co2e_factor: float
+    unit: str
+    source: str
+
+    @classmethod
+    def from_model(cls, factor: EmissionFactor) -> "ElectricityFactor":
+        return cls(
+            id=factor.id,
+            co2_factor=factor.co2_factor,
+            co2e_factor=factor.co2e_factor,
+            unit=factor.unit,
+            source=factor.source,
+        )
+
 
 class Scope2EmissionsCalculator:
     """Service for calculating Scope 2 (indirect energy) GHG emissions"""
@@ -40,116 +331,39 @@ class Scope2EmissionsCalculator:
         self.audit_logger = AuditLogger(db)
         self.epa_service = EPACachedService(db)
 
-        # Comprehensive EPA eGRID regions mapping
-        self.state_to_region = {
-            # CAMX - California
-            "CA": "camx",
-            # NWPP - Northwest Power Pool
-            "WA": "nwpp",
-            "OR": "nwpp",
-            "ID": "nwpp",
-            "MT": "nwpp",
-            "WY": "nwpp",
-            "UT": "nwpp",
-            "NV": "nwpp",
-            # AZNM - Arizona-New Mexico
-            "AZ": "aznm",
-            "NM": "aznm",
-            # ERCT - Electric Reliability Council of Texas
-            "TX": "erct",
-            # FRCC - Florida Reliability Coordinating Council
-            "FL": "frcc",
-            # HIOA - Hawaii and Other Islands
-            "HI": "hioa",
-            # AKGD - Alaska Grid
-            "AK": "akgd",
-            # NEWE - New England
-            "CT": "newe",
-            "MA": "newe",
-            "ME": "newe",
-            "NH": "newe",
-            "RI": "newe",
-            "VT": "newe",
-            # NYUP - New York Upstate
-            "NY": "nyup",
-            # NYLI - New York Long Island
-            # Note: Long Island would need more specific location parsing
-            # NYIS - New York City/Westchester
-            # Note: NYC would need more specific location parsing
-            # PRMS - Puerto Rico and US Virgin Islands
-            "PR": "prms",
-            "VI": "prms",
-            # RFCE - RFC East
-            "NJ": "rfce",
-            "PA": "rfce",
-            "DE": "rfce",
-            "MD": "rfce",
-            "DC": "rfce",
-            # RFCM - RFC Michigan
-            "MI": "rfcm",
-            # RFCW - RFC West
-            "OH": "rfcw",
-            "WV": "rfcw",
-            # SRMV - SERC Mississippi Valley
-            "AR": "srmv",
-            "LA": "srmv",
-            "MS": "srmv",
-            # SRMW - SERC Midwest
-            "IL": "srmw",
-            "IN": "srmw",
-            "MO": "srmw",
-            # SRSO - SERC South
-            "AL": "srso",
-            "GA": "srso",
-            # SRTV - SERC Tennessee Valley
-            "TN": "srtv",
-            "KY": "srtv",
-            "NC": "srtv",
-            "VA": "srtv",
-            "SC": "srtv",
-            # SPNO - SPP North
-            "NE": "spno",
-            "KS": "spno",
-            "OK": "spno",
-            # SPSO - SPP South
-            # Note: Some overlap with other regions, would need more specific mapping
-            # MROW - MRO West
-            "ND": "mrow",
-            "SD": "mrow",
-            "MN": "mrow",
-            "IA": "mrow",
-            "WI": "mrow",
-        }
-
-        # Major city to region mapping for more precise location detection
-        self.city_to_region = {
-            "NEW YORK CITY": "nyis",
-            "NYC": "nyis",
-            "MANHATTAN": "nyis",
-            "BROOKLYN": "nyis",
-            "QUEENS": "nyis",
-            "BRONX": "nyis",
-            "WESTCHESTER": "nyis",
-            "LONG ISLAND": "nyli",
-            "NASSAU": "nyli",
-            "SUFFOLK": "nyli",
-            "LOS ANGELES": "camx",
-            "SAN FRANCISCO": "camx",
-            "CHICAGO": "srmw",
-            "HOUSTON": "erct",
-            "DALLAS": "erct",
-        }
+        # Company and entity lookups by id, including misses. A calculator is
+        # created per request, so these never outlive the request's session.
+        self._company_cache: Dict[str, Optional[Company]] = {}
+        self._entity_cache: Dict[Tuple[str, str], bool] = {}
 
     async def calculate_scope2_emissions(
-        self, request: Scope2CalculationRequest, user_id: str
+        self,
+        request: Scope2CalculationRequest,
+        user_id: str,
+        user: Optional[User] = None,
     ) -> EmissionsCalculationResponse:
-        """Calculate Scope 2 emissions from electricity consumption data"""
+        """Calculate Scope 2 emissions from electricity consumption data
+
+        The already loaded user may be passed to spare the audit log a lookup.
+        """
         try:
             logger.info(f"Starting Scope 2 calculation: {request.calculation_name}")
-            start_time = datetime.utcnow()
+            start_time = time.perf_counter()
+
+            # Resolve the region and emission factor of every row once for
+            # validation and calculation
+            regions = [
+                self._determine_electricity_region(consumption.location)
+                for consumption in request.electricity_consumption
+            ]
+            emission_factors = await self._prefetch_electricity_emission_factors(
+                regions, request.calculation_method
+            )
 
             # Validate request
-            validation_result = await self._validate_calculation_request(request)
+            validation_result = await self._validate_calculation_request(
+                request, regions, emission_factors
+            )
             if not validation_result.is_valid:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -164,19 +378,26 @@ class Scope2EmissionsCalculator:
                 "SC2", company.ticker or company.name
             )
 
+            # Serialize the request once for storage and auditing
+            request_data = request.model_dump(mode="json")
+
+            # Parse the request ids once, as the Scope 1 calculator does
+            company_uuid = uuid.UUID(request.company_id)
+            user_uuid = uuid.UUID(user_id)
+
             # Create calculation record
             calculation = EmissionsCalculation(
                 calculation_name=request.calculation_name,
                 calculation_code=calculation_code,
-                company_id=uuid.UUID(request.company_id),
+                company_id=company_uuid,
                 entity_id=None,  # Scope 2 typically at company level
                 scope="scope_2",
                 method=request.calculation_method,
                 reporting_period_start=request.reporting_period_start,
                 reporting_period_end=request.reporting_period_end,
                 status="in_progress",
-                calculated_by=uuid.UUID(user_id),
-                input_data=request.dict(),
+                calculated_by=user_uuid,
+                input_data=request_data,
                 calculation_parameters=request.calculation_parameters or {},
                 emission_factors_used={},  # Initialize as empty dict
                 source_documents=request.source_documents or [],
@@ -187,43 +408,57 @@ class Scope2EmissionsCalculator:
 
             total_co2e = 0.0
             total_co2 = 0.0
-            emission_factors_used = {}
+            activity_rows: List[Dict[str, Any]] = []
 
             # Calculate emissions for each electricity consumption entry
-            for electricity_data in request.electricity_consumption:
+            for electricity_data, region in zip(
+                request.electricity_consumption, regions
+            ):
                 try:
-                    result = await self._calculate_electricity_emissions(
-                        electricity_data, calculation.id, request.calculation_method
+                    result = self._calculate_electricity_emissions(
+                        electricity_data,
+                        region,
+                        calculation.id,
+                        request.calculation_method,
+                        activity_rows,
+                        emission_factors,
                     )
 
                     total_co2e += result["co2e_emissions"] or 0.0
                     total_co2 += result["co2_emissions"] or 0.0
 
-                    # Track emission factors used
-                    emission_factors_used[result["emission_factor_id"]] = {
-                        "value": result["emission_factor_value"],
-                        "source": result["emission_factor_source"],
-                        "unit": result["emission_factor_unit"],
-                    }
-
                 except Exception as e:
                     logger.warning(f"Skipping electricity data due to error: {str(e)}")
                     continue
 
+            # Track emission factors used, one entry per prefetched factor
+            emission_factors_used = {
+                str(factor.id): {
+                    "value": factor.co2e_factor,
+                    "source": factor.source,
+                    "unit": factor.unit,
+                }
+                for factor in emission_factors.values()
+                if factor is not None
+            }
+
+            # Insert all activity rows in one Core executemany, bypassing the
+            # ORM unit of work, as the Scope 1 calculator does
+            if activity_rows:
+                self.db.execute(ACTIVITY_DATA_INSERT, activity_rows)
+
             # Update calculation record with totals (convert kg to metric tons)
             calculation.total_co2e = total_co2e / 1000.0
             calculation.total_co2 = total_co2 / 1000.0
             calculation.status = "completed"
             calculation.calculation_timestamp = datetime.utcnow()
-            calculation.calculation_duration_seconds = (
-                datetime.utcnow() - start_time
-            ).total_seconds()
+            calculation.calculation_duration_seconds = time.perf_counter() - start_time
 
-            # Log calculation for audit
+            # Log calculation for audit in the same transaction
             self.audit_logger.log_calculation_event(
-                user=self._get_user_by_id(user_id),
+                user=user if user is not None else self._get_user_by_id(user_id),
                 calculation_type="scope_2",
-                input_data=request.dict(),
+                input_data=request_data,
                 output_data={
                     "total_co2e": total_co2e,
                     "total_co2": total_co2,
@@ -231,26 +466,29 @@ class Scope2EmissionsCalculator:
                 },
                 emission_factors_used=emission_factors_used,
                 processing_time_ms=int(calculation.calculation_duration_seconds * 1000),
+                commit=False,
             )
 
             logger.info(
                 f"Scope 2 calculation completed: {calculation_code}, {total_co2e:.2f} tCO2e"
             )
 
-            # Generate calculation insights
-            calculation_insights = self._generate_calculation_insights(
+            # Generate calculation insights and store them with the results
+            calculation.calculation_insights = self._generate_calculation_insights(
                 request.electricity_consumption,
                 total_co2e,
                 emission_factors_used,
                 request.calculation_method,
             )
 
-            # Store insights in calculation
-            calculation.calculation_insights = calculation_insights
+            # Flush the results first; server-side timestamps come back with
+            # the write (eager_defaults), so the response is built from memory
+            # and nothing needs reloading after the commit expires the row
+            self.db.flush()
+            response = self._build_calculation_response(calculation, activity_rows)
             self.db.commit()
 
-            # Return response
-            return self._build_calculation_response(calculation)
+            return response
 
         except HTTPException:
             raise
@@ -262,21 +500,23 @@ class Scope2EmissionsCalculator:
                 detail=f"Calculation failed: {str(e)}",
             )
 
-    async def _calculate_electricity_emissions(
+    def _calculate_electricity_emissions(
         self,
         electricity_data: ActivityDataInput,
+        region: str,
         calculation_id: uuid.UUID,
         calculation_method: str,
+        activity_rows: List[Dict[str, Any]],
+        emission_factors: Dict[str, Optional[ElectricityFactor]],
     ) -> Dict[str, Any]:
-        """Calculate emissions for electricity consumption"""
+        """Calculate emissions for electricity consumption
 
-        # Determine electricity region
-        region = self._determine_electricity_region(electricity_data.location)
+        The activity data row is appended to ``activity_rows`` for a single
+        batched insert by the caller.
+        """
 
-        # Get appropriate emission factor using intelligent selection
-        emission_factor = await self._get_electricity_emission_factor(
-            region, calculation_method
-        )
+        # Emission factor prefetched for the region
+        emission_factor = emission_factors.get(region)
 
         if not emission_factor:
             raise ValueError(
@@ -301,8 +541,9 @@ class Scope2EmissionsCalculator:
             co2_emissions, co2e_emissions, electricity_data, calculation_method
         )
 
-        # Create activity data record
-        activity_data = ActivityData(
+        # Activity data record, as table column values
+        activity_row = dict(
+            id=str(uuid.uuid4()),
             calculation_id=calculation_id,
             activity_type="electricity_consumption",
             fuel_type=None,
@@ -331,7 +572,7 @@ class Scope2EmissionsCalculator:
             },
         )
 
-        self.db.add(activity_data)
+        activity_rows.append(activity_row)
 
         return {
             "activity_type": "electricity_consumption",
@@ -339,76 +580,39 @@ class Scope2EmissionsCalculator:
             "ch4_emissions": None,
             "n2o_emissions": None,
             "co2e_emissions": co2e_emissions,
-            "emission_factor_id": str(emission_factor.id),
-            "emission_factor_value": emission_factor.co2e_factor,
-            "emission_factor_source": emission_factor.source,
-            "emission_factor_unit": emission_factor.unit,
             "electricity_region": region,
         }
 
-    def _determine_electricity_region(self, location: Optional[str]) -> str:
-        """Enhanced EPA eGRID region determination from location"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _determine_electricity_region(location: Optional[str]) -> str:
+        """Enhanced EPA eGRID region determination from location
+
+        Cached per location string, as rows often repeat a facility address and
+        each row's region is needed by validation, calculation and insights.
+        """
         if not location:
             return "camx"  # Default to California region
 
         location_upper = location.upper().strip()
 
         # First, check for specific cities (more precise than state-level)
-        for city, region in self.city_to_region.items():
-            if city in location_upper:
-                logger.info(
-                    f"Matched city '{city}' to region '{region}' for location: {location}"
-                )
-                return region
+        city = _first_match(CITY_PATTERN, location_upper, CITY_TO_REGION)
+        if city:
+            region = CITY_TO_REGION[city]
+            logger.info(
+                f"Matched city '{city}' to region '{region}' for location: {location}"
+            )
+            return region
 
         # Check for state codes (2-letter abbreviations)
-        for state_code, region in self.state_to_region.items():
-            # Look for state code as separate word or with common separators
-            if (
-                f" {state_code} " in f" {location_upper} "
-                or f",{state_code}" in location_upper
-                or f"-{state_code}" in location_upper
-            ):
-                logger.info(
-                    f"Matched state code '{state_code}' to region '{region}' for location: {location}"
-                )
-                return region
-
-        # Check for full state names
-        state_names = {
-            "CALIFORNIA": "camx",
-            "TEXAS": "erct",
-            "FLORIDA": "frcc",
-            "NEW YORK": "nyup",
-            "MASSACHUSETTS": "newe",
-            "CONNECTICUT": "newe",
-            "MAINE": "newe",
-            "NEW HAMPSHIRE": "newe",
-            "RHODE ISLAND": "newe",
-            "VERMONT": "newe",
-            "WASHINGTON": "nwpp",
-            "OREGON": "nwpp",
-            "IDAHO": "nwpp",
-            "MONTANA": "nwpp",
-            "WYOMING": "nwpp",
-            "UTAH": "nwpp",
-            "NEVADA": "nwpp",
-            "ARIZONA": "aznm",
-            "NEW MEXICO": "aznm",
-            "HAWAII": "hioa",
-            "ALASKA": "akgd",
-            "NEW JERSEY": "rfce",
-            "PENNSYLVANIA": "rfce",
-            "DELAWARE": "rfce",
-            "MARYLAND": "rfce",
-            "MICHIGAN": "rfcm",
-            "OHIO": "rfcw",
-            "WEST VIRGINIA": "rfcw",
-            "ARKANSAS": "srmv",
-            "LOUISIANA": "srmv",
-            "MISSISSIPPI": "srmv",
-            "ILLINOIS": "srmw",
-        }
+        state_code = _first_match(STATE_CODE_PATTERN, location_upper, STATE_TO_REGION)
+        if state_code:
+            region = STATE_TO_REGION[state_code]
+            logger.info(
+                f"Matched state code '{state_code}' to region '{region}' for location: {location}"
+            )
+            return region
 
         # If no match found, default to California region
         logger.warning(
@@ -416,112 +620,115 @@ class Scope2EmissionsCalculator:
         )
         return "camx"
 
-    async def _get_electricity_emission_factor(
-        self, region: str, calculation_method: str
-    ) -> Optional[EmissionFactor]:
-        """Get appropriate EPA emission factor for electricity region and calculation method"""
+    async def _prefetch_electricity_emission_factors(
+        self, regions: List[str], calculation_method: str
+    ) -> Dict[str, Optional[ElectricityFactor]]:
+        """Get the EPA emission factor of each distinct electricity region
+
+        All current eGRID electricity factors are loaded in one lookup and the
+        first of each region is used, rather than one lookup per region. The
+        cached list may hold only some regions (a region-filtered lookup caches
+        its subset under the same key), so regions missing from it are loaded
+        from the database in one query. The fields used per row are copied
+        into an ``ElectricityFactor``.
+        """
+        if not regions:
+            return {}
+
+        # For location-based method, use the first available factor
+        # For market-based method, we would need additional logic for renewable
+        # energy credits; for now the location-based factor is the fallback
+        if calculation_method not in ("location_based", "market_based"):
+            logger.warning(
+                f"Unknown calculation method: {calculation_method}, using location_based"
+            )
+
         try:
             # Use the EPA cached service to get electricity emission factors
             factors = await self.epa_service.get_emission_factors(
                 source="EPA_EGRID",  # Use eGRID data for electricity
-                electricity_region=region,
                 category="electricity",
             )
+        except Exception as e:
+            logger.error(f"Error getting electricity emission factors: {str(e)}")
+            factors = []
 
-            if not factors:
-                logger.warning(
-                    f"No emission factors found for electricity region {region}"
+        factors_by_region: Dict[str, Optional[ElectricityFactor]] = dict.fromkeys(
+            regions
+        )
+
+        def add_factors(factors) -> None:
+            for factor in factors:
+                region = factor.electricity_region
+                if region in factors_by_region and factors_by_region[region] is None:
+                    factors_by_region[region] = ElectricityFactor.from_model(factor)
+
+        add_factors(factors or [])
+
+        missing = [region for region, factor in factors_by_region.items() if not factor]
+        if missing:
+            add_factors(
+                self.db.scalars(
+                    ELECTRICITY_FACTORS_BY_REGIONS_QUERY, {"regions": missing}
                 )
-                return None
-
-            # For location-based method, use the first available factor
-            # For market-based method, we would need additional logic for renewable energy credits
-            if calculation_method == "location_based":
-                # Return the most recent factor
-                return factors[0] if factors else None
-            elif calculation_method == "market_based":
-                # For market-based, we might need to adjust for renewable energy purchases
-                # For now, return the location-based factor as fallback
-                return factors[0] if factors else None
-            else:
+            )
+
+        for region, factor in factors_by_region.items():
+            if factor is None:
                 logger.warning(
-                    f"Unknown calculation method: {calculation_method}, using location_based"
+                    f"No emission factors found for electricity region {region}"
                 )
-                return factors[0] if factors else None
-
-        except Exception as e:
-            logger.error(
-                f"Error getting electricity emission factor for region {region}: {str(e)}"
-            )
-            return None
+        return factors_by_region
 
     def _convert_electricity_units(
         self, quantity: float, from_unit: str, to_unit: str
     ) -> float:
         """Convert electricity units (e.g., kWh to MWh)"""
-        from_unit_norm = self._normalize_electricity_unit(from_unit)
-        to_unit_norm = self._normalize_electricity_unit(to_unit)
+        conversion_factor = self._electricity_conversion_factor(from_unit, to_unit)
+        if conversion_factor is None:
+            # If no conversion found, log warning and return original
+            logger.warning(
+                f"No electricity unit conversion found for {from_unit} to {to_unit}, using original quantity"
+            )
+            return quantity
+
+        converted_value = quantity * conversion_factor
+        logger.debug(
+            "Converted %s %s to %s %s", quantity, from_unit, converted_value, to_unit
+        )
+        return converted_value
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _electricity_conversion_factor(
+        cls, from_unit: str, to_unit: str
+    ) -> Optional[float]:
+        """Multiplier from one electricity unit to another, or None if unknown"""
+        from_unit_norm = cls._normalize_electricity_unit(from_unit)
+        to_unit_norm = cls._normalize_electricity_unit(to_unit)
 
         # If units are the same, no conversion needed
         if from_unit_norm == to_unit_norm:
-            return quantity
-
-        # Comprehensive electricity conversion factors
-        conversion_factors = {
-            # Energy conversions (electricity)
-            ("kwh", "mwh"): 0.001,
-            ("mwh", "kwh"): 1000.0,
-            ("kwh", "gwh"): 0.000001,
-            ("gwh", "kwh"): 1000000.0,
-            ("mwh", "gwh"): 0.001,
-            ("gwh", "mwh"): 1000.0,
-            ("twh", "gwh"): 1000.0,
-            ("gwh", "twh"): 0.001,
-            ("twh", "mwh"): 1000000.0,
-            ("mwh", "twh"): 0.000001,
-            # Power to energy conversions (assuming 1 hour)
-            ("kw", "kwh"): 1.0,  # Assuming 1 hour operation
-            ("mw", "mwh"): 1.0,
-            ("gw", "gwh"): 1.0,
-            # Energy to other energy units
-            ("kwh", "mj"): 3.6,
-            ("mj", "kwh"): 0.277778,
-            ("kwh", "btu"): 3412.14,
-            ("btu", "kwh"): 0.000293071,
-            ("mwh", "mmbtu"): 3.41214,
-            ("mmbtu", "mwh"): 0.293071,
-            # Thermal energy conversions
-            ("therms", "kwh"): 29.3001,
-            ("kwh", "therms"): 0.0341296,
-            ("mcf", "kwh"): 293.001,  # Thousand cubic feet of natural gas
-            ("kwh", "mcf"): 0.00341296,
-        }
+            return 1.0
 
         # Look for direct conversion
-        conversion_key = (from_unit_norm, to_unit_norm)
-        if conversion_key in conversion_factors:
-            converted_value = quantity * conversion_factors[conversion_key]
-            logger.debug(
-                f"Converted {quantity} {from_unit} to {converted_value} {to_unit}"
-            )
-            return converted_value
+        conversion_factor = ELECTRICITY_CONVERSION_FACTORS.get(
+            (from_unit_norm, to_unit_norm)
+        )
+        if conversion_factor is not None:
+            return conversion_factor
 
         # Try reverse conversion
-        reverse_key = (to_unit_norm, from_unit_norm)
-        if reverse_key in conversion_factors:
-            converted_value = quantity / conversion_factors[reverse_key]
-            logger.debug(
-                f"Converted {quantity} {from_unit} to {converted_value} {to_unit} (reverse)"
-            )
-            return converted_value
-
-        # If no conversion found, log warning and return original
-        logger.warning(
-            f"No electricity unit conversion found for {from_unit} to {to_unit}, using original quantity"
+        reverse_factor = ELECTRICITY_CONVERSION_FACTORS.get(
+            (to_unit_norm, from_unit_norm)
         )
-        return quantity
+        if reverse_factor is not None:
+            return 1.0 / reverse_factor
+
+        return None
 
-    def _normalize_electricity_unit(self, unit: str) -> str:
+    @staticmethod
+    def _normalize_electricity_unit(unit: str) -> str:
         """Normalize electricity unit strings for consistent matching"""
         if not unit:
             return ""
@@ -530,39 +737,7 @@ class Scope2EmissionsCalculator:
         normalized = unit.lower().strip()
 
         # Handle common electricity unit variations
-        unit_mappings = {
-            "kilowatt_hour": "kwh",
-            "kilowatt-hour": "kwh",
-            "kw_h": "kwh",
-            "kwhr": "kwh",
-            "kilowatthour": "kwh",
-            "megawatt_hour": "mwh",
-            "megawatt-hour": "mwh",
-            "mw_h": "mwh",
-            "mwhr": "mwh",
-            "megawatthour": "mwh",
-            "gigawatt_hour": "gwh",
-            "gigawatt-hour": "gwh",
-            "gw_h": "gwh",
-            "gwhr": "gwh",
-            "gigawatthour": "gwh",
-            "terawatt_hour": "twh",
-            "terawatt-hour": "twh",
-            "tw_h": "twh",
-            "twhr": "twh",
-            "terawatthour": "twh",
-            "kilowatt": "kw",
-            "megawatt": "mw",
-            "gigawatt": "gw",
-            "megajoule": "mj",
-            "british_thermal_unit": "btu",
-            "million_btu": "mmbtu",
-            "therm": "therms",
-            "thousand_cubic_feet": "mcf",
-            "mcf_gas": "mcf",
-        }
-
-        return unit_mappings.get(normalized, normalized)
+        return ELECTRICITY_UNIT_MAPPINGS.get(normalized, normalized)
 
     def _apply_renewable_adjustments(
         self,
@@ -581,61 +756,51 @@ class Scope2EmissionsCalculator:
 
         additional_data = electricity_data.additional_data
 
+        # Combined multiplier of all percentage adjustments, applied once
+        adjustment_factor = 1.0
+
         # Handle different calculation methods
         if calculation_method == "market_based":
             # Market-based method considers contractual arrangements
-
-            # Renewable Energy Certificates (RECs)
             recs_mwh = additional_data.get("recs_mwh", 0)
-            if recs_mwh > 0:
-                # Convert electricity quantity to MWh for REC calculation
+            ppa_emission_factor = additional_data.get("ppa_emission_factor")
+
+            # Convert electricity quantity to MWh once for RECs and PPAs
+            if recs_mwh > 0 or ppa_emission_factor is not None:
                 electricity_mwh = self._convert_electricity_units(
                     electricity_data.quantity, electricity_data.unit, "mwh"
                 )
 
-                # Calculate REC coverage percentage
-                rec_coverage = (
-                    min(100, (recs_mwh / electricity_mwh) * 100)
-                    if electricity_mwh > 0
-                    else 0
-                )
-
-                # Apply REC adjustment (RECs typically have zero emissions)
-                adjustment_factor = (100 - rec_coverage) / 100
-                co2_emissions = (
-                    co2_emissions * adjustment_factor if co2_emissions else None
-                )
-                co2e_emissions = co2e_emissions * adjustment_factor
+            # Power Purchase Agreements (PPAs) with specific emission factors
+            if ppa_emission_factor is not None:
+                # Use PPA-specific emission factor instead of grid average; it
+                # replaces the grid emissions, so REC coverage no longer applies
+                # (assume PPA factor is in tCO2e/MWh)
+                co2e_emissions = electricity_mwh * ppa_emission_factor
+                co2_emissions = co2e_emissions  # Assume all CO2 for simplicity
 
                 logger.info(
-                    f"Applied REC adjustment: {rec_coverage:.1f}% coverage, {adjustment_factor:.3f} factor"
+                    f"Applied PPA emission factor: {ppa_emission_factor} tCO2e/MWh"
                 )
 
-            # Power Purchase Agreements (PPAs) with specific emission factors
-            ppa_emission_factor = additional_data.get("ppa_emission_factor")
-            if ppa_emission_factor is not None:
-                # Use PPA-specific emission factor instead of grid average
-                converted_quantity = self._convert_electricity_units(
-                    electricity_data.quantity,
-                    electricity_data.unit,
-                    "mwh",  # Assume PPA factor is in tCO2e/MWh
+            # Renewable Energy Certificates (RECs)
+            elif recs_mwh > 0:
+                # Calculate REC coverage share
+                rec_coverage = (
+                    min(1.0, recs_mwh / electricity_mwh) if electricity_mwh > 0 else 0.0
                 )
 
-                co2e_emissions = converted_quantity * ppa_emission_factor
-                co2_emissions = co2e_emissions  # Assume all CO2 for simplicity
+                # Apply REC adjustment (RECs typically have zero emissions)
+                adjustment_factor = 1.0 - rec_coverage
 
                 logger.info(
-                    f"Applied PPA emission factor: {ppa_emission_factor} tCO2e/MWh"
+                    f"Applied REC adjustment: {rec_coverage:.1%} coverage, {adjustment_factor:.3f} factor"
                 )
 
             # Green tariff programs
             green_tariff_pct = additional_data.get("green_tariff_percentage", 0)
             if green_tariff_pct > 0:
-                adjustment_factor = (100 - green_tariff_pct) / 100
-                co2_emissions = (
-                    co2_emissions * adjustment_factor if co2_emissions else None
-                )
-                co2e_emissions = co2e_emissions * adjustment_factor
+                adjustment_factor *= (100 - green_tariff_pct) / 100
 
                 logger.info(
                     f"Applied green tariff adjustment: {green_tariff_pct}% green energy"
@@ -653,17 +818,12 @@ class Scope2EmissionsCalculator:
 
                 # Reduce grid electricity by on-site renewable generation
                 net_grid_electricity = max(0, electricity_mwh - onsite_renewable_mwh)
-                reduction_factor = (
+                adjustment_factor = (
                     net_grid_electricity / electricity_mwh if electricity_mwh > 0 else 0
                 )
 
-                co2_emissions = (
-                    co2_emissions * reduction_factor if co2_emissions else None
-                )
-                co2e_emissions = co2e_emissions * reduction_factor
-
                 logger.info(
-                    f"Applied on-site renewable offset: {onsite_renewable_mwh} MWh, {reduction_factor:.3f} factor"
+                    f"Applied on-site renewable offset: {onsite_renewable_mwh} MWh, {adjustment_factor:.3f} factor"
                 )
 
             # Grid renewable percentage (if utility provides specific data)
@@ -673,33 +833,30 @@ class Scope2EmissionsCalculator:
                 # but can be used for validation or adjustment
                 logger.info(f"Grid renewable percentage: {grid_renewable_pct}%")
 
+        if adjustment_factor != 1.0:
+            co2_emissions = co2_emissions * adjustment_factor if co2_emissions else None
+            co2e_emissions = co2e_emissions * adjustment_factor
+
         return co2_emissions, co2e_emissions
 
     async def _validate_calculation_request(
-        self, request: Scope2CalculationRequest
+        self,
+        request: Scope2CalculationRequest,
+        regions: List[str],
+        emission_factors: Dict[str, Optional[ElectricityFactor]],
     ) -> CalculationValidationResult:
         """Validate Scope 2 calculation request"""
         errors = []
         warnings = []
 
         # Check if company exists
-        company = (
-            self.db.query(Company).filter(Company.id == request.company_id).first()
-        )
+        company = self._get_company(request.company_id)
         if not company:
             errors.append(f"Company {request.company_id} not found")
 
         # Check entity if provided
         if request.entity_id:
-            entity = (
-                self.db.query(CompanyEntity)
-                .filter(
-                    CompanyEntity.id == request.entity_id,
-                    CompanyEntity.company_id == request.company_id,
-                )
-                .first()
-            )
-            if not entity:
+            if not self._entity_exists(request.entity_id, request.company_id):
                 errors.append(
                     f"Entity {request.entity_id} not found for company {request.company_id}"
                 )
@@ -708,7 +865,9 @@ class Scope2EmissionsCalculator:
         if not request.electricity_consumption:
             errors.append("At least one electricity consumption data item is required")
 
-        for i, consumption in enumerate(request.electricity_consumption):
+        for i, (consumption, region) in enumerate(
+            zip(request.electricity_consumption, regions)
+        ):
             if consumption.quantity <= 0:
                 errors.append(
                     f"Electricity consumption {i+1}: Quantity must be positive"
@@ -718,11 +877,7 @@ class Scope2EmissionsCalculator:
                 errors.append(f"Electricity consumption {i+1}: Unit is required")
 
             # Check if emission factor exists for this region
-            region = self._determine_electricity_region(consumption.location)
-            factor = await self._get_electricity_emission_factor(
-                region, request.calculation_method
-            )
-            if not factor:
+            if not emission_factors.get(region):
                 warnings.append(
                     f"Electricity consumption {i+1}: No emission factor found for region {region}"
                 )
@@ -751,26 +906,18 @@ class Scope2EmissionsCalculator:
         self, electricity_data: List[ActivityDataInput]
     ) -> float:
         """Calculate data completeness score for electricity data"""
-        total_fields = 0
-        completed_fields = 0
-
-        for consumption in electricity_data:
-            total_fields += 7  # Number of key fields for electricity
-
-            if consumption.quantity:
-                completed_fields += 1
-            if consumption.unit:
-                completed_fields += 1
-            if consumption.location:
-                completed_fields += 1
-            if consumption.data_source:
-                completed_fields += 1
-            if consumption.data_quality:
-                completed_fields += 1
-            if consumption.activity_period_start:
-                completed_fields += 1
-            if consumption.activity_period_end:
-                completed_fields += 1
+        # Number of key fields provided, 7 per electricity entry
+        total_fields = 7 * len(electricity_data)
+        completed_fields = sum(
+            bool(consumption.quantity)
+            + bool(consumption.unit)
+            + bool(consumption.location)
+            + bool(consumption.data_source)
+            + bool(consumption.data_quality)
+            + bool(consumption.activity_period_start)
+            + bool(consumption.activity_period_end)
+            for consumption in electricity_data
+        )
 
         return (completed_fields / total_fields) * 100 if total_fields > 0 else 0
 
@@ -783,92 +930,71 @@ class Scope2EmissionsCalculator:
 
         total_weighted_score = 0.0
         total_weight = 0.0
+        score_quality = self._score_consumption_quality
 
         for consumption in electricity_data:
-            # Base quality score (electricity typically has higher base scores)
-            quality_scores = {
-                "measured": 95,  # Smart meters, utility bills
-                "calculated": 85,  # Calculated from sub-meters
-                "estimated": 70,  # Engineering estimates
-                "default": 60,
-            }
-
-            base_score = quality_scores.get(consumption.data_quality or "measured", 60)
+            # Weight by quantity (larger consumption has more impact)
+            quantity = consumption.quantity
+            weight = quantity if quantity > 0 else 1.0
+            total_weighted_score += score_quality(consumption) * weight
+            total_weight += weight
 
-            # Apply modifiers based on data completeness
-            modifiers = 0
+        return total_weighted_score / total_weight if total_weight > 0 else 75.0
 
-            # Data source modifier (electricity-specific)
-            if consumption.data_source:
-                source_lower = consumption.data_source.lower()
-                if "smart meter" in source_lower or "utility bill" in source_lower:
-                    modifiers += 15  # High-quality electricity sources
-                elif "sub-meter" in source_lower or "building meter" in source_lower:
-                    modifiers += 10
-                elif "estimate" in source_lower:
-                    modifiers -= 10
+    @staticmethod
+    def _score_consumption_quality(consumption: ActivityDataInput) -> float:
+        """Quality score of a single consumption, from its quality and modifiers"""
+        # Base quality score
+        base_score = DATA_QUALITY_SCORES.get(consumption.data_quality or "measured", 60)
+
+        # Data source modifier (electricity-specific)
+        modifiers = _token_modifier(
+            (consumption.data_source or "").lower(),
+            SOURCE_QUALITY_PATTERN,
+            SOURCE_QUALITY_TOKENS,
+        )
 
-            # Location specificity modifier (important for regional factors)
-            if consumption.location:
-                if (
-                    len(consumption.location) > 15
-                ):  # Detailed location with state/region
-                    modifiers += 10
-                elif len(consumption.location) > 5:  # Basic location
-                    modifiers += 5
-
-            # Measurement method modifier
-            if consumption.measurement_method:
-                method_lower = consumption.measurement_method.lower()
-                if "continuous" in method_lower or "smart meter" in method_lower:
-                    modifiers += 15
-                elif "monthly" in method_lower or "periodic" in method_lower:
-                    modifiers += 10
-                elif "annual" in method_lower:
-                    modifiers += 5
-
-            # Time period specificity (electricity billing cycles)
-            if consumption.activity_period_start and consumption.activity_period_end:
-                period_days = (
-                    consumption.activity_period_end - consumption.activity_period_start
-                ).days
-                if period_days <= 31:  # Monthly billing
-                    modifiers += 10
-                elif period_days <= 92:  # Quarterly
-                    modifiers += 5
-
-            # Renewable energy data bonus
-            if (
-                consumption.additional_data
-                and consumption.additional_data.get("renewable_percentage") is not None
-            ):
-                modifiers += 5  # Bonus for renewable energy tracking
+        # Location specificity modifier (important for regional factors)
+        location_length = len(consumption.location or "")
+        if location_length > 15:  # Detailed location with state/region
+            modifiers += 10
+        elif location_length > 5:  # Basic location
+            modifiers += 5
+
+        # Measurement method modifier
+        modifiers += _token_modifier(
+            (consumption.measurement_method or "").lower(),
+            MEASUREMENT_QUALITY_PATTERN,
+            MEASUREMENT_QUALITY_TOKENS,
+        )
 
-            # Calculate final score for this consumption
-            final_score = min(100, max(0, base_score + modifiers))
+        # Time period specificity (electricity billing cycles)
+        period_start = consumption.activity_period_start
+        period_end = consumption.activity_period_end
+        if period_start and period_end:
+            period_days = (period_end - period_start).days
+            if period_days <= 31:  # Monthly billing
+                modifiers += 10
+            elif period_days <= 92:  # Quarterly
+                modifiers += 5
 
-            # Weight by quantity (larger consumption has more impact)
-            weight = consumption.quantity if consumption.quantity > 0 else 1.0
-            total_weighted_score += final_score * weight
-            total_weight += weight
+        # Renewable energy data bonus
+        additional_data = consumption.additional_data
+        if additional_data and additional_data.get("renewable_percentage") is not None:
+            modifiers += 5  # Bonus for renewable energy tracking
 
-        return total_weighted_score / total_weight if total_weight > 0 else 75.0
+        # Calculate final score for this consumption
+        return min(100, max(0, base_score + modifiers))
 
     def _estimate_uncertainty(
         self, electricity_data: List[ActivityDataInput], calculation_method: str
     ) -> float:
         """Estimate uncertainty percentage for Scope 2 calculation"""
         # Base uncertainty by calculation method
-        method_uncertainty = {
-            "location_based": 10.0,  # Location-based typically more uncertain
-            "market_based": 15.0,  # Market-based can be more uncertain due to renewable claims
-        }
-
-        base_uncertainty = method_uncertainty.get(calculation_method, 12.0)
+        base_uncertainty = UNCERTAINTY_BY_METHOD.get(calculation_method, 12.0)
 
         # Adjust based on data quality
-        quality_adjustments = {"measured": 0.0, "calculated": 3.0, "estimated": 8.0}
-
+        quality_adjustments = UNCERTAINTY_ADJUSTMENT_BY_QUALITY
         total_adjustment = 0
         count = 0
 
@@ -887,53 +1013,65 @@ class Scope2EmissionsCalculator:
         """Generate comprehensive recommendations for improving Scope 2 calculations"""
         recommendations = []
 
+        # Gather every count in a single pass over the consumption items
+        missing_locations = 0
+        estimated_count = 0
+        non_continuous = 0
+        missing_sources = 0
+        annual_periods = 0
+        has_renewable_data = False
+        locations = set()
+
+        for consumption in electricity_data:
+            if consumption.location:
+                locations.add(consumption.location)
+            else:
+                missing_locations += 1
+            if consumption.data_quality == "estimated":
+                estimated_count += 1
+            measurement_method = consumption.measurement_method
+            if not measurement_method or "continuous" not in measurement_method.lower():
+                non_continuous += 1
+            if not consumption.data_source:
+                missing_sources += 1
+            period_start = consumption.activity_period_start
+            period_end = consumption.activity_period_end
+            if period_start and period_end and (period_end - period_start).days > 365:
+                annual_periods += 1
+            additional_data = consumption.additional_data
+            if not has_renewable_data and additional_data:
+                has_renewable_data = (
+                    additional_data.get("renewable_percentage") is not None
+                    or additional_data.get("recs_mwh") is not None
+                    or additional_data.get("ppa_emission_factor") is not None
+                )
+
         # Location-based recommendations (critical for regional factors)
-        missing_locations = sum(
-            1 for consumption in electricity_data if not consumption.location
-        )
         if missing_locations > 0:
             recommendations.append(
                 f"📍 Specify locations for {missing_locations} electricity consumption items for accurate regional eGRID factors - can impact emissions by ±50%"
             )
 
         # Data quality improvements
-        estimated_count = sum(
-            1
-            for consumption in electricity_data
-            if consumption.data_quality == "estimated"
-        )
         if estimated_count > 0:
             recommendations.append(
                 f"🎯 Obtain utility bills or smart meter data for {estimated_count} estimated consumption items to improve accuracy by up to 25%"
             )
 
         # Smart meter recommendations
-        non_continuous = sum(
-            1
-            for consumption in electricity_data
-            if not consumption.measurement_method
-            or "continuous" not in consumption.measurement_method.lower()
-        )
         if non_continuous > 0:
             recommendations.append(
                 f"📊 Consider smart meter installation for {non_continuous} locations to enable continuous monitoring and better data quality"
             )
 
         # Data source improvements
-        missing_sources = sum(
-            1 for consumption in electricity_data if not consumption.data_source
-        )
         if missing_sources > 0:
             recommendations.append(
                 f"📋 Add data sources for {missing_sources} electricity consumption items for better audit trail"
             )
 
-        # Regional accuracy recommendations
-        regions_detected = set()
-        for consumption in electricity_data:
-            if consumption.location:
-                region = self._determine_electricity_region(consumption.location)
-                regions_detected.add(region)
+        # Regional accuracy recommendations, resolving each distinct location once
+        regions_detected = set(map(self._determine_electricity_region, locations))
 
         if len(regions_detected) > 3:
             recommendations.append(
@@ -967,49 +1105,24 @@ class Scope2EmissionsCalculator:
             )
 
         # Renewable energy data recommendations
-        has_renewable_data = any(
-            consumption.additional_data
-            and (
-                consumption.additional_data.get("renewable_percentage") is not None
-                or consumption.additional_data.get("recs_mwh") is not None
-                or consumption.additional_data.get("ppa_emission_factor") is not None
-            )
-            for consumption in electricity_data
-        )
-
         if not has_renewable_data and calculation_method == "market_based":
             recommendations.append(
                 "🔋 Add renewable energy data (RECs, PPAs, green tariffs) to leverage market-based method benefits"
             )
 
         # Time granularity recommendations
-        annual_periods = sum(
-            1
-            for consumption in electricity_data
-            if consumption.activity_period_start
-            and consumption.activity_period_end
-            and (
-                consumption.activity_period_end - consumption.activity_period_start
-            ).days
-            > 365
-        )
         if annual_periods > 0:
             recommendations.append(
                 f"📅 Break down {annual_periods} annual electricity consumption periods into monthly data for seasonal accuracy"
             )
 
-        # Large consumption recommendations
-        if electricity_data:
-            sorted_consumption = sorted(
-                electricity_data, key=lambda x: x.quantity, reverse=True
-            )
-            top_consumers = sorted_consumption[:3]  # Top 3 largest consumers
-
-            for i, consumption in enumerate(top_consumers):
-                if consumption.data_quality == "estimated":
-                    recommendations.append(
-                        f"⚡ High-consumption location #{i+1} uses estimated data - prioritize smart meter installation for maximum accuracy improvement"
-                    )
+        # Large consumption recommendations: top 3, without a full sort
+        top_consumers = nlargest(3, electricity_data, key=attrgetter("quantity"))
+        for i, consumption in enumerate(top_consumers):
+            if consumption.data_quality == "estimated":
+                recommendations.append(
+                    f"⚡ High-consumption location #{i+1} uses estimated data - prioritize smart meter installation for maximum accuracy improvement"
+                )
 
         # Utility program recommendations
         recommendations.append(
@@ -1036,41 +1149,6 @@ class Scope2EmissionsCalculator:
         )
 
         return recommendations
-        regions = set(
-            self._determine_electricity_region(c.location) for c in electricity_data
-        )
-        if len(regions) > 1:
-            recommendations.append(
-                f"🗺️ Multiple electricity regions detected ({len(regions)}) - ensure location accuracy for optimal regional factors"
-            )
-
-        # Smart meter recommendations
-        no_smart_meter = sum(
-            1
-            for consumption in electricity_data
-            if not consumption.data_source
-            or "smart meter" not in consumption.data_source.lower()
-        )
-        if no_smart_meter > 0:
-            recommendations.append(
-                f"📊 Consider smart meter installation for {no_smart_meter} consumption points for continuous monitoring"
-            )
-
-        # SEC compliance
-        recommendations.append(
-            "🏛️ Ensure all electricity data sources are auditable and documentation is SEC-compliant"
-        )
-        recommendations.append(
-            "✅ Verify EPA eGRID factors are current - system uses latest available regional factors"
-        )
-
-        # Market-based method specific
-        if calculation_method == "market_based":
-            recommendations.append(
-                "🔄 Consider dual reporting (location-based and market-based) for comprehensive disclosure"
-            )
-
-        return recommendations
 
     def _generate_calculation_insights(
         self,
@@ -1092,6 +1170,10 @@ class Scope2EmissionsCalculator:
             ),
         }
 
+        # Resolve each distinct location to its eGRID region once
+        locations = set(filter(None, map(attrgetter("location"), electricity_data)))
+        regions = set(map(self._determine_electricity_region, locations))
+
         # Summary statistics
         insights["summary"] = {
             "total_consumption_items": len(electricity_data),
@@ -1099,16 +1181,10 @@ class Scope2EmissionsCalculator:
             "average_co2e_per_item": (
                 round(total_co2e / len(electricity_data), 2) if electricity_data else 0
             ),
-            "regions_count": len(
-                set(
-                    self._determine_electricity_region(item.location)
-                    for item in electricity_data
-                    if item.location
-                )
-            ),
+            "regions_count": len(regions),
             "calculation_method": calculation_method,
             "data_sources_count": len(
-                set(item.data_source for item in electricity_data if item.data_source)
+                set(filter(None, map(attrgetter("data_source"), electricity_data)))
             ),
         }
 
@@ -1124,13 +1200,7 @@ class Scope2EmissionsCalculator:
                 )
                 for item in electricity_data
             ),
-            "regional_diversity": len(
-                set(
-                    self._determine_electricity_region(item.location)
-                    for item in electricity_data
-                    if item.location
-                )
-            ),
+            "regional_diversity": len(regions),
         }
 
         return insights
@@ -1138,7 +1208,7 @@ class Scope2EmissionsCalculator:
     # Reuse helper methods from Scope1Calculator
     def _verify_company_exists(self, company_id: str) -> Company:
         """Verify company exists"""
-        company = self.db.query(Company).filter(Company.id == company_id).first()
+        company = self._get_company(company_id)
         if not company:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1146,62 +1216,85 @@ class Scope2EmissionsCalculator:
             )
         return company
 
+    def _get_company(self, company_id: str) -> Optional[Company]:
+        """Get a company by ID, querying at most once per calculator"""
+        if company_id not in self._company_cache:
+            self._company_cache[company_id] = (
+                self.db.query(Company).filter(Company.id == company_id).first()
+            )
+        return self._company_cache[company_id]
+
+    def _entity_exists(self, entity_id: str, company_id: str) -> bool:
+        """Check a company's entity exists, querying at most once per calculator"""
+        cache_key = (entity_id, company_id)
+        if cache_key not in self._entity_cache:
+            # EXISTS check only; the entity row itself is never needed
+            self._entity_cache[cache_key] = self.db.scalar(
+                select(
+                    exists().where(
+                        CompanyEntity.id == entity_id,
+                        CompanyEntity.company_id == company_id,
+                    )
+                )
+            )
+        return self._entity_cache[cache_key]
+
     def _get_user_by_id(self, user_id: str):
         """Get user by ID - placeholder for actual user service"""
         # This would integrate with the actual user service
         return self.db.query(User).filter(User.id == user_id).first()
 
-    def _verify_entity_exists(self, entity_id: str, company_id: str) -> CompanyEntity:
-        """Verify entity exists and belongs to company"""
-        entity = (
-            self.db.query(CompanyEntity)
-            .filter(
-                CompanyEntity.id == entity_id, CompanyEntity.company_id == company_id
-            )
-            .first()
-        )
-        if not entity:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Entity {entity_id} not found for company {company_id}",
-            )
-        return entity
-
     def _generate_calculation_code(self, prefix: str, company_identifier: str) -> str:
         """Generate unique calculation code with microseconds and UUID for CI/CD safety"""
-        import uuid as uuid_lib
-
         timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")  # Include microseconds
         company_code = company_identifier[:3].upper() if company_identifier else "UNK"
-        unique_suffix = str(uuid_lib.uuid4())[
-            :8
-        ]  # Add 8-char UUID for extra uniqueness
+        unique_suffix = uuid.uuid4().hex[:8]  # Add 8-char UUID for extra uniqueness
         return f"{prefix}-{company_code}-{timestamp}-{unique_suffix}"
 
     def _create_audit_trail_entry(
-        self, calculation_id: uuid.UUID, event_type: str, description: str, user_id: str
+        self,
+        calculation_id: uuid.UUID,
+        event_type: str,
+        description: str,
+        user_id: uuid.UUID,
     ):
         """Create audit trail entry"""
         audit_entry = CalculationAuditTrail(
             calculation_id=calculation_id,
             event_type=event_type,
             event_description=description,
-            user_id=uuid.UUID(user_id),
+            user_id=user_id,
             user_role="system",
             reason="Automated calculation process",
         )
         self.db.add(audit_entry)
 
     def _build_calculation_response(
-        self, calculation: EmissionsCalculation
+        self,
+        calculation: EmissionsCalculation,
+        activity_rows: Optional[List[Dict[str, Any]]] = None,
     ) -> EmissionsCalculationResponse:
-        """Build calculation response with activity data"""
-        # Get activity data
-        activity_data = (
-            self.db.query(ActivityData)
-            .filter(ActivityData.calculation_id == calculation.id)
-            .all()
-        )
+        """Build calculation response with activity data
+
+        Rows already held in memory (e.g. just inserted by the calculation)
+        are used as-is; otherwise the activity data is loaded from the database.
+        """
+        if activity_rows is None:
+            # Get activity data as plain column tuples, skipping ORM instances
+            activity_rows = (
+                self.db.query(
+                    *(
+                        getattr(ActivityData, name)
+                        for name in ACTIVITY_DATA_RESPONSE_FIELDS
+                    )
+                )
+                .filter(ActivityData.calculation_id == calculation.id)
+                .all()
+            )
+        # Validate each row straight into the response model
+        activity_data = [
+            ActivityDataResponse.model_validate(row) for row in activity_rows
+        ]
 
         return EmissionsCalculationResponse(
             id=str(calculation.id),
@@ -1229,27 +1322,7 @@ class Scope2EmissionsCalculator:
             ),
             calculation_timestamp=calculation.calculation_timestamp,
             calculation_duration_seconds=calculation.calculation_duration_seconds,
-            activity_data=[
-                {
-                    "id": str(ad.id),
-                    "activity_type": ad.activity_type,
-                    "fuel_type": ad.fuel_type,
-                    "activity_description": ad.activity_description,
-                    "quantity": ad.quantity,
-                    "unit": ad.unit,
-                    "location": ad.location,
-                    "emission_factor_value": ad.emission_factor_value,
-                    "emission_factor_unit": ad.emission_factor_unit,
-                    "emission_factor_source": ad.emission_factor_source,
-                    "co2_emissions": ad.co2_emissions,
-                    "ch4_emissions": ad.ch4_emissions,
-                    "n2o_emissions": ad.n2o_emissions,
-                    "co2e_emissions": ad.co2e_emissions,
-                    "data_quality": ad.data_quality,
-                    "notes": ad.notes,
-                }
-                for ad in activity_data
-            ],
+            activity_data=activity_data,
             validation_errors=calculation.validation_errors,
             validation_warnings=calculation.validation_warnings,
             created_at=calculation.created_at,
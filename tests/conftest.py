@@ -4,12 +4,13 @@ Pytest configuration and fixtures for ENVOYOU SEC API tests
 
 import asyncio
 import os
+from contextlib import contextmanager
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -268,6 +269,26 @@ def client() -> Generator:
         yield test_client
 
 
+@pytest.fixture
+def record_statements():
+    """Context manager collecting the SQL statements issued inside it"""
+
+    @contextmanager
+    def record():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return record
+
+
 @pytest.fixture
 def test_user(db_session):
     """Create a test user"""
@@ -3,19 +3,34 @@ Test emissions calculations functionality
 Comprehensive tests for Scope 1 and Scope 2 calculations
 """
 
+import uuid
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
-from app.models.emissions import Company, CompanyEntity, EmissionsCalculation
+from app.core.audit_logger import AuditLog
+from app.models.emissions import (
+    ActivityData,
+    Company,
+    CompanyEntity,
+    EmissionsCalculation,
+)
+from app.models.epa_data import EmissionFactor
 from app.schemas.emissions import (
     ActivityDataInput,
     Scope1CalculationRequest,
     Scope2CalculationRequest,
 )
+from app.services import scope1_calculator, scope2_calculator
 from app.services.scope1_calculator import Scope1EmissionsCalculator
-from app.services.scope2_calculator import Scope2EmissionsCalculator
+from app.services.scope2_calculator import (
+    ElectricityFactor,
+    Scope2EmissionsCalculator,
+)
 
 
 class TestEmissionsCalculations:
@@ -174,6 +189,105 @@ class TestEmissionsCalculations:
         # Verify method
         assert "location_based" in result.method
 
+    @pytest.mark.asyncio
+    async def test_scope1_calculation_not_reloaded(
+        self,
+        db_session,
+        test_company,
+        test_emission_factors,
+        test_user,
+        record_statements,
+    ):
+        """Test the Scope 1 response is built without reloading the calculation"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        request = Scope1CalculationRequest(
+            calculation_name="Scope 1 Without Reload",
+            company_id=str(test_company.id),
+            reporting_period_start=datetime(2023, 1, 1),
+            reporting_period_end=datetime(2023, 12, 31),
+            activity_data=[
+                ActivityDataInput(
+                    activity_type="stationary_combustion",
+                    fuel_type="natural_gas",
+                    quantity=1000.0,
+                    unit="MMBtu",
+                )
+            ],
+        )
+
+        with record_statements() as statements:
+            result = await calculator.calculate_scope1_emissions(
+                request, str(test_user.id)
+            )
+
+        # Server-side timestamps come back with the writes, not a reload
+        assert not any(
+            s.startswith("SELECT") and "FROM emissions_calculations" in s
+            for s in statements
+        )
+        assert result.created_at is not None
+        assert result.updated_at is not None
+
+        # Activity data built from the inserted rows matches what was stored
+        calculation = (
+            db_session.query(EmissionsCalculation)
+            .filter_by(calculation_code=result.calculation_code)
+            .one()
+        )
+        stored = calculator._build_calculation_response(calculation)
+        assert result.activity_data == stored.activity_data
+
+    @pytest.mark.asyncio
+    async def test_scope2_calculation_single_commit(
+        self,
+        db_session,
+        test_company,
+        test_user,
+        test_emission_factors,
+        record_statements,
+    ):
+        """Test Scope 2 results and audit log share one commit and no reload"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        request = Scope2CalculationRequest(
+            calculation_name="Scope 2 Single Commit",
+            company_id=str(test_company.id),
+            reporting_period_start=datetime(2023, 1, 1),
+            reporting_period_end=datetime(2023, 12, 31),
+            electricity_consumption=[
+                ActivityDataInput(
+                    activity_type="electricity_consumption",
+                    quantity=1000.0,
+                    unit="MWh",
+                    location="Los Angeles, CA",
+                )
+            ],
+        )
+
+        with (
+            record_statements() as statements,
+            patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+            patch.object(calculator, "_get_user_by_id") as get_user,
+        ):
+            result = await calculator.calculate_scope2_emissions(
+                request, str(test_user.id), user=test_user
+            )
+
+        # Results and the audit log entry are written in a single commit, and
+        # the response is built without reloading the calculation or its rows
+        assert commit.call_count == 1
+        get_user.assert_not_called()
+        assert not any(
+            s.startswith("SELECT")
+            and ("FROM emissions_calculations" in s or "FROM activity_data" in s)
+            for s in statements
+        )
+        assert result.created_at is not None
+
+        # Activity data built from the inserted rows matches what was stored
+        calculation = db_session.get(EmissionsCalculation, result.id)
+        stored = calculator._build_calculation_response(calculation)
+        assert result.activity_data == stored.activity_data
+
     @pytest.mark.asyncio
     async def test_scope1_multiple_activities(
         self, db_session, test_company, test_user
@@ -220,6 +334,715 @@ class TestEmissionsCalculations:
             expected_total = 800 * 53.11 / 1000  # Convert kg to metric tons
             assert abs(result.total_co2e - expected_total) < 0.01
 
+    @pytest.mark.asyncio
+    async def test_prefetch_resolves_each_factor_once(self, db_session):
+        """Test repeated activity/fuel pairs share one emission factor lookup"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        activity_data = [
+            ActivityDataInput(
+                activity_type="stationary_combustion",
+                fuel_type=fuel_type,
+                quantity=100.0,
+                unit="MMBtu",
+            )
+            for fuel_type in ("natural_gas", "natural_gas", "diesel")
+        ]
+
+        with patch.object(
+            calculator, "_get_emission_factor", AsyncMock(return_value=None)
+        ) as get_factor:
+            factors = await calculator._prefetch_emission_factors(activity_data)
+
+        assert get_factor.await_count == 2
+        assert set(factors) == {
+            ("stationary_combustion", "natural_gas"),
+            ("stationary_combustion", "diesel"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_emission_factor_lookup_memoized(self, db_session):
+        """Test a selected factor, or a miss, is reused by the same calculator"""
+        calculator = Scope1EmissionsCalculator(db_session)
+
+        with patch.object(
+            calculator, "_select_best_emission_factor", AsyncMock(return_value=None)
+        ) as select_factor:
+            for _ in range(3):
+                factor = await calculator._get_emission_factor(
+                    "stationary_combustion", "natural_gas"
+                )
+
+        assert factor is None
+        assert select_factor.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_factor_cached_across_calculators(
+        self, db_session, test_emission_factors
+    ):
+        """Test fallback selections are shared by id until the factor is superseded"""
+        scope1_calculator._fallback_factor_ids.clear()
+        factor = await Scope1EmissionsCalculator(db_session)._fallback_factor_selection(
+            "stationary_combustion", "natural_gas"
+        )
+        assert factor.factor_code == "NG_COMB_001"
+        assert (
+            scope1_calculator._fallback_factor_ids[
+                ("stationary_combustion", "natural_gas")
+            ][1]
+            == factor.id
+        )
+
+        other = Scope1EmissionsCalculator(db_session)
+        assert (
+            other._get_cached_fallback_factor(("stationary_combustion", "natural_gas"))
+            is factor
+        )
+
+        factor.is_current = False
+        db_session.commit()
+        assert (
+            other._get_cached_fallback_factor(("stationary_combustion", "natural_gas"))
+            is None
+        )
+        assert not scope1_calculator._fallback_factor_ids
+
+    def test_generate_recommendations_counts(self, db_session):
+        """Test recommendation counts and high-impact estimated activities"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        activities = [
+            ActivityDataInput(
+                activity_type="stationary_combustion",
+                fuel_type="natural_gas",
+                quantity=quantity,
+                unit="MMBtu",
+                data_quality=quality,
+                activity_period_start=datetime(2023, 1, 1),
+                activity_period_end=datetime(2024, 3, 1),
+            )
+            for quantity, quality in [(10.0, "estimated"), (500.0, "measured")]
+        ] + [
+            ActivityDataInput(
+                activity_type="mobile_combustion",
+                fuel_type="diesel",
+                quantity=900.0,
+                unit="gallons",
+                location="Facility A",
+                data_source="Fuel cards",
+                data_quality="estimated",
+                measurement_method="Fuel receipts",
+                notes="Fleet trucks",
+            )
+        ]
+
+        summary = calculator._scan_activities(activities)
+        assert summary.activity_count == 3
+        assert summary.quality_distribution == {"estimated": 2, "measured": 1}
+        assert summary.fuel_types == {"natural_gas", "diesel"}
+        assert summary.fuel_breakdown["natural_gas"]["total_quantity"] == 510.0
+        assert calculator._estimate_uncertainty(summary) == pytest.approx(65.0 / 3)
+
+        recommendations = calculator._generate_recommendations(summary)
+
+        epa_factors = calculator._generate_calculation_insights(
+            summary,
+            1.0,
+            {
+                "stationary_combustion": {
+                    "factor_source": "EPA_GHGRP",
+                    "factor_year": 2022,
+                },
+                "mobile_combustion": {
+                    "factor_source": "EPA_GHGRP",
+                    "factor_year": 2023,
+                },
+            },
+            80.0,
+            70.0,
+        )["epa_factors"]
+        assert epa_factors["sources"] == ["EPA_GHGRP"]
+        assert epa_factors["latest_factor_year"] == 2023
+
+        assert recommendations[:5] == [
+            "🎯 Improve 2 estimated data points with measured values to increase accuracy by up to 40%",
+            "📋 Add data sources for 2 activity items for better audit trail",
+            "📍 Specify locations for 2 activities for regional emission factor accuracy",
+            "🔬 Define measurement methods for 2 activities to improve data quality score",
+            "📅 Consider breaking down 2 annual periods into monthly/quarterly data for better accuracy",
+        ]
+        high_impact = [r for r in recommendations if r.startswith("⚡")]
+        assert len(high_impact) == 2
+        assert "#1 (mobile_combustion)" in high_impact[0]
+        assert "#3 (stationary_combustion)" in high_impact[1]
+        assert (
+            "📝 Add documentation/notes for 2 activities to support audit requirements"
+            in recommendations
+        )
+
+    def test_rating_thresholds(self, db_session):
+        """Test rating helpers at their threshold boundaries"""
+        calculator = Scope1EmissionsCalculator(db_session)
+
+        assert calculator._rate_data_quality(90) == "excellent"
+        assert calculator._rate_data_quality(89.9) == "good"
+        assert calculator._rate_data_quality(60) == "poor"
+        assert calculator._rate_data_quality(59.9) == "very_poor"
+        assert calculator._rate_completeness(95) == "complete"
+        assert calculator._rate_completeness(84.9) == "partially_complete"
+        assert calculator._rate_completeness(69.9) == "incomplete"
+        assert calculator._categorize_emissions_intensity(0.0, 0) == "no_data"
+        assert calculator._categorize_emissions_intensity(0.9, 1) == "low"
+        assert calculator._categorize_emissions_intensity(10.0, 1) == "high"
+        assert calculator._categorize_emissions_intensity(100.0, 2) == "very_high"
+
+    def test_scope2_company_lookup_cached(self, db_session, test_company):
+        """Test Scope 2 queries each company once per calculator"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        company_id = str(test_company.id)
+
+        with patch.object(db_session, "query", wraps=db_session.query) as query:
+            assert calculator._get_company(company_id).id == test_company.id
+            assert calculator._verify_company_exists(company_id).id == test_company.id
+            assert calculator._get_company("missing") is None
+            assert calculator._get_company("missing") is None
+
+        assert query.call_count == 2
+
+    def test_scope2_entity_exists_cached(self, db_session, test_company, test_entity):
+        """Test Scope 2 checks each entity with one EXISTS query per calculator"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        company_id = str(test_company.id)
+        entity_id = str(test_entity.id)
+
+        with patch.object(db_session, "scalar", wraps=db_session.scalar) as scalar:
+            assert calculator._entity_exists(entity_id, company_id) is True
+            assert calculator._entity_exists(entity_id, company_id) is True
+            assert calculator._entity_exists(company_id, company_id) is False
+
+        assert scalar.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scope2_activity_rows_inserted_in_one_batch(
+        self, db_session, test_company, test_user, test_emission_factors
+    ):
+        """Test every electricity entry is written by one executemany"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        request = Scope2CalculationRequest(
+            calculation_name="Batched Electricity Rows",
+            company_id=str(test_company.id),
+            reporting_period_start=datetime(2023, 1, 1),
+            reporting_period_end=datetime(2023, 12, 31),
+            electricity_consumption=[
+                ActivityDataInput(
+                    activity_type="electricity_consumption",
+                    quantity=quantity,
+                    unit="MWh",
+                    location="Los Angeles, CA",
+                )
+                for quantity in (100.0, 200.0, 300.0)
+            ],
+        )
+
+        with (
+            patch.object(db_session, "add", wraps=db_session.add) as add,
+            patch.object(db_session, "execute", wraps=db_session.execute) as execute,
+        ):
+            result = await calculator.calculate_scope2_emissions(
+                request, str(test_user.id), user=test_user
+            )
+
+        batches = [
+            call.args[1]
+            for call in execute.call_args_list
+            if call.args and call.args[0] is scope2_calculator.ACTIVITY_DATA_INSERT
+        ]
+        assert [len(rows) for rows in batches] == [3]
+        assert not any(
+            isinstance(call.args[0], ActivityData) for call in add.call_args_list
+        )
+        assert (
+            db_session.query(ActivityData)
+            .filter(ActivityData.calculation_id == result.id)
+            .count()
+            == 3
+        )
+
+    def test_determine_electricity_region(self, db_session):
+        """Test region lookup by city, then state code"""
+        calculator = Scope2EmissionsCalculator(db_session)
+
+        assert calculator._determine_electricity_region("Brooklyn, NY") == "nyis"
+        assert calculator._determine_electricity_region("Albany, NY") == "nyup"
+        assert calculator._determine_electricity_region("Somewhere") == "camx"
+        assert calculator._determine_electricity_region(None) == "camx"
+
+        # Repeated locations are served from the cache
+        hits = calculator._determine_electricity_region.cache_info().hits
+        assert calculator._determine_electricity_region("Brooklyn, NY") == "nyis"
+        assert calculator._determine_electricity_region.cache_info().hits == hits + 1
+
+    def test_scope2_data_completeness(self, db_session):
+        """Test Scope 2 completeness counts the seven key fields per entry"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        full = ActivityDataInput(
+            activity_type="electricity_consumption",
+            quantity=100.0,
+            unit="kWh",
+            location="Houston, TX",
+            data_source="Utility bills",
+            data_quality="measured",
+            activity_period_start=datetime(2023, 1, 1),
+            activity_period_end=datetime(2023, 1, 31),
+        )
+        minimal = ActivityDataInput(
+            activity_type="electricity_consumption", quantity=100.0, unit="kWh"
+        )
+
+        assert calculator._calculate_data_completeness([full]) == 100.0
+        # 7 + 3 of 14 fields (quantity, unit and the default data quality)
+        assert calculator._calculate_data_completeness(
+            [full, minimal]
+        ) == pytest.approx(10 / 14 * 100)
+        assert calculator._calculate_data_completeness([]) == 0
+
+    def test_scope2_consumption_quality_score(self):
+        """Test Scope 2 quality keywords apply in priority order, once each"""
+
+        def score(**fields):
+            return Scope2EmissionsCalculator._score_consumption_quality(
+                ActivityDataInput(
+                    activity_type="electricity_consumption",
+                    quantity=1.0,
+                    unit="MWh",
+                    data_quality="estimated",
+                    **fields,
+                )
+            )
+
+        assert score() == 70
+        # "utility bill" outranks "estimate" wherever it appears in the text
+        assert score(data_source="Estimated utility bill") == 85
+        assert score(data_source="Sub-meter readings") == 80
+        assert score(data_source="Engineering estimate") == 60
+        assert score(measurement_method="Annual smart meter export") == 85
+        assert score(location="Los Angeles, California") == 80
+
+    def test_convert_electricity_units(self, db_session):
+        """Test electricity conversions, including spelled-out and reverse units"""
+        calculator = Scope2EmissionsCalculator(db_session)
+
+        assert calculator._convert_electricity_units(
+            1500.0, "kilowatt-hour", "MWh"
+        ) == pytest.approx(1.5)
+        # Only (mw, mwh) is listed, so MWh -> MW uses the reverse factor
+        assert calculator._convert_electricity_units(2.0, "MWh", "MW") == 2.0
+        assert calculator._convert_electricity_units(5.0, "kWh", "kg") == 5.0
+
+        Scope2EmissionsCalculator._electricity_conversion_factor.cache_clear()
+        calculator._convert_electricity_units(10.0, "kWh", "MWh")
+        calculator._convert_electricity_units(20.0, "kWh", "MWh")
+        info = Scope2EmissionsCalculator._electricity_conversion_factor.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_scope2_renewable_adjustments(self, db_session):
+        """Test REC, PPA, green tariff and on-site adjustments combine correctly"""
+        calculator = Scope2EmissionsCalculator(db_session)
+
+        def adjust(method, **additional_data):
+            electricity = ActivityDataInput(
+                activity_type="electricity_consumption",
+                quantity=100000.0,
+                unit="kWh",
+                additional_data=additional_data,
+            )
+            return calculator._apply_renewable_adjustments(
+                10.0, 20.0, electricity, method
+            )
+
+        assert adjust("market_based", recs_mwh=25) == pytest.approx((7.5, 15.0))
+        assert adjust("market_based", recs_mwh=500) == (0.0, 0.0)
+        assert adjust(
+            "market_based", recs_mwh=25, green_tariff_percentage=20
+        ) == pytest.approx((6.0, 12.0))
+        # A PPA factor replaces the grid emissions, so RECs no longer apply
+        assert adjust(
+            "market_based",
+            recs_mwh=25,
+            ppa_emission_factor=0.5,
+            green_tariff_percentage=50,
+        ) == pytest.approx((25.0, 25.0))
+        assert adjust("location_based", onsite_renewable_mwh=40) == pytest.approx(
+            (6.0, 12.0)
+        )
+        assert adjust("location_based", recs_mwh=25) == (10.0, 20.0)
+
+    @pytest.mark.asyncio
+    async def test_scope2_factors_prefetched_per_region(self, db_session):
+        """Test Scope 2 loads electricity factors once and picks one per region"""
+        calculator = Scope2EmissionsCalculator(db_session)
+
+        def factor(region, factor_id):
+            return SimpleNamespace(
+                id=factor_id,
+                electricity_region=region,
+                co2_factor=0.2,
+                co2e_factor=0.25,
+                unit="kg CO2e/MWh",
+                source="EPA_EGRID",
+            )
+
+        factors = [
+            factor("nwpp", "f1"),
+            factor("erct", "f2"),
+            factor("camx", "f3"),
+            factor("camx", "f4"),
+        ]
+        regions = [
+            calculator._determine_electricity_region(location)
+            for location in ["Los Angeles, CA", "San Francisco", "Houston, TX", "FL"]
+        ]
+
+        with patch.object(
+            calculator.epa_service,
+            "get_emission_factors",
+            AsyncMock(return_value=factors),
+        ) as get_factors:
+            by_region = await calculator._prefetch_electricity_emission_factors(
+                regions, "location_based"
+            )
+
+        get_factors.assert_awaited_once()
+        assert by_region == {
+            "camx": ElectricityFactor("f3", 0.2, 0.25, "kg CO2e/MWh", "EPA_EGRID"),
+            "erct": ElectricityFactor("f2", 0.2, 0.25, "kg CO2e/MWh", "EPA_EGRID"),
+            "frcc": None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_prefetch_electricity_factors_loads_uncached_regions(
+        self, db_session, test_emission_factors
+    ):
+        """Test regions missing from the cached factor list come from the database"""
+        calculator = Scope2EmissionsCalculator(db_session)
+        erct = SimpleNamespace(
+            id="f1",
+            electricity_region="erct",
+            co2_factor=0.2,
+            co2e_factor=0.25,
+            unit="kg CO2e/MWh",
+            source="EPA_EGRID",
+        )
+
+        # The cached list holds only the region a filtered lookup asked for
+        with (
+            patch.object(
+                calculator.epa_service,
+                "get_emission_factors",
+                AsyncMock(return_value=[erct]),
+            ),
+            patch.object(db_session, "scalars", wraps=db_session.scalars) as scalars,
+        ):
+            by_region = await calculator._prefetch_electricity_emission_factors(
+                ["erct", "camx", "frcc"], "location_based"
+            )
+
+        assert by_region["erct"] == ElectricityFactor(
+            "f1", 0.2, 0.25, "kg CO2e/MWh", "EPA_EGRID"
+        )
+        assert by_region["frcc"] is None
+        camx = db_session.get(EmissionFactor, by_region["camx"].id)
+        assert camx.electricity_region == "camx"
+        assert camx.source == "EPA_EGRID"
+        assert camx.is_current
+        # One query for every missing region
+        scalars.assert_called_once()
+        assert scalars.call_args.args[1] == {"regions": ["camx", "frcc"]}
+
+    def test_factor_row_loaded_once_per_code(self, db_session, test_emission_factors):
+        """Test ranked factors sharing a code are loaded from the database once"""
+        calculator = Scope1EmissionsCalculator(db_session)
+
+        with patch.object(db_session, "scalars", wraps=db_session.scalars) as scalars:
+            first = calculator._get_factor_row("NG_COMB_001")
+            second = calculator._get_factor_row("NG_COMB_001")
+
+        assert first is second
+        assert first.fuel_type == "natural_gas"
+        assert scalars.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_epa_factor_lookup_shared_across_pairs(self, db_session):
+        """Test pairs sharing a fuel type share one EPA cache lookup per source"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        activity_data = [
+            ActivityDataInput(
+                activity_type=activity_type,
+                fuel_type="natural_gas",
+                quantity=100.0,
+                unit="MMBtu",
+            )
+            for activity_type in ("stationary_combustion", "mobile_combustion")
+        ]
+
+        with patch.object(
+            calculator.epa_service, "get_emission_factors", AsyncMock(return_value=[])
+        ) as get_factors:
+            await calculator._prefetch_emission_factors(activity_data)
+
+        # One lookup per source (EPA_GHGRP, EPA_AP42), not per pair
+        assert get_factors.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_factors_loaded_only_for_epa_misses(
+        self, db_session, test_emission_factors, record_statements
+    ):
+        """Test the database fallback runs only for pairs the EPA sources miss"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        epa_factor = SimpleNamespace(
+            factor_code="NG_COMB_001", fuel_type="natural_gas", source="EPA_GHGRP"
+        )
+        activity_data = [
+            ActivityDataInput(
+                activity_type=activity_type,
+                fuel_type="natural_gas",
+                quantity=100.0,
+                unit="MMBtu",
+            )
+            for activity_type in ("stationary_combustion", "mobile_combustion")
+        ]
+
+        with (
+            record_statements() as statements,
+            patch.object(
+                calculator.epa_service,
+                "get_emission_factors",
+                AsyncMock(return_value=[epa_factor]),
+            ),
+            patch.object(
+                calculator,
+                "_query_fallback_factors",
+                wraps=calculator._query_fallback_factors,
+            ) as query_fallback,
+        ):
+            factors = await calculator._prefetch_emission_factors(activity_data)
+
+        # Every pair resolved from EPA, so no fallback query was issued
+        query_fallback.assert_not_called()
+        assert not any("row_number" in s.lower() for s in statements)
+        assert {f.factor_code for f in factors.values()} == {"NG_COMB_001"}
+
+        # A pair the EPA sources miss loads fallbacks for its fuel type only
+        scope1_calculator._fallback_factor_ids.clear()
+        calculator = Scope1EmissionsCalculator(db_session)
+        diesel = ActivityDataInput(
+            activity_type="stationary_combustion",
+            fuel_type="diesel",
+            quantity=100.0,
+            unit="gallons",
+        )
+
+        async def epa_factors(source, category, fuel_type):
+            return [epa_factor] if fuel_type == "natural_gas" else []
+
+        with (
+            patch.object(
+                calculator.epa_service, "get_emission_factors", side_effect=epa_factors
+            ),
+            patch.object(
+                calculator,
+                "_query_fallback_factors",
+                wraps=calculator._query_fallback_factors,
+            ) as query_fallback,
+        ):
+            await calculator._prefetch_emission_factors([activity_data[0], diesel])
+
+        query_fallback.assert_called_once_with({"diesel"})
+
+    @pytest.mark.asyncio
+    async def test_cached_fallback_factors_skip_bulk_query(
+        self, db_session, test_emission_factors
+    ):
+        """Test EPA misses held by the process-wide cache skip the bulk query"""
+        activity_data = [
+            ActivityDataInput(
+                activity_type="stationary_combustion",
+                fuel_type=fuel_type,
+                quantity=100.0,
+                unit="MMBtu",
+            )
+            for fuel_type in ("natural_gas", "diesel")
+        ]
+
+        scope1_calculator._fallback_factor_ids.clear()
+        warm = Scope1EmissionsCalculator(db_session)
+        natural_gas = await warm._fallback_factor_selection(
+            "stationary_combustion", "natural_gas"
+        )
+
+        async def prefetch(activities):
+            calculator = Scope1EmissionsCalculator(db_session)
+            with (
+                patch.object(
+                    calculator.epa_service,
+                    "get_emission_factors",
+                    AsyncMock(return_value=[]),
+                ),
+                patch.object(
+                    calculator,
+                    "_query_fallback_factors",
+                    wraps=calculator._query_fallback_factors,
+                ) as query_fallback,
+            ):
+                factors = await calculator._prefetch_emission_factors(activities)
+            return factors, query_fallback
+
+        # Only the fuel type missing from the cache reaches the bulk query
+        factors, query_fallback = await prefetch(activity_data)
+        query_fallback.assert_called_once_with({"diesel"})
+        assert factors[("stationary_combustion", "natural_gas")] is natural_gas
+
+        # Every miss cached, so no bulk query at all
+        factors, query_fallback = await prefetch(activity_data)
+        query_fallback.assert_not_called()
+        assert factors[("stationary_combustion", "natural_gas")] is natural_gas
+
+    def test_unit_conversion_multi_step(self, db_session):
+        """Test conversions missing from the table are chained through others"""
+        calculator = Scope1EmissionsCalculator(db_session)
+
+        # therm -> MMBtu -> GJ
+        assert calculator._convert_units(10.0, "therm", "GJ") == pytest.approx(1.05506)
+        # tonne -> kg -> lb
+        assert calculator._convert_units(1.0, "tonne", "lb") == pytest.approx(2204.62)
+        # Unrelated units are left unconverted
+        assert calculator._convert_units(5.0, "gallons", "kg") == 5.0
+
+    def test_query_fallback_factors_best_per_fuel(
+        self, db_session, test_emission_factors
+    ):
+        """Test bulk fallback loading returns the preferred factor per fuel type"""
+        for code, source, year in [
+            ("RANKED_DSL_AP42_2024", "EPA_AP42", 2024),
+            ("RANKED_DSL_GHGRP_2021", "EPA_GHGRP", 2021),
+            ("RANKED_DSL_GHGRP_2022", "EPA_GHGRP", 2022),
+        ]:
+            db_session.add(
+                EmissionFactor(
+                    factor_name=f"Ranked diesel {code}",
+                    factor_code=code,
+                    category="fuel",
+                    fuel_type="ranked_diesel",
+                    unit="kg CO2e/gallon",
+                    co2_factor=10.0,
+                    co2e_factor=10.0,
+                    source=source,
+                    publication_year=year,
+                    version=f"{year}.1",
+                    valid_from=datetime(year, 1, 1),
+                    is_current=True,
+                )
+            )
+        db_session.commit()
+
+        calculator = Scope1EmissionsCalculator(db_session)
+        factors = calculator._query_fallback_factors({"ranked_diesel", "natural_gas"})
+
+        assert factors["ranked_diesel"].factor_code == "RANKED_DSL_GHGRP_2022"
+        assert factors["natural_gas"].factor_code == "NG_COMB_001"
+
+    def test_rank_emission_factors_picks_first_best(self, db_session):
+        """Test ranking returns the highest scored factor, first on ties"""
+        calculator = Scope1EmissionsCalculator(db_session)
+        other_fuel = SimpleNamespace(fuel_type="diesel", source="EPA_GHGRP")
+        first_match = SimpleNamespace(fuel_type="natural_gas", source="EPA_AP42")
+        second_match = SimpleNamespace(fuel_type="natural_gas", source="EPA_AP42")
+
+        best = calculator._rank_emission_factors(
+            [other_fuel, first_match, second_match],
+            "stationary_combustion",
+            "natural_gas",
+        )
+
+        assert best is first_match
+        assert (
+            calculator._rank_emission_factors([], "stationary_combustion", None) is None
+        )
+
+    def test_resolve_company_and_entity(self, db_session, test_company, test_entity):
+        """Test company and entity are verified together"""
+        calculator = Scope1EmissionsCalculator(db_session)
+
+        company, entity = calculator._resolve_company_and_entity(
+            str(test_company.id), str(test_entity.id)
+        )
+        assert company.id == test_company.id
+        assert entity.id == test_entity.id
+
+        company, entity = calculator._resolve_company_and_entity(
+            str(test_company.id), None
+        )
+        assert company.id == test_company.id
+        assert entity is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            calculator._resolve_company_and_entity(
+                str(test_company.id), str(uuid.uuid4())
+            )
+        assert exc_info.value.status_code == 400
+        assert "Entity" in exc_info.value.detail
+
+    @pytest.mark.asyncio
+    async def test_missing_company_rejected_before_factor_lookups(
+        self, db_session, test_user
+    ):
+        """Test both scopes reject an unknown company with 400, Scope 1 early"""
+        company_id = str(uuid.uuid4())
+        activity = ActivityDataInput(
+            activity_type="stationary_combustion",
+            fuel_type="natural_gas",
+            quantity=100.0,
+            unit="MMBtu",
+        )
+
+        calculator = Scope1EmissionsCalculator(db_session)
+        with (
+            patch.object(calculator, "_prefetch_emission_factors") as prefetch,
+            pytest.raises(HTTPException) as scope1_error,
+        ):
+            await calculator.calculate_scope1_emissions(
+                Scope1CalculationRequest(
+                    calculation_name="Unknown Company",
+                    company_id=company_id,
+                    reporting_period_start=datetime(2023, 1, 1),
+                    reporting_period_end=datetime(2023, 12, 31),
+                    activity_data=[activity],
+                ),
+                str(test_user.id),
+            )
+        prefetch.assert_not_called()
+
+        with pytest.raises(HTTPException) as scope2_error:
+            await Scope2EmissionsCalculator(db_session).calculate_scope2_emissions(
+                Scope2CalculationRequest(
+                    calculation_name="Unknown Company",
+                    company_id=company_id,
+                    reporting_period_start=datetime(2023, 1, 1),
+                    reporting_period_end=datetime(2023, 12, 31),
+                    electricity_consumption=[
+                        ActivityDataInput(
+                            activity_type="electricity_consumption",
+                            quantity=100.0,
+                            unit="MWh",
+                        )
+                    ],
+                ),
+                str(test_user.id),
+            )
+
+        assert scope1_error.value.status_code == 400
+        assert scope2_error.value.status_code == 400
+        assert f"Company {company_id} not found" in scope1_error.value.detail
+        assert f"Company {company_id} not found" in scope2_error.value.detail
+
     @pytest.mark.asyncio
     async def test_calculation_validation_errors(
         self, db_session, test_company, test_user
@@ -478,7 +1301,24 @@ class TestAuditTrail:
             ],
         )
 
-        result = await calculator.calculate_scope1_emissions(request, str(test_user.id))
+        calculation_logs = db_session.query(AuditLog).filter(
+            AuditLog.event_type == "CALCULATION"
+        )
+        logged_before = calculation_logs.count()
+
+        with (
+            patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+            patch.object(calculator, "_get_user_by_id") as get_user,
+        ):
+            result = await calculator.calculate_scope1_emissions(
+                request, str(test_user.id), user=test_user
+            )
+
+        # Results and both audit records are written in a single commit, and
+        # the user passed in is not looked up again
+        assert commit.call_count == 1
+        get_user.assert_not_called()
+        assert calculation_logs.count() == logged_before + 1
 
         # Verify calculation was created
         calculation = (
@@ -490,6 +1330,7 @@ class TestAuditTrail:
         assert calculation is not None
         assert calculation.calculated_by == test_user.id
         assert calculation.input_data is not None
+        assert calculation.input_data["reporting_period_start"] == "2023-01-01T00:00:00"
         assert calculation.emission_factors_used is not None
 
     @pytest.mark.asyncio
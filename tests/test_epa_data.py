@@ -2,13 +2,19 @@
 Test EPA data management functionality
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.models.epa_data import EmissionFactor
-from app.services.epa_service import EPADataIngestionService
+from app.main import app
+from app.services.epa_service import (
+    EPADataIngestionService,
+    close_http_client,
+    get_http_client,
+)
 
 
 class TestEPADataEndpoints:
@@ -273,3 +279,40 @@ class TestEPADataCaching:
         stats = cache_service.get_cache_stats()
         assert isinstance(stats, dict)
         assert "status" in stats
+
+
+class TestEPAHttpClient:
+    """Test the shared EPA HTTP client lifecycle"""
+
+    def test_http_client_shared_within_event_loop(self, db_session):
+        """Test service instances on one loop share a client until it is closed"""
+
+        async def clients():
+            first = EPADataIngestionService(db_session).http_client
+            second = EPADataIngestionService(db_session).http_client
+            await close_http_client()
+            return first, second
+
+        first, second = asyncio.run(clients())
+        assert first is second
+        assert first.is_closed
+
+    def test_http_client_per_event_loop(self):
+        """Test each event loop gets its own client, not one bound to a closed loop"""
+
+        async def client():
+            return get_http_client()
+
+        first = asyncio.run(client())
+        second = asyncio.run(client())
+        assert first is not second
+
+    def test_http_client_closed_on_shutdown(self):
+        """Test app shutdown closes the client of the serving loop"""
+
+        async def lifespan_client():
+            async with app.router.lifespan_context(app):
+                client = get_http_client()
+            return client
+
+        assert asyncio.run(lifespan_client()).is_closed
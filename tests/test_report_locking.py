@@ -3,16 +3,25 @@ Tests for Report Locking and Collaboration Features
 Tests for report locking, comments, and revision tracking
 """
 
+from datetime import datetime, timedelta
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from sqlalchemy import false
 from sqlalchemy.orm import Session
 
 from app.main import app
 from app.models.report import Comment, Report, ReportLock, Revision
 from app.models.user import User, UserRole
 from app.schemas.report import CommentCreate, LockReportRequest
+from app.services.report_lock_service import (
+    UNLOCKED_STATUS_CACHE_TTL_SECONDS,
+    ReportLockService,
+    active_lock_clause,
+)
 
 
 def test_lock_report_success_auditor(
@@ -175,12 +184,15 @@ def test_unlock_report_success(
     db_session.commit()
     db_session.refresh(lock)
 
-    # Unlock the report
-    response = client.post(
-        f"/v1/reports/{report.id}/unlock",
-        json={},
-        headers={"Authorization": f"Bearer {generate_test_token(test_user)}"},
-    )
+    # Unlock the report, on a fixed UTC clock
+    unlocked_at = datetime(2024, 1, 2, 3, 4, 5)
+    with patch("app.services.report_lock_service.datetime") as clock:
+        clock.utcnow.return_value = unlocked_at
+        response = client.post(
+            f"/v1/reports/{report.id}/unlock",
+            json={},
+            headers={"Authorization": f"Bearer {generate_test_token(test_user)}"},
+        )
 
     assert response.status_code == 200
     unlock_response = response.json()
@@ -194,6 +206,8 @@ def test_unlock_report_success(
 
     db_lock = db_session.query(ReportLock).filter(ReportLock.id == lock.id).first()
     assert db_lock.is_active is False
+    # Stamped with the same naive UTC clock as the other lock timestamps
+    assert db_lock.unlocked_at == unlocked_at
 
 
 def test_unlock_report_unauthorized(
@@ -288,8 +302,6 @@ def test_get_comments_success(client: TestClient, db_session: Session, test_user
     db_session.commit()
     db_session.refresh(report)
 
-    from datetime import datetime
-
     # Add test comments
     now = datetime.utcnow()
     comment1 = Comment(
@@ -326,6 +338,70 @@ def test_get_comments_success(client: TestClient, db_session: Session, test_user
     ]
 
 
+def test_get_comments_returns_nested_replies(
+    client: TestClient, db_session: Session, test_user: User
+):
+    """Test that top-level comments come back with their whole reply thread"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=test_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    now = datetime.utcnow()
+    root = Comment(
+        report_id=report.id,
+        user_id=test_user.id,
+        content="Root comment",
+        created_at=now,
+        updated_at=now,
+    )
+    reply = Comment(
+        report_id=report.id,
+        user_id=test_user.id,
+        parent_id=root.id,
+        content="Reply",
+        created_at=now,
+        updated_at=now,
+    )
+    nested_reply = Comment(
+        report_id=report.id,
+        user_id=test_user.id,
+        parent_id=reply.id,
+        content="Nested reply",
+        created_at=now,
+        updated_at=now,
+    )
+    db_session.add_all([root, reply, nested_reply])
+    db_session.commit()
+
+    headers = {"Authorization": f"Bearer {generate_test_token(test_user)}"}
+    response = client.get(f"/v1/reports/{report.id}/comments", headers=headers)
+
+    assert response.status_code == 200
+    comments = response.json()["comments"]
+    assert [c["content"] for c in comments] == ["Root comment"]
+    assert [c["content"] for c in comments[0]["replies"]] == ["Reply"]
+    assert [c["content"] for c in comments[0]["replies"][0]["replies"]] == [
+        "Nested reply"
+    ]
+
+    response = client.get(
+        f"/v1/reports/{report.id}/comments",
+        params={"parent_id": root.id},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    comments = response.json()["comments"]
+    assert [c["content"] for c in comments] == ["Reply"]
+    assert [c["content"] for c in comments[0]["replies"]] == ["Nested reply"]
+
+
 def test_resolve_comment_success(
     client: TestClient, db_session: Session, test_user: User
 ):
@@ -352,11 +428,14 @@ def test_resolve_comment_success(
     db_session.commit()
     db_session.refresh(comment)
 
-    # Resolve comment
-    response = client.put(
-        f"/v1/reports/{report.id}/comments/{comment.id}/resolve",
-        headers={"Authorization": f"Bearer {generate_test_token(test_user)}"},
-    )
+    # Resolve comment, on a fixed UTC clock
+    resolved_at = datetime(2024, 1, 2, 3, 4, 5)
+    with patch("app.services.report_lock_service.datetime") as clock:
+        clock.utcnow.return_value = resolved_at
+        response = client.put(
+            f"/v1/reports/{report.id}/comments/{comment.id}/resolve",
+            headers={"Authorization": f"Bearer {generate_test_token(test_user)}"},
+        )
 
     assert response.status_code == 200
     resolved_comment = response.json()
@@ -368,6 +447,54 @@ def test_resolve_comment_success(
     db_comment = db_session.query(Comment).filter(Comment.id == comment.id).first()
     assert db_comment.is_resolved is True
     assert db_comment.resolved_by == test_user.id
+    assert db_comment.resolved_at == resolved_at
+
+
+def test_resolve_comment_permissions(
+    client: TestClient,
+    db_session: Session,
+    test_user: User,
+    auditor_user: User,
+    admin_user: User,
+):
+    """Test only the comment author or an admin can resolve a comment"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=test_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    comment = Comment(
+        report_id=report.id,
+        user_id=test_user.id,
+        content="Unresolved comment",
+        comment_type="question",
+    )
+    db_session.add(comment)
+    db_session.commit()
+
+    url = f"/v1/reports/{report.id}/comments/{comment.id}/resolve"
+
+    response = client.put(
+        url, headers={"Authorization": f"Bearer {generate_test_token(auditor_user)}"}
+    )
+    assert response.status_code == 403
+
+    response = client.put(
+        f"/v1/reports/{report.id}/comments/{uuid4()}/resolve",
+        headers={"Authorization": f"Bearer {generate_test_token(admin_user)}"},
+    )
+    assert response.status_code == 404
+
+    response = client.put(
+        url, headers={"Authorization": f"Bearer {generate_test_token(admin_user)}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["resolved_by"] == admin_user.id
 
 
 def test_create_revision_success(
@@ -429,8 +556,6 @@ def test_get_revisions_success(
     db_session.commit()
     db_session.refresh(report)
 
-    from datetime import datetime
-
     # Add test revisions
     now = datetime.utcnow()
     revision1 = Revision(
@@ -476,6 +601,414 @@ def test_get_revisions_success(
     )  # Manual revision 1 or auto-created
 
 
+def test_lock_status_cached_on_lock_and_reset_on_unlock(
+    client: TestClient, db_session: Session, auditor_user: User
+):
+    """Test lock status is written to cache on lock and overwritten on unlock"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+    db_session.refresh(report)
+
+    headers = {"Authorization": f"Bearer {generate_test_token(auditor_user)}"}
+
+    with patch("app.services.report_lock_service.cache_service") as mock_cache:
+        mock_cache.get_report_lock.return_value = None
+
+        response = client.post(
+            f"/v1/reports/{report.id}/lock",
+            json={"lock_reason": "audit", "expires_in_hours": 2},
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+        cache_key, lock_info, ttl_seconds = mock_cache.set_report_lock.call_args[0]
+        assert cache_key == report.id
+        assert lock_info["is_locked"] is True
+        assert lock_info["locked_by"] == auditor_user.id
+        assert 0 < ttl_seconds <= 2 * 3600
+
+        # A cached entry is served without touching the database
+        mock_cache.get_report_lock.return_value = lock_info
+        response = client.get(f"/v1/reports/{report.id}/lock-status")
+        assert response.status_code == 200
+        assert response.json()["is_locked"] is True
+        assert response.json()["locked_by"] == auditor_user.id
+
+        response = client.post(
+            f"/v1/reports/{report.id}/unlock", json={}, headers=headers
+        )
+        assert response.status_code == 200
+        mock_cache.set_report_lock.assert_called_with(
+            report.id, {"is_locked": False}, UNLOCKED_STATUS_CACHE_TTL_SECONDS
+        )
+
+
+def test_unlocked_status_does_not_overwrite_newer_lock(
+    db_session: Session, auditor_user: User
+):
+    """Test a reader's "not locked" answer never replaces a lock cached since"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    reader = ReportLockService(db_session)
+    read_active_lock = reader._get_active_lock
+
+    def read_then_lock_concurrently(report_id):
+        # The reader sees no lock, then another request locks the report and
+        # caches it before the reader writes its answer
+        lock = read_active_lock(report_id)
+        ReportLockService(db_session).lock_report(report.id, auditor_user, "audit")
+        return lock
+
+    with (
+        patch("app.services.report_lock_service.cache_service", FakeLockCache()),
+        patch.object(
+            reader, "_get_active_lock", side_effect=read_then_lock_concurrently
+        ),
+    ):
+        assert reader.get_lock_status(report.id) is None
+
+        lock_info = ReportLockService(db_session).get_lock_status(report.id)
+        assert lock_info is not None
+        assert lock_info.is_locked is True
+
+
+def test_locked_status_does_not_overwrite_newer_unlock(
+    db_session: Session, auditor_user: User
+):
+    """Test a reader's "locked" answer never replaces an unlock cached since"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    cache = FakeLockCache()
+    with patch("app.services.report_lock_service.cache_service", cache):
+        ReportLockService(db_session).lock_report(report.id, auditor_user, "audit")
+        cache.entries.clear()
+
+        reader = ReportLockService(db_session)
+        read_active_lock = reader._get_active_lock
+
+        def read_then_unlock_concurrently(report_id):
+            # The reader loads the lock, then another request releases it
+            # before the reader caches its answer
+            lock = read_active_lock(report_id)
+            ReportLockService(db_session).unlock_report(report.id, auditor_user)
+            return lock
+
+        with patch.object(
+            reader, "_get_active_lock", side_effect=read_then_unlock_concurrently
+        ):
+            assert reader.get_lock_status(report.id).is_locked is True
+
+        assert ReportLockService(db_session).get_lock_status(report.id) is None
+
+
+def test_get_revisions_keyset_pagination(
+    client: TestClient, db_session: Session, test_user: User
+):
+    """Test paging through revision history with a revision_number cursor"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=test_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    ReportLockService(db_session).bulk_create_revisions(
+        [
+            {
+                "report_id": report.id,
+                "version": "1.0",
+                "revision_number": number,
+                "changed_by": test_user.id,
+                "change_type": "update",
+            }
+            for number in range(2, 6)
+        ]
+    )
+
+    headers = {"Authorization": f"Bearer {generate_test_token(test_user)}"}
+    url = f"/v1/reports/{report.id}/revisions"
+
+    response = client.get(url, params={"limit": 2}, headers=headers)
+    assert response.status_code == 200
+    page = [r["revision_number"] for r in response.json()["revisions"]]
+    assert page == [5, 4]
+
+    response = client.get(
+        url, params={"limit": 2, "before_revision": page[-1]}, headers=headers
+    )
+    assert [r["revision_number"] for r in response.json()["revisions"]] == [3, 2]
+
+
+def test_get_report_locks_history(
+    client: TestClient, db_session: Session, test_user: User
+):
+    """Test the lock history endpoint lists every lock of a report"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=test_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    db_session.add_all(
+        [
+            ReportLock(
+                report_id=report.id,
+                locked_by=test_user.id,
+                lock_reason=reason,
+                is_active=False,
+            )
+            for reason in ("audit", "review")
+        ]
+    )
+    db_session.commit()
+
+    response = client.get(
+        f"/v1/reports/{report.id}/locks",
+        headers={"Authorization": f"Bearer {generate_test_token(test_user)}"},
+    )
+
+    assert response.status_code == 200
+    locks = response.json()
+    assert sorted(lock["lock_reason"] for lock in locks) == ["audit", "review"]
+    assert all(lock["report_id"] == report.id for lock in locks)
+    assert all(lock["locked_by_name"] == test_user.full_name for lock in locks)
+
+
+def test_expired_lock_does_not_block_locking(
+    client: TestClient, db_session: Session, auditor_user: User
+):
+    """Test that a lapsed lock is ignored and retired when relocking"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    stale_lock = ReportLock(
+        report_id=report.id,
+        locked_by=str(uuid4()),
+        lock_reason="audit",
+        expires_at=datetime.utcnow() - timedelta(hours=1),
+        is_active=True,
+    )
+    db_session.add(stale_lock)
+    db_session.commit()
+
+    assert report.is_locked is False
+    assert ReportLockService(db_session).get_lock_status(report.id) is None
+
+    response = client.post(
+        f"/v1/reports/{report.id}/lock",
+        json={"lock_reason": "audit", "expires_in_hours": 1},
+        headers={"Authorization": f"Bearer {generate_test_token(auditor_user)}"},
+    )
+    assert response.status_code == 200
+
+    db_session.expire_all()
+    assert db_session.get(ReportLock, stale_lock.id).is_active is False
+    assert db_session.get(ReportLock, response.json()["id"]).is_active is True
+
+
+def test_lock_report_missing_or_already_locked(
+    client: TestClient, db_session: Session, auditor_user: User
+):
+    """Test locking a missing report 404s and a locked report 409s"""
+    headers = {"Authorization": f"Bearer {generate_test_token(auditor_user)}"}
+    lock_data = {"lock_reason": "audit", "expires_in_hours": 1}
+
+    response = client.post(
+        f"/v1/reports/{uuid4()}/lock", json=lock_data, headers=headers
+    )
+    assert response.status_code == 404
+
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    response = client.post(
+        f"/v1/reports/{report.id}/lock", json=lock_data, headers=headers
+    )
+    assert response.status_code == 200
+
+    response = client.post(
+        f"/v1/reports/{report.id}/lock", json=lock_data, headers=headers
+    )
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Report is already locked"
+    assert (
+        db_session.query(ReportLock).filter(ReportLock.report_id == report.id).count()
+        == 1
+    )
+
+
+def test_concurrent_lock_rejected_by_unique_index(
+    db_session: Session, auditor_user: User
+):
+    """Test a lock that slips past the NOT EXISTS check still 409s"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    ReportLockService(db_session).lock_report(report.id, auditor_user, "audit")
+
+    # A concurrent transaction would not see the first lock yet
+    with (
+        patch(
+            "app.services.report_lock_service.active_lock_clause", return_value=false()
+        ),
+        pytest.raises(HTTPException) as exc_info,
+    ):
+        ReportLockService(db_session).lock_report(report.id, auditor_user, "review")
+
+    assert exc_info.value.status_code == 409
+    assert (
+        db_session.query(ReportLock)
+        .filter(ReportLock.report_id == report.id, ReportLock.is_active.is_(True))
+        .count()
+        == 1
+    )
+
+
+def test_lock_timestamps_share_utc_clock(db_session: Session, auditor_user: User):
+    """Test locked_at and expires_at come from the same naive UTC reading"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=auditor_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    locked_at = datetime(2024, 1, 2, 3, 4, 5)
+    with patch("app.services.report_lock_service.datetime") as clock:
+        clock.utcnow.return_value = locked_at
+        lock = ReportLockService(db_session).lock_report(
+            report.id, auditor_user, "audit", expires_in_hours=2
+        )
+
+    assert lock.locked_at == locked_at
+    assert lock.expires_at == locked_at + timedelta(hours=2)
+
+
+def test_active_lock_clause_binds_utc_now():
+    """Test lock expiry is compared with a bound UTC time, not the DB clock"""
+    compiled = active_lock_clause().compile()
+    assert "now" not in str(compiled).lower()
+
+    bound = [v for v in compiled.params.values() if isinstance(v, datetime)]
+    assert len(bound) == 1
+    assert abs((datetime.utcnow() - bound[0]).total_seconds()) < 5
+
+
+def test_bulk_add_comments_and_revisions(db_session: Session, test_user: User):
+    """Test batched history inserts for comments and revisions"""
+    report = Report(
+        title="Test Report",
+        report_type="sec_10k",
+        status="draft",
+        version="1.0",
+        created_by=test_user.id,
+    )
+    db_session.add(report)
+    db_session.commit()
+
+    service = ReportLockService(db_session)
+
+    inserted = service.bulk_add_comments(
+        [
+            {"report_id": report.id, "user_id": test_user.id, "content": f"c{i}"}
+            for i in range(5)
+        ]
+    )
+    assert inserted == 5
+    comments = db_session.query(Comment).filter(Comment.report_id == report.id)
+    assert comments.count() == 5
+    assert all(comment.created_at is not None for comment in comments)
+
+    inserted = service.bulk_create_revisions(
+        [
+            {
+                "report_id": report.id,
+                "version": "1.0",
+                "revision_number": number,
+                "changed_by": test_user.id,
+                "change_type": "update",
+            }
+            for number in range(2, 5)
+        ]
+    )
+    assert inserted == 3
+    assert (
+        db_session.query(Revision).filter(Revision.report_id == report.id).count() == 4
+    )
+
+    assert service.bulk_add_comments([]) == 0
+
+
+class FakeLockCache:
+    """In-memory stand-in for the report lock entries of cache_service"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get_report_lock(self, report_id):
+        return self.entries.get(report_id)
+
+    def set_report_lock(self, report_id, lock_info, ttl, only_if_absent=False):
+        if only_if_absent and report_id in self.entries:
+            return False
+        self.entries[report_id] = lock_info
+        return True
+
+
 def generate_test_token(user: User) -> str:
     """Generate a test JWT token for the user"""
     from app.core.security import JWTManager